@@ -1,56 +1,72 @@
 import itertools
 import contextlib
+import heapq
 import time
+import threading
 import os
+import multiprocessing
 import random
+import re
+import sys
+import tracemalloc
 import csv
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from io import StringIO
+from operator import attrgetter
 
 # Case Study 1: Log File Analysis System
-print("\n1. Log File Analysis System")
 
 
 # First, let's create a simulated large log file
+LOG_LEVELS = ["INFO", "WARNING", "ERROR", "DEBUG"]
+SERVICES = ["web", "api", "db", "auth", "cache"]
+MESSAGES = [
+    "Request processed successfully",
+    "Connection timeout",
+    "Authentication failed",
+    "Database query executed",
+    "Cache miss",
+    "Rate limit exceeded",
+    "Invalid request parameters",
+    "Session expired",
+    "New user registered",
+    "Payment processed"
+]
+
+def random_log_line(timestamp):
+    """Format one random log line with the given timestamp"""
+    level = random.choice(LOG_LEVELS)
+    service = random.choice(SERVICES)
+    message = random.choice(MESSAGES)
+    ip = f"192.168.1.{random.randint(1, 255)}"
+    user_id = f"user_{random.randint(1, 20)}" if random.random() > 0.3 else "-"
+    return f"{timestamp} [{level}] {service}: {message} (IP: {ip}, User: {user_id})\n"
+
 def generate_log_file(filename, entries=100):
     """Generate a sample log file for demonstration"""
-    log_levels = ["INFO", "WARNING", "ERROR", "DEBUG"]
-    services = ["web", "api", "db", "auth", "cache"]
-    messages = [
-        "Request processed successfully",
-        "Connection timeout",
-        "Authentication failed",
-        "Database query executed",
-        "Cache miss",
-        "Rate limit exceeded",
-        "Invalid request parameters",
-        "Session expired",
-        "New user registered",
-        "Payment processed"
-    ]
-    
     with open(filename, 'w') as f:
         for i in range(entries):
             timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time() - random.randint(0, 86400)))
-            level = random.choice(log_levels)
-            service = random.choice(services)
-            message = random.choice(messages)
-            ip = f"192.168.1.{random.randint(1, 255)}"
-            user_id = f"user_{random.randint(1, 20)}" if random.random() > 0.3 else "-"
-            f.write(f"{timestamp} [{level}] {service}: {message} (IP: {ip}, User: {user_id})\n")
-
-# Create our log file
-log_filename = "sample_logs.txt"
-generate_log_file(log_filename, entries=1000)
-print(f"Generated sample log file: {log_filename} with 1000 entries")
+            f.write(random_log_line(timestamp))
 
 # Now let's build our log analysis pipeline
 class LogEntry:
-    """Represents a parsed log entry"""
+    """Represents a parsed log entry
+    
+    __slots__ stores the six fields in a fixed-size record instead of a
+    per-instance __dict__. level and service come from a tiny vocabulary,
+    so they are interned: every entry shares one string object per distinct
+    value instead of holding its own copies, and equality checks in
+    filter_logs hit the identity fast path.
+    """
+    
+    __slots__ = ("timestamp", "level", "service", "message", "ip", "user_id")
     
     def __init__(self, timestamp, level, service, message, ip, user_id):
         self.timestamp = timestamp
-        self.level = level
-        self.service = service
+        self.level = sys.intern(level)
+        self.service = sys.intern(service)
         self.message = message
         self.ip = ip
         self.user_id = user_id
@@ -60,11 +76,11 @@ class LogEntry:
 
 # Step 1: Log File Reader (Context Manager & Generator)
 @contextlib.contextmanager
-def log_reader(filename):
-    """Context manager for reading log files"""
+def log_reader(filename, mode='r'):
+    """Context manager for reading log files (mode='rb' for the bytes parser)"""
     print(f"Opening log file: {filename}")
     try:
-        file = open(filename, 'r')
+        file = open(filename, mode)
         yield file
     finally:
         file.close()
@@ -91,13 +107,59 @@ def parse_log_lines(log_file):
             
             # Parse metadata
             metadata = line[metadata_start+1:].strip(')\n')
-            ip = metadata.split('User:')[0].replace('IP:', '').strip()
+            ip = metadata.split('User:')[0].replace('IP:', '').strip().rstrip(',')
             user_id = metadata.split('User:')[1].strip()
             
             yield LogEntry(timestamp, level, service, message, ip, user_id)
         except Exception as e:
             print(f"Error parsing line {line_num}: {line.strip()} - {str(e)}")
 
+# Step 2b: Fast Line Parser (one precompiled pattern, text or bytes)
+# The same format as above, matched in one regex call instead of a chain of
+# find/rfind/split/strip calls
+LOG_LINE = re.compile(r"(.{19}) \[([^\]]*)\] ([^:]*): (.*) \(IP: ([^,]*), User: ([^)]*)\)")
+
+def parse_log_lines_fast(log_file, level=None, service=None):
+    """Generator that parses log lines with a precompiled pattern
+    
+    Works on text files and on files opened in binary mode. The level and
+    service filters run before a LogEntry is built: lines without the
+    "[LEVEL]" or "] service:" marker are dropped with a substring test before
+    the regex runs, and in binary mode only the lines that pass are decoded
+    (one decode per line is cheaper than decoding each field). Dropped lines
+    are not checked for parse errors.
+    """
+    lines = iter(log_file)
+    first = next(lines, None)
+    if first is None:
+        return
+    binary = isinstance(first, bytes)
+    
+    markers = []
+    if level is not None:
+        markers.append(f"[{level}]")
+    if service is not None:
+        markers.append(f"] {service}:")
+    if binary:
+        markers = [marker.encode() for marker in markers]
+    match = LOG_LINE.match
+    
+    for line_num, line in enumerate(itertools.chain([first], lines), 1):
+        if markers and any(marker not in line for marker in markers):
+            continue
+        if binary:
+            line = line.decode(errors="replace")
+        parsed = match(line)
+        if parsed is None:
+            print(f"Error parsing line {line_num}: {line.strip()}")
+            continue
+        fields = parsed.groups()
+        # The markers could also occur inside a message, so check the fields
+        if (level is not None and fields[1] != level) or \
+           (service is not None and fields[2] != service):
+            continue
+        yield LogEntry(*fields)
+
 # Step 3: Filtering (Generator)
 def filter_logs(log_entries, level=None, service=None):
     """Filter log entries by level and/or service"""
@@ -106,36 +168,147 @@ def filter_logs(log_entries, level=None, service=None):
            (service is None or entry.service == service):
             yield entry
 
-# Step 4: Analysis (Itertools & Generator)
-def analyze_logs(log_entries):
-    """Generate analysis metrics from log entries"""
-    # Make copies of the iterator for different analyses
-    entries1, entries2, entries3 = itertools.tee(log_entries, 3)
+# Step 4: Analysis (single-pass, mergeable aggregates)
+# Every aggregate sees each entry once, so the entries never need to be buffered
+# (itertools.tee would keep every entry queued until the slowest copy catches up).
+# Aggregates built over separate parts of a log can be merged into one.
+class CountBy:
+    """Counts entries per key, using memory proportional to the distinct keys"""
     
-    # Count by level
-    level_counts = {}
-    for entry in entries1:
-        level_counts[entry.level] = level_counts.get(entry.level, 0) + 1
+    def __init__(self, key):
+        self.key = key
+        self.counts = {}
     
-    # Count by service
-    service_counts = {}
-    for entry in entries2:
-        service_counts[entry.service] = service_counts.get(entry.service, 0) + 1
+    def update(self, entry):
+        key = self.key(entry)
+        if key is not None:
+            self.counts[key] = self.counts.get(key, 0) + 1
     
-    # Find most active users
-    user_counts = {}
-    for entry in entries3:
-        if entry.user_id != "-":
-            user_counts[entry.user_id] = user_counts.get(entry.user_id, 0) + 1
+    def merge(self, other):
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        return self
     
-    # Sort user counts to find most active
-    top_users = sorted(user_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+    def result(self):
+        return self.counts
+
+class TopN:
+    """Keeps the n most frequent keys
     
-    return {
-        "level_counts": level_counts,
-        "service_counts": service_counts,
-        "top_users": top_users
-    }
+    Without a capacity every key is counted exactly and the top n are picked
+    with a heap instead of sorting all keys. With a capacity it becomes a
+    Space-Saving sketch: only `capacity` counters are kept, and a new key
+    replaces the smallest one and inherits its count, so memory is bounded
+    and any key seen more than total/capacity times is guaranteed to stay.
+    The smallest counter is found with a min-heap instead of a scan.
+    """
+    
+    def __init__(self, key, n=5, capacity=None):
+        self.key = key
+        self.n = n
+        self.capacity = capacity
+        self.counts = {}
+        # (count, order, key) per counter; counts only grow, so entries go
+        # stale instead of being updated and are refreshed on reaching the top
+        self.heap = []
+        self.order = 0
+    
+    def update(self, entry):
+        key = self.key(entry)
+        if key is None:
+            return
+        counts = self.counts
+        if key in counts:
+            counts[key] += 1
+        elif self.capacity is None:
+            counts[key] = 1
+        else:
+            count = self.evict() + 1 if len(counts) >= self.capacity else 1
+            counts[key] = count
+            self.order += 1
+            heapq.heappush(self.heap, (count, self.order, key))
+    
+    def evict(self):
+        """Drop the smallest counter and return its count"""
+        heap, counts = self.heap, self.counts
+        while True:
+            count, order, key = heap[0]
+            current = counts.get(key)
+            if current == count:
+                heapq.heappop(heap)
+                del counts[key]
+                return count
+            if current is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (current, order, key))
+    
+    def merge(self, other):
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        if self.capacity is not None:
+            if len(self.counts) > self.capacity:
+                # Keep the largest counters; counts stay upper bounds of the true ones
+                self.counts = dict(heapq.nlargest(self.capacity, self.counts.items(),
+                                                  key=lambda item: item[1]))
+            self.heap = [(count, order, key)
+                         for order, (key, count) in enumerate(self.counts.items())]
+            heapq.heapify(self.heap)
+            self.order = len(self.heap)
+        return self
+    
+    def result(self):
+        # Same order as sorted(..., reverse=True)[:n], ties keep first-seen order
+        return heapq.nlargest(self.n, self.counts.items(), key=lambda item: item[1])
+
+def known_user(entry):
+    """Key function for user counts; anonymous entries ("-") are skipped"""
+    return entry.user_id if entry.user_id != "-" else None
+
+class LogAnalyzer:
+    """Updates every registered aggregate from a single pass over the entries"""
+    
+    def __init__(self):
+        self.aggregates = {}
+    
+    def register(self, name, aggregate):
+        """Add an aggregate: any object with update(entry), merge(other) and result()"""
+        self.aggregates[name] = aggregate
+        return self
+    
+    def update(self, entry):
+        for aggregate in self.aggregates.values():
+            aggregate.update(entry)
+    
+    def consume(self, log_entries):
+        # Bind the update methods once instead of looking them up per entry
+        updates = [aggregate.update for aggregate in self.aggregates.values()]
+        for entry in log_entries:
+            for update in updates:
+                update(entry)
+        return self
+    
+    def merge(self, other):
+        """Fold in an analyzer with the same aggregates built over other entries"""
+        for name, aggregate in self.aggregates.items():
+            aggregate.merge(other.aggregates[name])
+        return self
+    
+    def results(self):
+        return {name: aggregate.result() for name, aggregate in self.aggregates.items()}
+
+def default_analyzer(top_users=5, user_capacity=None):
+    """The aggregates behind the standard report"""
+    return (LogAnalyzer()
+            .register("level_counts", CountBy(attrgetter("level")))
+            .register("service_counts", CountBy(attrgetter("service")))
+            .register("top_users", TopN(known_user, n=top_users, capacity=user_capacity)))
+
+def analyze_logs(log_entries, analyzer=None):
+    """Generate analysis metrics from log entries in a single pass"""
+    if analyzer is None:
+        analyzer = default_analyzer()
+    return analyzer.consume(log_entries).results()
 
 # Step 5: Reporting (Context Manager)
 @contextlib.contextmanager
@@ -149,17 +322,266 @@ def report_writer(filename):
         file.close()
         print(f"Closed report file: {filename}")
 
+# Step 6: Parallel Analysis (shards in a process pool)
+def split_log(filename, shard_bytes):
+    """Split a log file into (filename, start, end) byte ranges on line boundaries"""
+    size = os.path.getsize(filename)
+    bounds = [0]
+    with open(filename, 'rb') as f:
+        for target in range(shard_bytes, size, shard_bytes):
+            if target <= bounds[-1]:
+                continue  # the previous line was longer than a whole shard
+            # Finish the line that contains byte target - 1; the next one starts a shard
+            f.seek(target - 1)
+            f.readline()
+            if f.tell() < size:
+                bounds.append(f.tell())
+    bounds.append(size)
+    return [(filename, start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+def read_range(log_file, start, end):
+    """Generator over the lines of a binary file between two line-aligned offsets"""
+    log_file.seek(start)
+    position = start
+    for line in log_file:
+        if position >= end:
+            break
+        position += len(line)
+        yield line
+
+def analyze_shard(shard, filter_level=None, filter_service=None):
+    """Worker: parse and aggregate one byte range, returning the partial aggregates"""
+    filename, start, end = shard
+    with open(filename, 'rb') as f:
+        entries = parse_log_lines_fast(read_range(f, start, end),
+                                       level=filter_level, service=filter_service)
+        return default_analyzer().consume(entries)
+
+def analyze_logs_parallel(filenames, filter_level=None, filter_service=None,
+                          workers=None, shards_per_worker=4):
+    """Analyze one large log or a list of rotated logs across processes
+    
+    Every file is cut into line-aligned shards, a few per worker so that
+    uneven shards still keep all processes busy. Workers only send back
+    their small aggregates, which are merged in shard order: counts are
+    identical to a serial run and ties in the top users keep the same
+    first-seen order, so the report does not change.
+    """
+    if isinstance(filenames, str):
+        filenames = [filenames]
+    workers = workers or os.cpu_count() or 1
+    total_bytes = sum(os.path.getsize(filename) for filename in filenames)
+    shard_bytes = max(total_bytes // (workers * shards_per_worker), 1)
+    shards = [shard for filename in filenames for shard in split_log(filename, shard_bytes)]
+    
+    # Forked workers start instantly and don't re-run this script's top-level demo
+    # code; platforms without fork fall back to their default start method
+    fork = "fork" in multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork") if fork else None
+    merged = default_analyzer()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        for partial in pool.map(analyze_shard, shards,
+                                itertools.repeat(filter_level),
+                                itertools.repeat(filter_service)):
+            merged.merge(partial)
+    return merged.results()
+
+# Step 7: Follow Mode (tailing a live log)
+def follow(filename, poll_interval=0.5, stop=None, from_end=True):
+    """Generator that yields complete lines appended to a growing log, like tail -F
+    
+    Starts at the current end of the file (or at its beginning with
+    from_end=False). When the file is rotated (the path
+    now points to a new inode) or truncated, the rest of the old file is read
+    first and then following restarts at the beginning of the new file. A
+    partial last line is held back until its newline arrives. stop is an
+    optional callable checked whenever there is no new data; once it returns
+    True the lines written so far are still read before the generator ends.
+    """
+    def reopen():
+        log_file = open(filename, 'rb')
+        return log_file, os.fstat(log_file.fileno()).st_ino
+    
+    log_file, inode = reopen()
+    if from_end:
+        log_file.seek(0, os.SEEK_END)
+    pending = b""
+    stopping = False
+    try:
+        while True:
+            line = log_file.readline()
+            if line.endswith(b"\n"):
+                yield pending + line
+                pending = b""
+                continue
+            pending += line
+            if line:
+                continue
+            
+            # No new data: check for rotation or truncation before waiting
+            try:
+                current = os.stat(filename)
+            except FileNotFoundError:
+                current = None  # rotated away, the new file is not there yet
+            if current is not None and (current.st_ino != inode or
+                                        current.st_size < log_file.tell()):
+                if pending:
+                    yield pending  # the old file ended without a newline
+                    pending = b""
+                log_file.close()
+                log_file, inode = reopen()
+                continue
+            if stopping:
+                return
+            if stop is not None and stop():
+                stopping = True  # one more pass for lines written before the stop
+                continue
+            time.sleep(poll_interval)
+    finally:
+        log_file.close()
+
+class WindowedAnalyzer:
+    """Aggregates entries into tumbling or sliding windows of LogEntry.timestamp
+    
+    Time is cut into panes of `slide` seconds, each with its own LogAnalyzer;
+    a window is the merge of the window/slide panes it covers (slide equal
+    to window gives tumbling windows). A window is reported once the newest
+    timestamp minus `lateness` passes its end, and panes no open window needs
+    are dropped, so memory stays bounded by the panes in flight. A late entry
+    still counts in the windows that are open; windows already reported are
+    not revised, and entries that no open window covers only count in `late`.
+    """
+    
+    def __init__(self, window=60, slide=None, lateness=0, make_analyzer=default_analyzer):
+        self.slide = slide or window
+        if window % self.slide:
+            raise ValueError("window must be a multiple of slide")
+        self.window = window
+        self.panes_per_window = window // self.slide
+        self.lateness = lateness
+        self.make_analyzer = make_analyzer
+        self.panes = {}
+        self.newest = None
+        self.next_end = None  # pane that ends the first window not yet reported
+        self.late = 0
+    
+    def add(self, entry):
+        """Add an entry and return the snapshots of the windows it closed"""
+        seconds = datetime.fromisoformat(entry.timestamp).timestamp()
+        pane = int(seconds // self.slide)
+        if self.next_end is None:
+            # Entries up to `lateness` seconds older than the first may still arrive
+            self.next_end = int((seconds - self.lateness) // self.slide)
+        if pane <= self.next_end - self.panes_per_window:
+            self.late += 1
+            return []
+        
+        if pane not in self.panes:
+            self.panes[pane] = self.make_analyzer()
+        self.panes[pane].update(entry)
+        self.newest = seconds if self.newest is None else max(self.newest, seconds)
+        return self._close(int((self.newest - self.lateness) // self.slide))
+    
+    def flush(self):
+        """Report every window that still holds entries, e.g. at shutdown"""
+        if not self.panes:
+            return []
+        return self._close(max(self.panes) + self.panes_per_window)
+    
+    def _close(self, until):
+        """Report the windows that end before pane `until` and drop unused panes"""
+        snapshots = []
+        if self.panes:
+            # Past the newest pane plus one window length every window is empty
+            last = min(until, max(self.panes) + self.panes_per_window)
+            for end in range(self.next_end, last):
+                members = [self.panes[p] for p in range(end - self.panes_per_window + 1, end + 1)
+                           if p in self.panes]
+                if members:
+                    snapshots.append(self._snapshot(end, members))
+        self.next_end = max(self.next_end, until)
+        for pane in [p for p in self.panes if p <= self.next_end - self.panes_per_window]:
+            del self.panes[pane]
+        return snapshots
+    
+    def _snapshot(self, end, members):
+        merged = self.make_analyzer()
+        for analyzer in members:
+            merged.merge(analyzer)
+        start = (end - self.panes_per_window + 1) * self.slide
+        return {
+            "window_start": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(start)),
+            "window_end": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(start + self.window)),
+            **merged.results()
+        }
+
+def follow_log_file(log_file, report_file, window=60, slide=None, lateness=5,
+                    filter_level=None, filter_service=None, poll_interval=0.5, stop=None,
+                    from_end=True):
+    """Live pipeline: follow -> parse -> window -> append a report section per window"""
+    windows = WindowedAnalyzer(window, slide, lateness)
+    totals = default_analyzer()  # running totals since following started
+    
+    with report_writer(report_file) as report:
+        def emit(snapshot):
+            report.write(f"Window {snapshot['window_start']} - {snapshot['window_end']}\n")
+            report.write("=" * 47 + "\n")
+            write_metrics(report, snapshot)
+            report.write("\n")
+            report.flush()  # dashboards read the report while it grows
+            print(f"[{snapshot['window_start']} - {snapshot['window_end'][11:]}] "
+                  f"{sum(snapshot['level_counts'].values())} entries, "
+                  f"top user: {snapshot['top_users'][:1]}")
+        
+        lines = follow(log_file, poll_interval, stop, from_end)
+        for entry in parse_log_lines_fast(lines, level=filter_level, service=filter_service):
+            totals.update(entry)
+            for snapshot in windows.add(entry):
+                emit(snapshot)
+        for snapshot in windows.flush():
+            emit(snapshot)
+    
+    if windows.late:
+        print(f"Dropped {windows.late} entries that arrived after their window closed")
+    return totals.results()
+
 # Bringing it all together
-def analyze_log_file(log_file, report_file, filter_level=None, filter_service=None):
-    """Complete log analysis pipeline"""
+def write_metrics(report, metrics):
+    """Write the level, service and user sections of a report"""
+    report.write("Level Distribution:\n")
+    for level, count in metrics["level_counts"].items():
+        report.write(f"- {level}: {count}\n")
+    
+    report.write("\nService Distribution:\n")
+    for service, count in metrics["service_counts"].items():
+        report.write(f"- {service}: {count}\n")
+    
+    report.write("\nMost Active Users:\n")
+    for user, count in metrics["top_users"]:
+        report.write(f"- {user}: {count} entries\n")
+
+def analyze_log_file(log_file, report_file, filter_level=None, filter_service=None,
+                     fast=False, workers=None):
+    """Complete log analysis pipeline
+    
+    fast=True reads bytes with the regex parser. With workers, or when
+    log_file is a list of rotated files, the logs are analyzed in parallel
+    by analyze_logs_parallel; the report is the same either way.
+    """
+    parallel = workers is not None or not isinstance(log_file, str)
     with contextlib.ExitStack() as stack:
-        # Setup both file handlers
-        logs = stack.enter_context(log_reader(log_file))
+        # Setup both file handlers (parallel workers open their own shards)
+        if not parallel:
+            logs = stack.enter_context(log_reader(log_file, 'rb' if fast else 'r'))
         report = stack.enter_context(report_writer(report_file))
         
-        # Create the pipeline
-        parsed_logs = parse_log_lines(logs)
-        filtered_logs = filter_logs(parsed_logs, level=filter_level, service=filter_service)
+        # Create the pipeline (parallel workers build one per shard)
+        if fast and not parallel:
+            # The filters run inside the parser, before any field is decoded
+            filtered_logs = parse_log_lines_fast(logs, level=filter_level, service=filter_service)
+        elif not parallel:
+            parsed_logs = parse_log_lines(logs)
+            filtered_logs = filter_logs(parsed_logs, level=filter_level, service=filter_service)
         
         # Start timing
         start_time = time.time()
@@ -180,20 +602,13 @@ def analyze_log_file(log_file, report_file, filter_level=None, filter_service=No
         print("Processing log entries...")
         
         # Calculate metrics
-        metrics = analyze_logs(filtered_logs)
+        if parallel:
+            metrics = analyze_logs_parallel(log_file, filter_level, filter_service, workers)
+        else:
+            metrics = analyze_logs(filtered_logs)
         
         # Write metrics to report
-        report.write("Level Distribution:\n")
-        for level, count in metrics["level_counts"].items():
-            report.write(f"- {level}: {count}\n")
-        
-        report.write("\nService Distribution:\n")
-        for service, count in metrics["service_counts"].items():
-            report.write(f"- {service}: {count}\n")
-        
-        report.write("\nMost Active Users:\n")
-        for user, count in metrics["top_users"]:
-            report.write(f"- {user}: {count} entries\n")
+        write_metrics(report, metrics)
         
         # End timing
         end_time = time.time()
@@ -201,20 +616,72 @@ def analyze_log_file(log_file, report_file, filter_level=None, filter_service=No
         
         print(f"Analysis completed in {end_time - start_time:.2f} seconds")
 
-# Run the analysis
-print("\nRunning log analysis pipeline...")
-analyze_log_file(log_filename, "log_report.txt", filter_level="ERROR")
+# Memory held per parsed entry, e.g. when keeping entries for windowed analysis
+def entry_memory(filename, limit=100_000):
+    """Average traced bytes per LogEntry kept in a list, strings included"""
+    with open(filename, 'r') as f:
+        tracemalloc.start()
+        entries = list(itertools.islice(parse_log_lines_fast(f), limit))
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    return size / len(entries)
+
+# Parser benchmark: run the script with --benchmark for the full 1M-line log
+def benchmark_parsers(lines):
+    """Compare the find/split parser with the regex parser on a generated log"""
+    filename = "benchmark_logs.txt"
+    generate_log_file(filename, entries=lines)
+    
+    def only_errors(log_file):
+        return filter_logs(parse_log_lines(log_file), level="ERROR")
+    
+    def only_errors_fast(log_file):
+        return parse_log_lines_fast(log_file, level="ERROR")
+    
+    # (name, file mode, parser, case it is compared with)
+    cases = [
+        ("find/split parser", 'r', parse_log_lines, None),
+        ("regex parser, text", 'r', parse_log_lines_fast, "find/split parser"),
+        ("regex parser, bytes", 'rb', parse_log_lines_fast, "find/split parser"),
+        ("find/split parser + ERROR filter", 'r', only_errors, None),
+        ("regex parser, bytes, ERROR in parser", 'rb', only_errors_fast,
+         "find/split parser + ERROR filter"),
+    ]
+    timings = {}
+    print(f"\nParsing {lines:,} log lines:")
+    for name, mode, parse, baseline in cases:
+        with open(filename, mode) as f:
+            start = time.perf_counter()
+            count = sum(1 for _ in parse(f))
+            seconds = time.perf_counter() - start
+        timings[name] = seconds
+        speedup = f"{timings[baseline] / seconds:5.1f}x" if baseline else "     -"
+        print(f"- {name:<38} {count:>9,} entries {seconds:7.2f} s "
+              f"{lines / seconds:>12,.0f} lines/s {speedup}")
+    os.remove(filename)
+
+# Follow mode: a background thread plays a running service that appends lines
+# with advancing (slightly out of order) timestamps and rotates its log halfway
+def write_live_log(filename, entries=480, rotate_at=240, seconds_per_entry=0.5):
+    """Append lines to a log like a running service, rotating it once"""
+    start = time.time() - entries * seconds_per_entry
+    f = open(filename, 'a')
+    try:
+        for i in range(entries):
+            if i == rotate_at:
+                f.close()
+                os.replace(filename, filename + ".1")
+                f = open(filename, 'a')
+            seconds = start + i * seconds_per_entry - random.uniform(0, 2)
+            f.write(random_log_line(time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))))
+            f.flush()
+            time.sleep(0.001)
+    finally:
+        f.close()
 
-# Display a sample of the report
-with open("log_report.txt", "r") as f:
-    report_sample = f.read(500)  # Read a portion
-    print("\nSample of generated report:")
-    print("--------------------------")
-    print(report_sample + "...")
 
 
 # Case Study 2: Data Transformation Pipeline
-print("\n\n2. Data Transformation Pipeline")
 
 
 # First, create a sample CSV file
@@ -243,11 +710,6 @@ def generate_sample_csv(filename, rows=100):
             
             writer.writerow([i, name, email, age, subscription])
 
-# Create sample CSV
-csv_filename = "sample_data.csv"
-generate_sample_csv(csv_filename, rows=100)
-print(f"Generated sample CSV file: {csv_filename} with 100 entries")
-
 # Create the data transformation pipeline
 
 # Step 1: CSV Reader Context Manager
@@ -406,34 +868,9 @@ def process_csv_data(input_file, output_file, error_file):
         print(f"Results written to {output_file}")
         print(f"Error log written to {error_file}")
 
-# Run the data transformation
-print("\nRunning data transformation pipeline...")
-process_csv_data(csv_filename, "transformed_data.csv", "data_errors.log")
-
-# Display a sample of the transformed data
-with open("transformed_data.csv", "r") as f:
-    transformed_sample = f.read(300)  # Read a portion
-    print("\nSample of transformed data:")
-    print("--------------------------")
-    print(transformed_sample + "...")
-
-# Display a sample of the error log
-with open("data_errors.log", "r") as f:
-    error_sample = f.read(300)  # Read a portion
-    print("\nSample of error log:")
-    print("------------------")
-    print(error_sample + "...")
 
 
 # Case Study 3: Memory-Efficient Data Pipeline
-print("\n\n3. Memory-Efficient Data Pipeline")
-print("==============================")
-print("Problem: Calculate moving averages on large datasets")
-print("Requirements:")
-print("- Process data larger than available memory")
-print("- Calculate sliding window statistics")
-print("- Clean resource handling")
-
 # Create a sample time series data file
 def generate_timeseries_data(filename, points=10000):
     """Generate sample time series data for demonstration"""
@@ -452,11 +889,6 @@ def generate_timeseries_data(filename, points=10000):
             writer.writerow([timestamp, f"{value:.2f}"])
 
 import math
-# Generate sample time series data
-timeseries_filename = "timeseries_data.csv"
-generate_timeseries_data(timeseries_filename, points=10000)
-print(f"Generated sample time series data: {timeseries_filename} with 10,000 data points")
-
 # Build the data processing pipeline
 
 # Step 1: Memory-efficient CSV reader
@@ -578,38 +1010,151 @@ def analyze_timeseries(input_file, output_file, window_size=20, stddev_threshold
         outlier_count = sum(1 for _, _, _, _, is_outlier in outlier_data if is_outlier)
         print(f"Detected {outlier_count} outliers out of {len(outlier_data)} data points")
 
-# Run the time series analysis
-print("\nRunning time series analysis pipeline...")
-analyze_timeseries(timeseries_filename, "timeseries_analysis.csv", window_size=30)
-
-# Display a sample of the analysis results
-with open("timeseries_analysis.csv", "r") as f:
-    analysis_sample = f.read(300)  # Read a portion
-    print("\nSample of time series analysis:")
-    print("-----------------------------")
-    print(analysis_sample + "...")
-
-# Clean up generated files
-print("\nCleaning up generated files...")
-for file in [log_filename, csv_filename, timeseries_filename, 
-             "log_report.txt", "transformed_data.csv", "data_errors.log", 
-             "timeseries_analysis.csv", "example.txt", "temp_config.txt"]:
-    if os.path.exists(file):
+
+# Run the case studies only as a script: process pool workers started with
+# the spawn method import this module and must not repeat them
+if __name__ == "__main__":
+    # Case Study 1: Log File Analysis System
+    print("\n1. Log File Analysis System")
+    
+    # Create our log file
+    log_filename = "sample_logs.txt"
+    generate_log_file(log_filename, entries=1000)
+    print(f"Generated sample log file: {log_filename} with 1000 entries")
+    
+    # Run the analysis
+    print("\nRunning log analysis pipeline...")
+    analyze_log_file(log_filename, "log_report.txt", filter_level="ERROR")
+    
+    # Display a sample of the report
+    with open("log_report.txt", "r") as f:
+        report_sample = f.read(500)  # Read a portion
+        print("\nSample of generated report:")
+        print("--------------------------")
+        print(report_sample + "...")
+    
+    # Extra aggregates ride along in the same pass as the standard ones
+    print("\nAdding a custom aggregate to the single-pass analyzer...")
+    analyzer = default_analyzer()
+    analyzer.register("top_ips", TopN(attrgetter("ip"), n=3, capacity=50))
+    with log_reader(log_filename) as logs:
+        metrics = analyze_logs(parse_log_lines(logs), analyzer)
+    print(f"Top IPs (Space-Saving, 50 counters, counts are upper bounds): {metrics['top_ips']}")
+    print(f"Top users: {metrics['top_users']}")
+    
+    print(f"\nMemory per parsed LogEntry: {entry_memory(log_filename):.0f} bytes "
+          f"(instance alone: {sys.getsizeof(LogEntry('', '', '', '', '', '')):.0f} bytes, "
+          f"no __dict__)")
+    
+    benchmark_parsers(1_000_000 if "--benchmark" in sys.argv else 50_000)
+    
+    # Parallel mode: the same report from shards analyzed in a process pool
+    print("\nRunning the pipeline serially and in parallel on a larger log...")
+    big_log = "big_logs.txt"
+    generate_log_file(big_log, entries=200_000)
+    workers = os.cpu_count() or 1
+    timings = {}
+    for mode in ("serial", "parallel"):
+        start = time.perf_counter()
+        analyze_log_file(big_log, f"log_report_{mode}.txt", filter_level="ERROR",
+                         fast=True, workers=workers if mode == "parallel" else None)
+        timings[mode] = time.perf_counter() - start
+    
+    # Everything but the timing line must match
+    reports = []
+    for mode in ("serial", "parallel"):
+        with open(f"log_report_{mode}.txt") as f:
+            reports.append([line for line in f if not line.startswith("Analysis completed")])
+        os.remove(f"log_report_{mode}.txt")
+    os.remove(big_log)
+    print(f"Serial: {timings['serial']:.2f} s, {workers} workers: {timings['parallel']:.2f} s "
+          f"({timings['serial'] / timings['parallel']:.1f}x), "
+          f"identical reports: {reports[0] == reports[1]}")
+    
+    print("\nFollowing a live log: 60 s windows every 30 s, rotated halfway...")
+    live_log = "live_logs.txt"
+    open(live_log, 'w').close()
+    writer = threading.Thread(target=write_live_log, args=(live_log,))
+    writer.start()
+    totals = follow_log_file(live_log, "live_report.txt", window=60, slide=30, lateness=5,
+                             poll_interval=0.05, stop=lambda: not writer.is_alive(), from_end=False)
+    writer.join()
+    print(f"Entries followed across the rotation: {sum(totals['level_counts'].values())}")
+    for file in [live_log, live_log + ".1", "live_report.txt"]:
         os.remove(file)
-        print(f"Removed: {file}")
-
-print("\n--- Exercise ---")
-print("Build a complete data processing system that:")
-print("1. Reads multiple data sources (CSV, JSON, etc.) using the appropriate iterator patterns")
-print("2. Transforms and validates the data with a generator pipeline")
-print("3. Handles errors gracefully, logging issues without crashing")
-print("4. Uses context managers to manage resources properly")
-print("5. Produces summary statistics and exports processed data")
-print("6. Optimizes for memory efficiency with large datasets")
-
-print("\nYour solution should incorporate all the key concepts from this course:")
-print("- Custom iterators for specialized data access patterns")
-print("- Generators for lazy evaluation and memory efficiency")
-print("- Context managers for clean resource management")
-print("- Itertools for powerful data transformations")
-print("- Error handling and recovery mechanisms") 
\ No newline at end of file
+    
+    # Case Study 2: Data Transformation Pipeline
+    print("\n\n2. Data Transformation Pipeline")
+    
+    # Create sample CSV
+    csv_filename = "sample_data.csv"
+    generate_sample_csv(csv_filename, rows=100)
+    print(f"Generated sample CSV file: {csv_filename} with 100 entries")
+    
+    # Run the data transformation
+    print("\nRunning data transformation pipeline...")
+    process_csv_data(csv_filename, "transformed_data.csv", "data_errors.log")
+    
+    # Display a sample of the transformed data
+    with open("transformed_data.csv", "r") as f:
+        transformed_sample = f.read(300)  # Read a portion
+        print("\nSample of transformed data:")
+        print("--------------------------")
+        print(transformed_sample + "...")
+    
+    # Display a sample of the error log
+    with open("data_errors.log", "r") as f:
+        error_sample = f.read(300)  # Read a portion
+        print("\nSample of error log:")
+        print("------------------")
+        print(error_sample + "...")
+    
+    # Case Study 3: Memory-Efficient Data Pipeline
+    print("\n\n3. Memory-Efficient Data Pipeline")
+    print("==============================")
+    print("Problem: Calculate moving averages on large datasets")
+    print("Requirements:")
+    print("- Process data larger than available memory")
+    print("- Calculate sliding window statistics")
+    print("- Clean resource handling")
+    
+    # Generate sample time series data
+    timeseries_filename = "timeseries_data.csv"
+    generate_timeseries_data(timeseries_filename, points=10000)
+    print(f"Generated sample time series data: {timeseries_filename} with 10,000 data points")
+    
+    # Run the time series analysis
+    print("\nRunning time series analysis pipeline...")
+    analyze_timeseries(timeseries_filename, "timeseries_analysis.csv", window_size=30)
+    
+    # Display a sample of the analysis results
+    with open("timeseries_analysis.csv", "r") as f:
+        analysis_sample = f.read(300)  # Read a portion
+        print("\nSample of time series analysis:")
+        print("-----------------------------")
+        print(analysis_sample + "...")
+    
+    # Clean up generated files
+    print("\nCleaning up generated files...")
+    for file in [log_filename, csv_filename, timeseries_filename, 
+                 "log_report.txt", "transformed_data.csv", "data_errors.log", 
+                 "timeseries_analysis.csv", "example.txt", "temp_config.txt"]:
+        if os.path.exists(file):
+            os.remove(file)
+            print(f"Removed: {file}")
+    
+    print("\n--- Exercise ---")
+    print("Build a complete data processing system that:")
+    print("1. Reads multiple data sources (CSV, JSON, etc.) using the appropriate iterator patterns")
+    print("2. Transforms and validates the data with a generator pipeline")
+    print("3. Handles errors gracefully, logging issues without crashing")
+    print("4. Uses context managers to manage resources properly")
+    print("5. Produces summary statistics and exports processed data")
+    print("6. Optimizes for memory efficiency with large datasets")
+    
+    print("\nYour solution should incorporate all the key concepts from this course:")
+    print("- Custom iterators for specialized data access patterns")
+    print("- Generators for lazy evaluation and memory efficiency")
+    print("- Context managers for clean resource management")
+    print("- Itertools for powerful data transformations")
+    print("- Error handling and recovery mechanisms") 
\ No newline at end of file
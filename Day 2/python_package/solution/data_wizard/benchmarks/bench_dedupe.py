@@ -0,0 +1,84 @@
+"""
+Benchmark out-of-core duplicate removal against the in-memory path.
+
+Both paths read the same CSV in chunks. The in-memory path concatenates the
+chunks and calls ``DataFrame.drop_duplicates``; the out-of-core path streams
+them through ``data_wizard.dedupe.drop_duplicates``. Wall time and the peak
+of traced allocations are reported for each.
+
+Usage:
+    python benchmarks/bench_dedupe.py --rows 2000000 --memory-limit 32
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from data_wizard import dedupe
+
+def generate(path, rows, distinct, seed=0):
+    """Write a CSV with roughly the given number of distinct rows."""
+    rng = np.random.default_rng(seed)
+    keys = rng.integers(0, distinct, rows)
+    df = pd.DataFrame({
+        'id': keys,
+        'value': (keys % 1000) / 10,
+        'category': np.array(['A', 'B', 'C', 'D'])[keys % 4],
+        'name': pd.Series(keys).map(lambda k: f"user-{k}")
+    })
+    df.to_csv(path, index=False)
+
+def measure(label, run):
+    """Run a callable and print its wall time and peak traced memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} {rows:>12,} rows  {elapsed:8.2f} s  "
+          f"{peak / 2**20:10.1f} MiB peak")
+    return rows
+
+def in_memory(path, chunksize):
+    """Deduplicate by concatenating every chunk first."""
+    with pd.read_csv(path, chunksize=chunksize) as reader:
+        data = pd.concat(reader)
+    return len(data.drop_duplicates())
+
+def out_of_core(path, chunksize, spill_dir, memory_limit):
+    """Deduplicate through hash-partitioned spill files."""
+    with pd.read_csv(path, chunksize=chunksize) as reader:
+        chunks = dedupe.drop_duplicates(reader, spill_dir=spill_dir,
+                                        memory_limit=memory_limit)
+        return sum(len(chunk) for chunk in chunks)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--distinct', type=float, default=0.5,
+                        help="Share of distinct rows")
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    parser.add_argument('--memory-limit', type=int, default=64,
+                        help="Out-of-core partition budget in MiB")
+    parser.add_argument('--spill-dir', default=None)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'input.csv')
+        generate(path, args.rows, max(int(args.rows * args.distinct), 1))
+        print(f"{args.rows:,} rows, {os.path.getsize(path) / 2**20:.1f} MiB CSV")
+        
+        expected = measure('in-memory', lambda: in_memory(path, args.chunksize))
+        actual = measure('out-of-core', lambda: out_of_core(
+            path, args.chunksize, args.spill_dir or tmp, args.memory_limit << 20
+        ))
+        assert actual == expected, "Row counts differ"
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
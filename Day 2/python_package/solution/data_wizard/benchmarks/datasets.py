@@ -0,0 +1,95 @@
+"""
+Synthetic datasets for the benchmark suite.
+
+Data is generated chunk by chunk from a seeded generator, so every size
+(up to 1e8 rows) is reproducible and never has to fit in memory. Files are
+written once per size into a data directory and reused across runs.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+# Rows generated and written per step
+CHUNK_ROWS = 1_000_000
+# Largest size that in-memory benchmarks load as a whole DataFrame
+IN_MEMORY_ROWS = 10_000_000
+SHARDS = 16
+CATEGORIES = np.array(['A', 'B', 'C', 'D'])
+
+def iter_frames(rows, seed=0, chunk_rows=CHUNK_ROWS):
+    """Yield chunks of a frame with ids, two floats, a category and a group key."""
+    rng = np.random.default_rng(seed)
+    groups = max(rows // 100, 1)
+    for start in range(0, rows, chunk_rows):
+        size = min(chunk_rows, rows - start)
+        # Ids repeat about once in five rows to give duplicate removal work
+        ids = rng.integers(0, max(rows * 4 // 5, 1), size)
+        value = rng.normal(100, 15, size).round(2)
+        value[rng.random(size) < 0.01] = np.nan
+        yield pd.DataFrame({
+            'id': ids,
+            'value': value,
+            'score': (value * 0.5 + rng.normal(0, 5, size)).round(2),
+            'category': CATEGORIES[ids % len(CATEGORIES)],
+            'group': rng.integers(0, groups, size)
+        }, index=pd.RangeIndex(start, start + size))
+
+class Dataset:
+    """Input files of one size, created on first use."""
+    
+    def __init__(self, rows, directory, seed=0):
+        self.rows = rows
+        self.seed = seed
+        self.directory = os.path.join(directory, f"rows-{rows}-seed-{seed}")
+        os.makedirs(self.directory, exist_ok=True)
+        self._frame = None
+    
+    @property
+    def in_memory(self):
+        """Whether the dataset is small enough to load as a whole."""
+        return self.rows <= IN_MEMORY_ROWS
+    
+    @property
+    def csv_path(self):
+        """CSV file with all rows."""
+        path = os.path.join(self.directory, "data.csv")
+        if not os.path.exists(path):
+            with open(path + ".tmp", 'w', newline='') as f:
+                for index, chunk in enumerate(iter_frames(self.rows, self.seed)):
+                    chunk.to_csv(f, index=False, header=index == 0)
+            os.rename(path + ".tmp", path)
+        return path
+    
+    @property
+    def shard_pattern(self):
+        """Glob pattern of ``SHARDS`` CSV files with the same schema."""
+        shard_dir = os.path.join(self.directory, "shards")
+        if not os.path.isdir(shard_dir):
+            os.makedirs(shard_dir + ".tmp", exist_ok=True)
+            per_shard = -(-self.rows // SHARDS)
+            for index, chunk in enumerate(iter_frames(self.rows, self.seed, per_shard)):
+                chunk.to_csv(os.path.join(shard_dir + ".tmp", f"part-{index:03d}.csv"),
+                             index=False)
+            os.rename(shard_dir + ".tmp", shard_dir)
+        return os.path.join(shard_dir, "part-*.csv")
+    
+    def npy_path(self, column):
+        """``.npy`` file with one float column, for memory-mapped stats."""
+        path = os.path.join(self.directory, f"{column}.npy")
+        if not os.path.exists(path):
+            array = np.lib.format.open_memmap(path + ".tmp.npy", mode='w+',
+                                              dtype=np.float64, shape=(self.rows,))
+            for chunk in iter_frames(self.rows, self.seed):
+                array[chunk.index[0]:chunk.index[-1] + 1] = chunk[column].to_numpy()
+            array.flush()
+            del array
+            os.rename(path + ".tmp.npy", path)
+        return path
+    
+    def frame(self):
+        """The whole dataset as a DataFrame, generated once per process."""
+        if self._frame is None:
+            self._frame = pd.concat(iter_frames(self.rows, self.seed))
+        return self._frame
\ No newline at end of file
@@ -0,0 +1,295 @@
+"""
+Benchmark suite for the public DataProcessor and stats API.
+
+Every case runs against synthetic data of each requested size (see
+``datasets.py``) and records the best wall time over ``--repeat`` runs, the
+peak of traced allocations in a separate run, and throughput in rows per
+second. Cases that load a whole DataFrame are skipped above
+``datasets.IN_MEMORY_ROWS``; streaming and memory-mapped cases run at every
+size, including 1e8 rows.
+
+Results are written as JSON. With ``--baseline`` they are compared against
+an earlier result file and the run exits with status 1 if a case got slower
+or allocated more than the allowed threshold.
+
+Usage:
+    python benchmarks/run_benchmarks.py --sizes 1e4 1e6 --output baseline.json
+    python benchmarks/run_benchmarks.py --sizes 1e4 1e6 --baseline baseline.json
+    python benchmarks/run_benchmarks.py --sizes 1e8 --filter stats. --repeat 1
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from data_wizard import DataProcessor, col, stats
+from data_wizard.report import write_json
+
+from datasets import Dataset
+
+CASES = []
+STREAM_CHUNK_ROWS = 500_000
+
+def case(name, in_memory=False):
+    """Register a benchmark; the function does the setup and returns the timed call."""
+    def register(setup):
+        CASES.append((name, in_memory, setup))
+        return setup
+    return register
+
+def loaded(dataset):
+    """Processor holding a fresh copy of the dataset."""
+    processor = DataProcessor()
+    processor.data = dataset.frame().copy()
+    return processor
+
+@case('processor.load_csv', in_memory=True)
+def load_csv(dataset):
+    path = dataset.csv_path
+    return lambda: DataProcessor().load_csv(path)
+
+@case('processor.load_csv[optimize_dtypes]', in_memory=True)
+def load_csv_optimized(dataset):
+    path = dataset.csv_path
+    return lambda: DataProcessor().load_csv(path, optimize_dtypes=True)
+
+@case('processor.load_many', in_memory=True)
+def load_many(dataset):
+    pattern = dataset.shard_pattern
+    return lambda: DataProcessor().load_many(pattern)
+
+@case('processor.clean_data', in_memory=True)
+def clean_data(dataset):
+    processor = loaded(dataset)
+    return processor.clean_data
+
+@case('processor.filter_by_column', in_memory=True)
+def filter_by_column(dataset):
+    processor = loaded(dataset)
+    return lambda: processor.filter_by_column('value', lambda x: x > 90)
+
+@case('processor.filter', in_memory=True)
+def filter_expression(dataset):
+    processor = loaded(dataset)
+    return lambda: processor.filter((col('value') > 90) & (col('score') < 60))
+
+@case('processor.select_columns', in_memory=True)
+def select_columns(dataset):
+    processor = loaded(dataset)
+    return lambda: processor.select_columns(['id', 'value'])
+
+@case('processor.append', in_memory=True)
+def append(dataset):
+    processor = loaded(dataset)
+    rows = dataset.frame().iloc[:max(len(dataset.frame()) // 100, 1)]
+    processor.get_summary()
+    return lambda: processor.append(rows)
+
+@case('processor.get_summary', in_memory=True)
+def get_summary(dataset):
+    processor = loaded(dataset)
+    return processor.get_summary
+
+@case('processor.get_column_stats', in_memory=True)
+def get_column_stats(dataset):
+    processor = loaded(dataset)
+    return processor.get_column_stats
+
+@case('processor.save_csv', in_memory=True)
+def save_csv(dataset):
+    processor = loaded(dataset)
+    return lambda: processor.save_csv(os.path.join(dataset.directory, "out.csv"))
+
+@case('processor.collect[lazy]', in_memory=True)
+def collect(dataset):
+    path = dataset.csv_path
+    
+    def run():
+        processor = DataProcessor(path, lazy=True)
+        processor.clean_data().filter(col('value') > 90).select_columns(['id', 'value'])
+        processor.explain()
+        return processor.collect()
+    return run
+
+@case('processor.iter_chunks[streaming]')
+def iter_chunks(dataset):
+    path = dataset.csv_path
+    
+    def run():
+        processor = DataProcessor(path, chunksize=STREAM_CHUNK_ROWS)
+        processor.filter(col('value') > 90).select_columns(['id', 'value'])
+        return sum(len(chunk) for chunk in processor.iter_chunks())
+    return run
+
+@case('processor.get_summary[streaming]')
+def streaming_summary(dataset):
+    return DataProcessor(dataset.csv_path, chunksize=STREAM_CHUNK_ROWS).get_summary
+
+@case('stats.as_array')
+def as_array(dataset):
+    path = dataset.npy_path('value')
+    return lambda: stats.as_array(path)
+
+@case('stats.calculate_basic_stats')
+def basic_stats(dataset):
+    path = dataset.npy_path('value')
+    return lambda: stats.calculate_basic_stats(path)
+
+@case('stats.calculate_streaming_stats')
+def streaming_stats(dataset):
+    values = stats.as_array(dataset.npy_path('value'))
+    return lambda: stats.calculate_streaming_stats(
+        values[start:start + STREAM_CHUNK_ROWS]
+        for start in range(0, len(values), STREAM_CHUNK_ROWS)
+    )
+
+@case('stats.RunningStats.update')
+def running_stats(dataset):
+    values = stats.as_array(dataset.npy_path('value'))
+    return lambda: stats.RunningStats().update(values)
+
+@case('stats.calculate_percentiles')
+def percentiles(dataset):
+    path = dataset.npy_path('score')
+    return lambda: stats.calculate_percentiles(path, [1, 50, 99])
+
+@case('stats.calculate_percentiles[approximate]')
+def percentiles_approximate(dataset):
+    path = dataset.npy_path('score')
+    return lambda: stats.calculate_percentiles(path, [1, 50, 99], approximate=True)
+
+@case('stats.calculate_iqr_bounds')
+def iqr_bounds(dataset):
+    path = dataset.npy_path('score')
+    return lambda: stats.calculate_iqr_bounds(path)
+
+@case('stats.detect_outliers')
+def detect_outliers(dataset):
+    path = dataset.npy_path('score')
+    return lambda: stats.detect_outliers(path, return_type='indices')
+
+@case('stats.calculate_correlation')
+def correlation(dataset):
+    x, y = dataset.npy_path('value'), dataset.npy_path('score')
+    return lambda: stats.calculate_correlation(x, y)
+
+@case('stats.calculate_correlation_matrix', in_memory=True)
+def correlation_matrix(dataset):
+    frame = dataset.frame()
+    return lambda: stats.calculate_correlation_matrix(frame)
+
+@case('stats.calculate_grouped_stats', in_memory=True)
+def grouped_stats(dataset):
+    frame = dataset.frame()
+    return lambda: stats.calculate_grouped_stats(frame['score'], frame['group'], [90])
+
+def measure(setup, dataset, repeat, trace_memory):
+    """Return the best wall time and the peak traced allocation of a case."""
+    times = []
+    for _ in range(repeat):
+        run = setup(dataset)
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    
+    peak = None
+    if trace_memory:
+        run = setup(dataset)
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return min(times), peak
+
+def compare(results, baseline, threshold, memory_threshold):
+    """Return a message for every case that regressed against the baseline."""
+    previous = {(r['name'], r['rows']): r for r in baseline['results']}
+    regressions = []
+    for result in results:
+        base = previous.get((result['name'], result['rows']))
+        if base is None:
+            continue
+        if result['seconds'] > base['seconds'] * (1 + threshold):
+            regressions.append(
+                f"{result['name']} @ {result['rows']:,} rows: "
+                f"{base['seconds']:.4f} s -> {result['seconds']:.4f} s"
+            )
+        if result['peak_bytes'] is not None and base['peak_bytes'] is not None and \
+                result['peak_bytes'] > base['peak_bytes'] * (1 + memory_threshold):
+            regressions.append(
+                f"{result['name']} @ {result['rows']:,} rows: "
+                f"{base['peak_bytes'] / 2**20:.1f} MiB -> "
+                f"{result['peak_bytes'] / 2**20:.1f} MiB peak"
+            )
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', type=lambda s: int(float(s)),
+                        default=[10_000, 1_000_000],
+                        help="Row counts, e.g. 1e4 1e6 1e8")
+    parser.add_argument('--filter', default='',
+                        help="Only run cases whose name contains this text")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true',
+                        help="Skip the traced run that measures peak memory")
+    parser.add_argument('--data-dir', default=None,
+                        help="Directory for generated data, reused across runs")
+    parser.add_argument('--output', default=None,
+                        help="Write results to this JSON file")
+    parser.add_argument('--baseline', default=None,
+                        help="Compare against this JSON file")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Allowed relative slowdown")
+    parser.add_argument('--memory-threshold', type=float, default=0.25,
+                        help="Allowed relative growth of peak memory")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or tmp
+        results = []
+        for rows in args.sizes:
+            dataset = Dataset(rows, data_dir)
+            for name, in_memory, setup in CASES:
+                if args.filter not in name:
+                    continue
+                if in_memory and not dataset.in_memory:
+                    print(f"{name:<42} {rows:>12,} rows  skipped (in-memory case)")
+                    continue
+                seconds, peak = measure(setup, dataset, args.repeat, not args.no_memory)
+                result = {'name': name, 'rows': rows, 'seconds': seconds,
+                          'peak_bytes': peak, 'rows_per_second': rows / seconds}
+                results.append(result)
+                memory = f"{peak / 2**20:10.1f} MiB" if peak is not None else ""
+                print(f"{name:<42} {rows:>12,} rows  {seconds:9.4f} s  "
+                      f"{result['rows_per_second']:14,.0f} rows/s  {memory}")
+    
+    report = {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'results': results
+    }
+    if args.output:
+        write_json(report, args.output)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.memory_threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.baseline}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,21 +1,80 @@
 """
 Data Wizard - A Python package for easy data processing and statistical analysis.
+
+Only the lightweight helpers in ``data_wizard.utils`` are imported with the
+package. Everything that needs pandas or numpy is imported from its module
+on first attribute access, so ``import data_wizard`` stays cheap for command
+line tools and short-lived workers.
 """
 
-from data_wizard.processor import DataProcessor
-from data_wizard.stats import calculate_basic_stats, calculate_percentiles, detect_outliers
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from data_wizard.utils import validate_file_path, save_json_report, format_number
 
+if TYPE_CHECKING:
+    from data_wizard.processor import DataProcessor
+    from data_wizard.parallel import ParallelProcessor
+    from data_wizard.stats import (
+        RunningStats,
+        calculate_basic_stats,
+        calculate_correlation_matrix,
+        calculate_grouped_stats,
+        calculate_percentiles,
+        detect_outliers,
+    )
+    from data_wizard.sketch import KLLSketch
+    from data_wizard.cache import CSVCache
+    from data_wizard.expr import col, lit
+
 __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
+# Public name -> module that defines it, imported on first access
+_LAZY_ATTRIBUTES = {
+    'DataProcessor': 'data_wizard.processor',
+    'ParallelProcessor': 'data_wizard.parallel',
+    'CSVCache': 'data_wizard.cache',
+    'col': 'data_wizard.expr',
+    'lit': 'data_wizard.expr',
+    'RunningStats': 'data_wizard.stats',
+    'calculate_basic_stats': 'data_wizard.stats',
+    'calculate_correlation_matrix': 'data_wizard.stats',
+    'calculate_grouped_stats': 'data_wizard.stats',
+    'calculate_percentiles': 'data_wizard.stats',
+    'detect_outliers': 'data_wizard.stats',
+    'KLLSketch': 'data_wizard.sketch',
+}
+
 __all__ = [
     'DataProcessor',
+    'ParallelProcessor',
+    'CSVCache',
+    'col',
+    'lit',
+    'RunningStats',
     'calculate_basic_stats',
+    'calculate_correlation_matrix',
+    'calculate_grouped_stats',
     'calculate_percentiles',
     'detect_outliers',
+    'KLLSketch',
     'validate_file_path',
     'save_json_report',
     'format_number',
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import heavy attributes on first access and cache them on the package."""
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""
+Columnar on-disk cache of parsed CSV files.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'data_wizard'
+MEMMAP_KINDS = 'biufcmM'
+
+
+class CSVCache:
+    """
+    Transparent columnar cache for CSV files.
+    
+    The first load of a file parses the CSV and stores every column as a
+    separate ``.npy`` file, keyed by the absolute path, modification time
+    and size of the source. Later loads of the unchanged file read the
+    columns back memory-mapped (copy-on-write), so only the pages that are
+    actually touched are read from disk, and only the requested columns are
+    opened at all. Columns without a fixed-width NumPy dtype (strings,
+    categories) are stored pickled. When the total cache size exceeds
+    ``max_bytes`` the least recently used entries are evicted.
+    """
+    
+    def __init__(self,
+                 cache_dir: Optional[str] = None,
+                 max_bytes: int = 1 << 30):
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir: Directory holding cache entries, created if missing
+            max_bytes: Size cap of the cache in bytes
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+    
+    def key(self, file_path: str) -> str:
+        """
+        Compute the cache key of a source file.
+        
+        Args:
+            file_path: Path to the source CSV file
+            
+        Returns:
+            Hex digest of the absolute path, mtime and size
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        raw = f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]
+    
+    def load(self,
+             file_path: str,
+             columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load a CSV file through the cache.
+        
+        Args:
+            file_path: Path to the source CSV file
+            columns: Optional subset of columns to load
+            
+        Returns:
+            DataFrame with the file contents
+        """
+        entry = self.cache_dir / self.key(file_path)
+        if (entry / 'meta.json').exists():
+            logger.debug(f"Cache hit for {file_path}")
+            os.utime(entry / 'meta.json')
+            return self._read_entry(entry, columns)
+        
+        logger.debug(f"Cache miss for {file_path}")
+        data = pd.read_csv(file_path)
+        self._write_entry(entry, file_path, data)
+        self._evict(keep=entry)
+        return data if columns is None else data[columns]
+    
+    def invalidate(self, file_path: Optional[str] = None) -> int:
+        """
+        Remove cache entries.
+        
+        Args:
+            file_path: Source whose entries (all versions) are removed;
+                every entry is removed when omitted
+                
+        Returns:
+            Number of entries removed
+        """
+        source = os.path.abspath(file_path) if file_path else None
+        removed = 0
+        for entry, meta in self._entries():
+            if source is None or meta.get('source') == source:
+                shutil.rmtree(entry, ignore_errors=True)
+                removed += 1
+        return removed
+    
+    def size(self) -> int:
+        """
+        Return the total size of all cache entries in bytes.
+        
+        Returns:
+            Cache size in bytes
+        """
+        return sum(meta.get('bytes', 0) for _, meta in self._entries())
+    
+    def _entries(self) -> List[Any]:
+        """List (entry directory, metadata) pairs of complete entries."""
+        entries = []
+        for entry in self.cache_dir.iterdir():
+            try:
+                with open(entry / 'meta.json', 'r', encoding='utf-8') as f:
+                    entries.append((entry, json.load(f)))
+            except (OSError, ValueError):
+                continue
+        return entries
+    
+    def _write_entry(self, entry: Path, file_path: str, data: pd.DataFrame) -> None:
+        """Write a DataFrame column by column and publish it atomically."""
+        source = os.path.abspath(file_path)
+        tmp = Path(tempfile.mkdtemp(dir=self.cache_dir, prefix='.tmp-'))
+        try:
+            files: Dict[str, str] = {}
+            for position, column in enumerate(data.columns):
+                series = data[column]
+                name = f"{position}.npy"
+                if series.dtype.kind in MEMMAP_KINDS and isinstance(
+                        series.dtype, np.dtype):
+                    np.save(tmp / name, series.to_numpy())
+                else:
+                    name = f"{position}.pkl"
+                    series.reset_index(drop=True).to_pickle(tmp / name)
+                files[str(column)] = name
+            meta = {
+                'source': source,
+                'columns': [str(c) for c in data.columns],
+                'files': files,
+                'rows': len(data),
+                'bytes': sum(f.stat().st_size for f in tmp.iterdir()),
+            }
+            self.invalidate(file_path)
+            with open(tmp / 'meta.json', 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            os.replace(tmp, entry)
+        except OSError as e:
+            logger.error(f"Error writing cache entry for {file_path}: {str(e)}")
+            shutil.rmtree(tmp, ignore_errors=True)
+    
+    @staticmethod
+    def _read_entry(entry: Path, columns: Optional[List[str]]) -> pd.DataFrame:
+        """Read the requested columns of an entry, memory-mapped."""
+        with open(entry / 'meta.json', 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        wanted = meta['columns'] if columns is None else columns
+        data = {}
+        for column in wanted:
+            path = entry / meta['files'][column]
+            if path.suffix == '.npy':
+                data[column] = np.load(path, mmap_mode='c').view(np.ndarray)
+            else:
+                data[column] = pd.read_pickle(path)
+        return pd.DataFrame(data, index=pd.RangeIndex(meta['rows']),
+                            columns=wanted, copy=False)
+    
+    def _evict(self, keep: Path) -> None:
+        """Evict least recently used entries until the cache fits."""
+        entries = sorted(
+            self._entries(),
+            key=lambda item: (item[0] == keep, (item[0] / 'meta.json').stat().st_mtime)
+        )
+        total = sum(meta.get('bytes', 0) for _, meta in entries)
+        for entry, meta in entries:
+            if total <= self.max_bytes:
+                break
+            logger.debug(f"Evicting cache entry for {meta.get('source')}")
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= meta.get('bytes', 0)
\ No newline at end of file
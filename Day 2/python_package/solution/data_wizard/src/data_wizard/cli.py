@@ -0,0 +1,410 @@
+"""
+``data-wizard`` command line batch runner.
+
+A job spec is a JSON file describing one or more jobs::
+
+    {
+        "workers": 8,
+        "jobs": [{
+            "name": "sales",
+            "inputs": ["incoming/sales-*.csv"],
+            "clean": {"drop_duplicates": true, "fill_numeric": true},
+            "filters": [{"column": "revenue", "op": ">", "value": 1000},
+                        {"column": "region", "op": "isin", "value": ["EU", "US"]}],
+            "select": ["order_id", "region", "revenue"],
+            "stats": {"columns": ["revenue"], "percentiles": [50, 95]},
+            "output": {"dir": "out/sales", "format": "csv", "compression": "gzip"},
+            "chunksize": 500000
+        }]
+    }
+    
+Every input file is processed by one task on a process pool that is
+created once and reused for all files and jobs, so each worker pays the
+pandas import a single time. Clean, filter and select steps run per file.
+Statistics are collected per file as ``RunningStats`` and ``KLLSketch``
+states and merged per job, so percentiles are approximate with rank error
+``stats.epsilon``. Each job writes one output file per input (unless the
+format is ``none``), laid out like the inputs below their common directory,
+plus ``report.json``, and prints a throughput summary.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from data_wizard import ingest
+from data_wizard.expr import BINARY_OPS, Expr, col
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS = ('csv', 'ndjson', 'none')
+FILTER_OPS = {'>', '>=', '<', '<=', '==', '!=', 'isin', 'between', 'isnull', 'notnull'}
+COMPRESSION_SUFFIXES = {None: '', 'gzip': '.gz', 'zstd': '.zst'}
+
+
+class JobSpec:
+    """Validated description of one batch job."""
+    
+    def __init__(self, spec: Dict[str, Any], index: int = 0):
+        """
+        Validate a job spec.
+        
+        Args:
+            spec: Job entry of the spec file
+            index: Position of the job, used for the default name
+            
+        Raises:
+            ValueError: If the spec is malformed
+        """
+        unknown = set(spec) - {'name', 'inputs', 'clean', 'filters', 'select',
+                               'stats', 'output', 'chunksize'}
+        if unknown:
+            raise ValueError(f"Unknown job keys: {sorted(unknown)}")
+        self.name = spec.get('name', f"job-{index}")
+        inputs = spec.get('inputs')
+        if not inputs:
+            raise ValueError(f"Job {self.name} has no inputs")
+        self.inputs = [inputs] if isinstance(inputs, str) else list(inputs)
+        
+        clean = spec.get('clean', False)
+        self.clean = dict(clean) if isinstance(clean, dict) else ({} if clean else None)
+        self.filter = _filter_expression(spec.get('filters', []), self.name)
+        self.select = spec.get('select')
+        self.chunksize = spec.get('chunksize')
+        
+        stats = spec.get('stats', {})
+        self.stats_columns = stats.get('columns')
+        self.percentiles = stats.get('percentiles', [25, 50, 75])
+        self.epsilon = stats.get('epsilon', 0.01)
+        if not all(0 <= p <= 100 for p in self.percentiles):
+            raise ValueError(
+                f"Percentiles of job {self.name} must be between 0 and 100"
+            )
+        
+        output = spec.get('output', {})
+        self.output_dir = output.get('dir',
+                                     os.path.join('data_wizard_output', self.name))
+        self.output_format = output.get('format', 'csv')
+        self.compression = output.get('compression')
+        if self.output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Output format must be one of {OUTPUT_FORMATS}")
+        if self.compression not in COMPRESSION_SUFFIXES:
+            raise ValueError("Compression must be gzip, zstd or omitted")
+    
+    def output_paths(self, input_paths: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Return the output file of every input file.
+        
+        Outputs mirror the input tree below the common directory of the
+        inputs, so files with the same name in different directories do
+        not overwrite each other.
+        
+        Args:
+            input_paths: Paths of the input CSV files
+            
+        Returns:
+            Dictionary mapping each input to its path in the output
+            directory, or to None if no data is written
+            
+        Raises:
+            ValueError: If two inputs would be written to the same output
+        """
+        if self.output_format == 'none' or not input_paths:
+            return dict.fromkeys(input_paths)
+        root = os.path.commonpath(
+            [os.path.dirname(os.path.abspath(path)) for path in input_paths]
+        )
+        suffix = COMPRESSION_SUFFIXES[self.compression]
+        outputs: Dict[str, Optional[str]] = {}
+        sources: Dict[str, str] = {}
+        for path in input_paths:
+            stem = os.path.splitext(os.path.relpath(os.path.abspath(path), root))[0]
+            name = f"{stem}.{self.output_format}{suffix}"
+            output = os.path.join(self.output_dir, name)
+            if output in sources:
+                raise ValueError(
+                    f"Inputs {sources[output]} and {path} of job {self.name} "
+                    f"would both be written to {output}"
+                )
+            sources[output] = path
+            outputs[path] = output
+        return outputs
+
+
+class FileOutcome:
+    """Result of one file task, sent back from a worker."""
+    
+    def __init__(self,
+                 path: str,
+                 bytes_in: int = 0,
+                 rows_out: int = 0,
+                 seconds: float = 0.0,
+                 stats: Optional[Dict[str, Tuple[Any, Any]]] = None,
+                 error: Optional[str] = None):
+        self.path = path
+        self.bytes_in = bytes_in
+        self.rows_out = rows_out
+        self.seconds = seconds
+        self.stats = stats or {}
+        self.error = error
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the outcome without the statistics states."""
+        return {'path': self.path, 'bytes_in': self.bytes_in, 'rows_out': self.rows_out,
+                'seconds': self.seconds, 'error': self.error}
+
+
+def load_spec(path: str) -> Tuple[List[JobSpec], Optional[int]]:
+    """
+    Read and validate a job spec file.
+    
+    Args:
+        path: Path to a JSON spec with a ``jobs`` list, or a single job
+        
+    Returns:
+        Tuple of the jobs and the requested number of workers
+        
+    Raises:
+        ValueError: If the file is not valid JSON or a job is malformed
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            spec = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid job spec {path}: {e}")
+    if not isinstance(spec, dict):
+        raise ValueError("Job spec must be a JSON object")
+    jobs = spec['jobs'] if 'jobs' in spec else [spec]
+    return [JobSpec(job, index) for index, job in enumerate(jobs)], spec.get('workers')
+
+
+def run_jobs(jobs: List[JobSpec],
+             max_workers: Optional[int] = None,
+             echo: bool = True) -> List[Dict[str, Any]]:
+    """
+    Run jobs one after another on a shared, warm process pool.
+    
+    Args:
+        jobs: Validated jobs
+        max_workers: Number of worker processes, defaults to CPU count
+        echo: Whether to print a throughput line per job
+        
+    Returns:
+        One report dictionary per job, as written to its ``report.json``
+    """
+    reports = []
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1,
+                             initializer=_warm_up) as executor:
+        for job in jobs:
+            report = _run_job(executor, job)
+            reports.append(report)
+            if echo:
+                print(_throughput_line(report))
+    return reports
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point of the ``data-wizard`` command.
+    
+    Args:
+        argv: Command line arguments, defaults to ``sys.argv[1:]``
+        
+    Returns:
+        0 on success, 1 if any file failed, 2 for an invalid spec or
+        inputs whose outputs collide
+    """
+    parser = argparse.ArgumentParser(
+        prog='data-wizard',
+        description="Run DataProcessor batch jobs described by a JSON spec."
+    )
+    parser.add_argument('spec', help="Path to the JSON job spec")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="Number of worker processes (overrides the spec)")
+    parser.add_argument('--job', action='append', default=None,
+                        help="Only run the named job; may be repeated")
+    args = parser.parse_args(argv)
+    
+    try:
+        jobs, workers = load_spec(args.spec)
+        if args.job:
+            jobs = [job for job in jobs if job.name in args.job]
+            if not jobs:
+                raise ValueError(f"No jobs named {args.job}")
+    except (OSError, ValueError) as e:
+        print(f"data-wizard: {e}", file=sys.stderr)
+        return 2
+    
+    try:
+        reports = run_jobs(jobs, args.workers or workers)
+    except ValueError as e:
+        print(f"data-wizard: {e}", file=sys.stderr)
+        return 2
+    return 1 if any(report['failed'] for report in reports) else 0
+
+
+def _run_job(executor: ProcessPoolExecutor, job: JobSpec) -> Dict[str, Any]:
+    """Submit the files of a job, merge their results and write the report."""
+    from data_wizard.report import write_json
+    
+    start = time.perf_counter()
+    paths = list(dict.fromkeys(
+        path for pattern in job.inputs for path in ingest.expand_paths(pattern)
+    ))
+    outputs = job.output_paths(paths)
+    os.makedirs(job.output_dir, exist_ok=True)
+    for output_path in set(outputs.values()) - {None}:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    futures: List[Future] = [
+        executor.submit(_run_file, path, job, outputs[path]) for path in paths
+    ]
+    outcomes = [future.result() for future in futures]
+    seconds = time.perf_counter() - start
+    
+    merged: Dict[str, Tuple[Any, Any]] = {}
+    for outcome in outcomes:
+        for column, (running, sketch) in outcome.stats.items():
+            if column in merged:
+                merged[column][0].merge(running)
+                merged[column][1].merge(sketch)
+            else:
+                merged[column] = (running, sketch)
+    
+    bytes_in = sum(outcome.bytes_in for outcome in outcomes)
+    rows_out = sum(outcome.rows_out for outcome in outcomes)
+    report = {
+        'job': job.name,
+        'files': len(outcomes),
+        'failed': sum(outcome.error is not None for outcome in outcomes),
+        'bytes_in': bytes_in,
+        'rows_out': rows_out,
+        'seconds': seconds,
+        'bytes_per_second': bytes_in / seconds if seconds else 0.0,
+        'rows_per_second': rows_out / seconds if seconds else 0.0,
+        'stats': {column: _column_summary(running, sketch, job.percentiles)
+                  for column, (running, sketch) in merged.items()},
+        'results': [outcome.to_dict() for outcome in outcomes]
+    }
+    write_json(report, os.path.join(job.output_dir, 'report.json'))
+    return report
+
+
+def _run_file(path: str, job: JobSpec, output_path: Optional[str]) -> FileOutcome:
+    """Process one input file in a worker and return its outcome."""
+    from data_wizard.plan import numeric_columns
+    from data_wizard.processor import DataProcessor
+    from data_wizard.report import open_output
+    from data_wizard.sketch import KLLSketch
+    from data_wizard.stats import RunningStats, as_array
+    
+    start = time.perf_counter()
+    try:
+        if job.chunksize:
+            processor = DataProcessor(path, chunksize=job.chunksize)
+        else:
+            processor = DataProcessor(path, lazy=True)
+        if job.clean is not None:
+            processor.clean_data(**job.clean)
+        if job.filter is not None:
+            processor.filter(job.filter)
+        if job.select:
+            processor.select_columns(job.select)
+        
+        stats: Dict[str, Tuple[Any, Any]] = {}
+        output = open_output(output_path, job.compression) if output_path else None
+        rows_out = 0
+        header_written = False
+        try:
+            for chunk in processor.iter_chunks():
+                if output is not None:
+                    output.write(
+                        _encode(chunk, job.output_format, header=not header_written)
+                    )
+                    header_written = True
+                rows_out += len(chunk)
+                for column in job.stats_columns or numeric_columns(chunk):
+                    if column not in stats:
+                        stats[column] = (RunningStats(), KLLSketch(epsilon=job.epsilon))
+                    values = as_array(chunk[column])
+                    stats[column][0].update(values)
+                    stats[column][1].update(values)
+        finally:
+            if output is not None:
+                output.close()
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Job {job.name}: skipping {path}: {str(e)}")
+        return FileOutcome(path, seconds=time.perf_counter() - start, error=str(e))
+    return FileOutcome(path, os.path.getsize(path), rows_out,
+                       time.perf_counter() - start, stats)
+
+
+def _encode(chunk: Any, output_format: str, header: bool) -> bytes:
+    """Serialize a chunk for the output file."""
+    if output_format == 'csv':
+        return chunk.to_csv(index=False, header=header).encode('utf-8')
+    if chunk.empty:
+        return b''
+    return chunk.to_json(orient='records', lines=True, force_ascii=False)\
+        .rstrip('\n').encode('utf-8') + b'\n'
+
+
+def _column_summary(running: Any,
+                    sketch: Any,
+                    percentiles: List[float]) -> Dict[str, Any]:
+    """Merged statistics of one column."""
+    if running.count == 0:
+        return {'count': 0}
+    summary = running.to_dict()
+    values = sketch.quantile([p / 100 for p in percentiles])
+    summary.update({f'p{p}': float(v) for p, v in zip(percentiles, values)})
+    return summary
+
+
+def _filter_expression(filters: List[Dict[str, Any]], job_name: str) -> Optional[Expr]:
+    """Combine filter entries of a spec into one expression."""
+    expression = None
+    for entry in filters:
+        op = entry.get('op')
+        if 'column' not in entry or op not in FILTER_OPS:
+            raise ValueError(
+                f"Filters of job {job_name} need a column and an op in "
+                f"{sorted(FILTER_OPS)}"
+            )
+        column, value = col(entry['column']), entry.get('value')
+        if op == 'isin':
+            condition = column.isin(value)
+        elif op == 'between':
+            condition = column.between(*value)
+        elif op == 'isnull':
+            condition = column.isnull()
+        elif op == 'notnull':
+            condition = column.notnull()
+        else:
+            condition = BINARY_OPS[op](column, value)
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def _throughput_line(report: Dict[str, Any]) -> str:
+    """One-line summary of a finished job."""
+    failed = f", {report['failed']} failed" if report['failed'] else ""
+    return (f"{report['job']}: {report['files']} files{failed}, "
+            f"{report['bytes_in'] / 2**20:,.1f} MiB in, "
+            f"{report['rows_out']:,} rows out, {report['seconds']:.2f} s, "
+            f"{report['bytes_per_second'] / 2**20:,.1f} MiB/s, "
+            f"{report['rows_per_second']:,.0f} rows/s")
+
+
+def _warm_up() -> None:
+    """Import the heavy modules once when a worker process starts."""
+    import data_wizard.processor  # noqa: F401
+    import data_wizard.stats  # noqa: F401
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,266 @@
+"""
+Out-of-core exact duplicate removal with hash-partitioned spill files.
+"""
+
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Default budget for the rows of one partition held in memory at a time
+MEMORY_LIMIT = 256 << 20
+PARTITION_BITS = 6
+MERGE_ROWS = 1 << 16
+# Most spill files open at once while merging survivors back together
+MERGE_FAN_IN = 32
+NULL_HASH = np.uint64(0x9E3779B97F4A7C15)
+
+Positioned = Tuple[np.ndarray, pd.DataFrame]
+Spilled = Tuple[np.ndarray, np.ndarray, pd.DataFrame]
+
+
+def drop_duplicates(chunks: Iterable[pd.DataFrame],
+                    spill_dir: Optional[str] = None,
+                    memory_limit: int = MEMORY_LIMIT) -> Iterator[pd.DataFrame]:
+    """
+    Remove duplicate rows from a chunk stream without an in-memory hash table.
+    
+    Rows are hash-partitioned into spill files on local disk. Each partition
+    is deduplicated on its own, and partitions larger than ``memory_limit``
+    are split again on further hash bits. The survivors are merged back by
+    input position, so the output equals ``drop_duplicates()`` (keeping the
+    first occurrence) over the concatenated input, chunked differently.
+    Memory stays bounded by ``memory_limit`` plus one input chunk and a
+    small merge buffer for each of at most ``MERGE_FAN_IN`` files; with
+    more survivor files they are merged in several rounds.
+    
+    Args:
+        chunks: Input chunks with identical columns
+        spill_dir: Directory for the spill files, the system temporary
+            directory by default; files are removed when done
+        memory_limit: Bytes of partition data held in memory at once
+        
+    Yields:
+        Deduplicated chunks in input order
+    """
+    for _, frame in iter_unique(chunks, spill_dir, memory_limit):
+        yield frame
+
+
+def iter_unique(chunks: Iterable[pd.DataFrame],
+                spill_dir: Optional[str] = None,
+                memory_limit: int = MEMORY_LIMIT) -> Iterator[Positioned]:
+    """
+    Like ``drop_duplicates`` but also yield the input position of every row.
+    
+    Args:
+        chunks: Input chunks with identical columns
+        spill_dir: Directory for the spill files
+        memory_limit: Bytes of partition data held in memory at once
+        
+    Yields:
+        (positions, frame) pairs in input order
+    """
+    workdir = tempfile.mkdtemp(prefix='dedupe-', dir=spill_dir)
+    try:
+        partitions = _partition(_hashed(chunks), workdir, 'p', depth=0)
+        leaves: List[str] = []
+        for path, size in partitions:
+            leaves.extend(_dedupe_partition(path, size, workdir, memory_limit, depth=0))
+        level = 0
+        while len(leaves) > MERGE_FAN_IN:
+            leaves = _merge_round(leaves, workdir, f"m{level}")
+            level += 1
+        yield from _merge([_read_spill(path) for path in leaves])
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def row_hashes(data: pd.DataFrame) -> np.ndarray:
+    """
+    Hash every row to 64 bits, consistently across chunks.
+    
+    Numeric columns are hashed as float64 and missing values as a fixed
+    constant, so a value hashes the same whether a chunk inferred an
+    integer, float or object column for it.
+    
+    Args:
+        data: Rows to hash
+        
+    Returns:
+        Array of uint64 row hashes
+    """
+    result = np.zeros(len(data), dtype=np.uint64)
+    for column in data.columns:
+        series = data[column]
+        if pd.api.types.is_integer_dtype(series.dtype) or \
+                pd.api.types.is_float_dtype(series.dtype):
+            series = pd.Series(series.to_numpy(dtype=float, na_value=np.nan))
+        hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+        hashes = np.where(series.isna().to_numpy(), NULL_HASH, hashes)
+        result = result * np.uint64(1000003) ^ hashes
+    return result
+
+
+def row_values(data: pd.DataFrame) -> List[Tuple[Any, ...]]:
+    """
+    Return every row as a tuple of plain Python values for exact comparison.
+    
+    Missing values become None, and integers compare equal to floats of the
+    same value, so rows compare alike across chunk dtypes as in
+    ``row_hashes``, but integers beyond float precision stay distinct.
+    
+    Args:
+        data: Rows to convert
+        
+    Returns:
+        List of row tuples
+    """
+    values = data.astype(object).where(data.notna(), None)
+    return list(values.itertuples(index=False, name=None))
+
+
+def _hashed(chunks: Iterable[pd.DataFrame]) -> Iterator[Spilled]:
+    """Attach global input positions and row hashes to every chunk."""
+    offset = 0
+    for chunk in chunks:
+        positions = np.arange(offset, offset + len(chunk), dtype=np.int64)
+        yield positions, row_hashes(chunk), chunk
+        offset += len(chunk)
+
+
+def _partition(items: Iterable[Spilled],
+               workdir: str,
+               prefix: str,
+               depth: int) -> List[Tuple[str, int]]:
+    """Spill rows to files by hash bits; return (path, bytes) per partition."""
+    count = 1 << PARTITION_BITS
+    paths = [os.path.join(workdir, f"{prefix}-{i}.pkl") for i in range(count)]
+    sizes = [0] * count
+    files = [open(path, 'wb') for path in paths]
+    try:
+        for positions, hashes, frame in items:
+            if len(frame) == 0:
+                continue
+            row_bytes = frame.memory_usage(deep=True).sum() / len(frame)
+            shift = np.uint64(PARTITION_BITS * depth)
+            buckets = (hashes >> shift) & np.uint64(count - 1)
+            order = np.argsort(buckets, kind='stable')
+            bounds = np.searchsorted(buckets[order], np.arange(count + 1))
+            for index in range(count):
+                rows = order[bounds[index]:bounds[index + 1]]
+                if len(rows) == 0:
+                    continue
+                pickle.dump((positions[rows], hashes[rows], frame.iloc[rows]),
+                            files[index], protocol=pickle.HIGHEST_PROTOCOL)
+                sizes[index] += int(row_bytes * len(rows))
+    finally:
+        for f in files:
+            f.close()
+    return list(zip(paths, sizes))
+
+
+def _dedupe_partition(path: str,
+                      size: int,
+                      workdir: str,
+                      memory_limit: int,
+                      depth: int) -> List[str]:
+    """Deduplicate one partition into sorted survivor files."""
+    if size == 0:
+        os.remove(path)
+        return []
+    splittable = PARTITION_BITS * (depth + 2) <= 64
+    if size > memory_limit and splittable:
+        logger.debug(f"Splitting spill partition {path} of {size} bytes")
+        prefix = os.path.basename(path)[:-len('.pkl')]
+        partitions = _partition(_read_spill(path), workdir, prefix, depth + 1)
+        os.remove(path)
+        leaves: List[str] = []
+        for sub_path, sub_size in partitions:
+            leaves.extend(
+                _dedupe_partition(sub_path, sub_size, workdir, memory_limit, depth + 1)
+            )
+        return leaves
+    
+    if size > memory_limit:
+        # Every row left shares its full 64-bit hash; fold frames in one at
+        # a time so only distinct rows are held
+        positions, unique = np.empty(0, dtype=np.int64), None
+        for part_positions, _, part in _read_spill(path):
+            frame = part if unique is None else pd.concat([unique, part])
+            both = np.concatenate([positions, part_positions])
+            keep = ~frame.duplicated().to_numpy()
+            positions, unique = both[keep], frame[keep]
+    else:
+        pieces = list(_read_spill(path))
+        frame = pd.concat([part for _, _, part in pieces])
+        keep = ~frame.duplicated().to_numpy()
+        positions = np.concatenate([pos for pos, _, _ in pieces])[keep]
+        unique = frame[keep]
+    os.remove(path)
+    
+    output = path[:-len('.pkl')] + '.out.pkl'
+    with open(output, 'wb') as f:
+        for start in range(0, len(unique), MERGE_ROWS):
+            pickle.dump((positions[start:start + MERGE_ROWS],
+                         unique.iloc[start:start + MERGE_ROWS]),
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+    return [output]
+
+
+def _read_spill(path: str) -> Iterator[Any]:
+    """Read back the tuples pickled into a spill file."""
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+def _merge_round(paths: List[str], workdir: str, prefix: str) -> List[str]:
+    """Merge survivor files in groups of ``MERGE_FAN_IN`` into fewer files."""
+    outputs = []
+    for index, start in enumerate(range(0, len(paths), MERGE_FAN_IN)):
+        group = paths[start:start + MERGE_FAN_IN]
+        output = os.path.join(workdir, f"{prefix}-{index}.out.pkl")
+        with open(output, 'wb') as f:
+            for item in _merge([_read_spill(path) for path in group]):
+                pickle.dump(item, f, protocol=pickle.HIGHEST_PROTOCOL)
+        for path in group:
+            os.remove(path)
+        outputs.append(output)
+    return outputs
+
+
+def _merge(streams: List[Iterator[Positioned]]) -> Iterator[Positioned]:
+    """Merge streams sorted by position into one stream in position order."""
+    heads = [next(stream, None) for stream in streams]
+    while True:
+        active = [i for i, head in enumerate(heads) if head is not None]
+        if not active:
+            return
+        # Emit one window of input positions, starting at the first pending row
+        end = min(heads[i][0][0] for i in active) + MERGE_ROWS
+        positions, frames = [], []
+        for i in active:
+            while heads[i] is not None:
+                head_positions, head = heads[i]
+                cut = int(np.searchsorted(head_positions, end))
+                if cut:
+                    positions.append(head_positions[:cut])
+                    frames.append(head.iloc[:cut])
+                if cut < len(head):
+                    heads[i] = (head_positions[cut:], head.iloc[cut:])
+                    break
+                heads[i] = next(streams[i], None)
+        merged = np.concatenate(positions)
+        order = np.argsort(merged, kind='stable')
+        yield merged[order], pd.concat(frames).iloc[order]
\ No newline at end of file
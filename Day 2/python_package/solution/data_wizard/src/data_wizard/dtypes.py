@@ -0,0 +1,130 @@
+"""
+Load-time dtype inference and downcasting for CSV input.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from data_wizard import plan
+
+logger = logging.getLogger(__name__)
+
+Schema = Dict[str, Any]
+
+
+def infer_schema(file_path: str,
+                 sample_rows: int = 10_000,
+                 category_threshold: float = 0.5) -> Schema:
+    """
+    Infer parse-time dtypes from a sample of a CSV file.
+    
+    Only string columns whose share of distinct values in the sample is at
+    most ``category_threshold`` are mapped (to ``category``). Numeric widths
+    are not taken from the sample, because the parser silently wraps values
+    that do not fit a narrow integer dtype; ``downcast`` narrows them after
+    the load from the actual value ranges instead.
+    
+    Args:
+        file_path: Path to the CSV file
+        sample_rows: Number of leading rows to sample
+        category_threshold: Maximum ratio of distinct to non-null values
+        
+    Returns:
+        Mapping of column names to dtypes, suitable for ``read_csv(dtype=)``
+    """
+    sample = pd.read_csv(file_path, nrows=sample_rows)
+    schema: Schema = {}
+    for column in sample.columns:
+        series = sample[column]
+        if not (pd.api.types.is_string_dtype(series.dtype) or
+                series.dtype == object):
+            continue
+        count = series.count()
+        if count and series.nunique() / count <= category_threshold:
+            schema[column] = 'category'
+    return schema
+
+
+def downcast(data: pd.DataFrame, skip: Optional[Schema] = None) -> pd.DataFrame:
+    """
+    Narrow numeric columns to the smallest dtype that holds every value.
+    
+    Integer columns get the narrowest signed integer type covering their
+    range, and float columns become ``float32`` only when that round-trips
+    every value exactly.
+    
+    Args:
+        data: DataFrame to downcast, modified in place
+        skip: Columns with an explicit dtype that must be kept
+        
+    Returns:
+        The same DataFrame
+    """
+    skip = skip or {}
+    for column in plan.numeric_columns(data):
+        if column in skip or not isinstance(data[column].dtype, np.dtype):
+            continue
+        values = data[column].to_numpy()
+        if values.dtype.kind in 'iu':
+            data[column] = pd.to_numeric(data[column], downcast='integer')
+        elif values.dtype == np.float64:
+            narrow = values.astype(np.float32)
+            if np.array_equal(narrow, values, equal_nan=True):
+                data[column] = narrow
+    return data
+
+
+def memory_report(before: Dict[str, int], data: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Compare the memory of a frame with its size under default dtypes.
+    
+    Args:
+        before: Bytes per column with the default dtypes
+        data: The optimized DataFrame
+        
+    Returns:
+        Dictionary with total bytes before and after, bytes saved and the
+        resulting dtype of every column
+    """
+    after = int(data.memory_usage(index=False, deep=True).sum())
+    total = sum(before.values())
+    report = {
+        'bytes_before': total,
+        'bytes_after': after,
+        'bytes_saved': total - after,
+        'dtypes': {column: str(dtype) for column, dtype in data.dtypes.items()}
+    }
+    logger.info(f"Optimized dtypes: {total} -> {after} bytes")
+    return report
+
+
+def estimate_default_memory(file_path: str,
+                            data: pd.DataFrame,
+                            sample_rows: int = 10_000) -> Dict[str, int]:
+    """
+    Estimate the per-column memory of a frame parsed with default dtypes.
+    
+    Numeric columns are measured exactly from their default 8-byte width;
+    other columns are extrapolated from a sample parsed with defaults.
+    
+    Args:
+        file_path: Path to the CSV file
+        data: The loaded DataFrame
+        sample_rows: Number of leading rows to sample
+        
+    Returns:
+        Mapping of column names to estimated bytes
+    """
+    rows = len(data)
+    sample = pd.read_csv(file_path, nrows=sample_rows, usecols=list(data.columns))
+    usage = sample.memory_usage(index=False, deep=True)
+    estimate = {}
+    for column in data.columns:
+        if plan.is_numeric(data[column].dtype):
+            estimate[column] = rows * 8
+        else:
+            estimate[column] = int(usage[column] / max(len(sample), 1) * rows)
+    return estimate
\ No newline at end of file
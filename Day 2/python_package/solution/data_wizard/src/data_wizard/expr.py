@@ -0,0 +1,391 @@
+"""
+Column expressions that compile to vectorized row masks.
+
+Expressions are built with ``col`` and Python operators and evaluated over a
+whole DataFrame at once::
+
+    (col('age') > 30) & (col('plan') == 'pro')
+    
+As with pandas masks, ``&``, ``|`` and ``~`` combine conditions and bind
+more tightly than comparisons, so each comparison needs its own
+parentheses. When ``numexpr`` is installed, purely numeric expressions are
+evaluated by it in a single multi-threaded pass without intermediate
+arrays; everything else runs as vectorized pandas operations.
+"""
+
+import abc
+import math
+import operator
+from typing import Any, Callable, Dict, Iterable, List, Set
+
+import numpy as np
+import pandas as pd
+
+try:
+    import numexpr
+except ImportError:  # pragma: no cover
+    numexpr = None
+
+BINARY_OPS: Dict[str, Callable[[Any, Any], Any]] = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '&': operator.and_,
+    '|': operator.or_,
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+}
+# Operators numexpr evaluates with the same semantics as NumPy
+NUMEXPR_OPS = {'>', '>=', '<', '<=', '==', '!=', '&', '|', '+', '-', '*'}
+# Dtypes numexpr computes in natively; it upcasts the others, so narrow and
+# unsigned integers would not wrap around on overflow as they do in pandas
+NUMEXPR_DTYPES = {
+    np.dtype(name) for name in ('bool', 'int32', 'int64', 'float32', 'float64')
+}
+
+
+class Expr(abc.ABC):
+    """Base class of expression nodes."""
+    
+    @abc.abstractmethod
+    def columns(self) -> Set[str]:
+        """
+        Return the columns the expression reads.
+        
+        Returns:
+            Set of column names
+        """
+        raise NotImplementedError
+    
+    @abc.abstractmethod
+    def evaluate(self, data: pd.DataFrame) -> Any:
+        """
+        Evaluate the expression with vectorized pandas operations.
+        
+        Args:
+            data: DataFrame holding the referenced columns
+            
+        Returns:
+            Series, array or scalar result
+        """
+        raise NotImplementedError
+    
+    def mask(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        Evaluate the expression as a boolean row mask.
+        
+        Missing values satisfy ``!=`` and no other comparison, as in pandas;
+        the missing values of nullable columns satisfy none at all.
+        
+        Args:
+            data: DataFrame holding the referenced columns
+            
+        Returns:
+            Boolean array with one entry per row
+        """
+        if numexpr is not None and self._numexpr_ready(data):
+            names = {column: f"c{i}" for i, column in enumerate(sorted(self.columns()))}
+            local_dict = {
+                name: data[column].to_numpy() for column, name in names.items()
+            }
+            result = numexpr.evaluate(self._numexpr(names), local_dict=local_dict)
+        else:
+            result = self.evaluate(data)
+        if isinstance(result, pd.Series) and not isinstance(result.dtype, np.dtype):
+            result = result.to_numpy(dtype=bool, na_value=False)
+        return np.broadcast_to(np.asarray(result, dtype=bool), (len(data),)).copy()
+    
+    def equals(self, other: Any) -> bool:
+        """
+        Check whether two expressions have the same structure.
+        
+        ``==`` builds a comparison expression instead, as in pandas.
+        
+        Args:
+            other: Object to compare with
+            
+        Returns:
+            True if both are expressions rendering to the same text
+        """
+        return type(self) is type(other) and repr(self) == repr(other)
+    
+    def isin(self, values: Iterable[Any]) -> 'Expr':
+        """Test membership in a collection of values."""
+        return IsIn(self, list(values))
+    
+    def isnull(self) -> 'Expr':
+        """Test for missing values."""
+        return IsNull(self)
+    
+    def notnull(self) -> 'Expr':
+        """Test for present values."""
+        return Not(IsNull(self))
+    
+    def between(self, low: Any, high: Any) -> 'Expr':
+        """Test ``low <= value <= high``."""
+        return (self >= low) & (self <= high)
+    
+    def _numexpr_ready(self, data: pd.DataFrame) -> bool:
+        """Check whether numexpr can evaluate this expression over data."""
+        return all(
+            data[column].dtype in NUMEXPR_DTYPES for column in self.columns()
+        ) and self._numexpr_supported()
+    
+    def _numexpr_supported(self) -> bool:
+        return False
+    
+    @abc.abstractmethod
+    def _numexpr(self, names: Dict[str, str]) -> str:
+        raise NotImplementedError
+    
+    def __bool__(self) -> bool:
+        raise TypeError(
+            "Expressions have no truth value; combine conditions with &, | "
+            "and ~ and wrap each comparison in parentheses"
+        )
+    
+    def __and__(self, other: Any) -> 'Expr':
+        return BinaryOp('&', self, other)
+    
+    def __rand__(self, other: Any) -> 'Expr':
+        return BinaryOp('&', other, self)
+    
+    def __or__(self, other: Any) -> 'Expr':
+        return BinaryOp('|', self, other)
+    
+    def __ror__(self, other: Any) -> 'Expr':
+        return BinaryOp('|', other, self)
+    
+    def __invert__(self) -> 'Expr':
+        return Not(self)
+    
+    def __gt__(self, other: Any) -> 'Expr':
+        return BinaryOp('>', self, other)
+    
+    def __ge__(self, other: Any) -> 'Expr':
+        return BinaryOp('>=', self, other)
+    
+    def __lt__(self, other: Any) -> 'Expr':
+        return BinaryOp('<', self, other)
+    
+    def __le__(self, other: Any) -> 'Expr':
+        return BinaryOp('<=', self, other)
+    
+    def __eq__(self, other: Any) -> 'Expr':  # type: ignore[override]
+        return BinaryOp('==', self, other)
+    
+    def __ne__(self, other: Any) -> 'Expr':  # type: ignore[override]
+        return BinaryOp('!=', self, other)
+    
+    def __add__(self, other: Any) -> 'Expr':
+        return BinaryOp('+', self, other)
+    
+    def __radd__(self, other: Any) -> 'Expr':
+        return BinaryOp('+', other, self)
+    
+    def __sub__(self, other: Any) -> 'Expr':
+        return BinaryOp('-', self, other)
+    
+    def __rsub__(self, other: Any) -> 'Expr':
+        return BinaryOp('-', other, self)
+    
+    def __mul__(self, other: Any) -> 'Expr':
+        return BinaryOp('*', self, other)
+    
+    def __rmul__(self, other: Any) -> 'Expr':
+        return BinaryOp('*', other, self)
+    
+    def __truediv__(self, other: Any) -> 'Expr':
+        return BinaryOp('/', self, other)
+    
+    def __rtruediv__(self, other: Any) -> 'Expr':
+        return BinaryOp('/', other, self)
+    
+    __hash__ = object.__hash__
+
+
+class Column(Expr):
+    """Reference to a column."""
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    def columns(self) -> Set[str]:
+        return {self.name}
+    
+    def evaluate(self, data: pd.DataFrame) -> Any:
+        return data[self.name]
+    
+    def _numexpr_supported(self) -> bool:
+        return True
+    
+    def _numexpr(self, names: Dict[str, str]) -> str:
+        return names[self.name]
+    
+    def __repr__(self) -> str:
+        return f"col({self.name!r})"
+
+
+class Literal(Expr):
+    """Constant value."""
+    
+    def __init__(self, value: Any):
+        self.value = value
+    
+    def columns(self) -> Set[str]:
+        return set()
+    
+    def evaluate(self, data: pd.DataFrame) -> Any:
+        return self.value
+    
+    def _numexpr_supported(self) -> bool:
+        value = self.value
+        if isinstance(value, (bool, np.bool_)):
+            return True
+        return isinstance(value, (int, float, np.integer, np.floating)) and \
+            math.isfinite(value)
+    
+    def _numexpr(self, names: Dict[str, str]) -> str:
+        value = self.value.item() if isinstance(self.value, np.generic) else self.value
+        return repr(value)
+    
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+
+class BinaryOp(Expr):
+    """Comparison, logical or arithmetic operator applied to two operands."""
+    
+    def __init__(self, op: str, left: Any, right: Any):
+        self.op = op
+        self.left = _wrap(left)
+        self.right = _wrap(right)
+    
+    def columns(self) -> Set[str]:
+        return self.left.columns() | self.right.columns()
+    
+    def evaluate(self, data: pd.DataFrame) -> Any:
+        return BINARY_OPS[self.op](self.left.evaluate(data), self.right.evaluate(data))
+    
+    def _numexpr_supported(self) -> bool:
+        return self.op in NUMEXPR_OPS and self.left._numexpr_supported() and \
+            self.right._numexpr_supported()
+    
+    def _numexpr(self, names: Dict[str, str]) -> str:
+        return f"({self.left._numexpr(names)} {self.op} {self.right._numexpr(names)})"
+    
+    def __repr__(self) -> str:
+        return f"({self.left!r} {self.op} {self.right!r})"
+
+
+class Not(Expr):
+    """Logical negation."""
+    
+    def __init__(self, operand: Expr):
+        self.operand = operand
+    
+    def columns(self) -> Set[str]:
+        return self.operand.columns()
+    
+    def evaluate(self, data: pd.DataFrame) -> Any:
+        return ~self.operand.evaluate(data)
+    
+    def _numexpr_supported(self) -> bool:
+        return self.operand._numexpr_supported()
+    
+    def _numexpr(self, names: Dict[str, str]) -> str:
+        return f"(~{self.operand._numexpr(names)})"
+    
+    def __repr__(self) -> str:
+        return f"~{self.operand!r}"
+
+
+class IsIn(Expr):
+    """Membership test against a list of values."""
+    
+    def __init__(self, operand: Expr, values: List[Any]):
+        self.operand = operand
+        self.values = values
+    
+    def columns(self) -> Set[str]:
+        return self.operand.columns()
+    
+    def evaluate(self, data: pd.DataFrame) -> Any:
+        values = self.operand.evaluate(data)
+        if isinstance(values, pd.Series):
+            return values.isin(self.values)
+        return values in self.values
+    
+    def _numexpr_supported(self) -> bool:
+        return bool(self.values) and self.operand._numexpr_supported() and \
+            all(Literal(value)._numexpr_supported() for value in self.values)
+    
+    def _numexpr(self, names: Dict[str, str]) -> str:
+        operand = self.operand._numexpr(names)
+        tests = [f"({operand} == {Literal(value)._numexpr(names)})"
+                 for value in self.values]
+        return f"({' | '.join(tests)})"
+    
+    def __repr__(self) -> str:
+        return f"{self.operand!r}.isin({self.values!r})"
+
+
+class IsNull(Expr):
+    """Missing value test."""
+    
+    def __init__(self, operand: Expr):
+        self.operand = operand
+    
+    def columns(self) -> Set[str]:
+        return self.operand.columns()
+    
+    def evaluate(self, data: pd.DataFrame) -> Any:
+        values = self.operand.evaluate(data)
+        return values.isna() if isinstance(values, pd.Series) else pd.isna(values)
+    
+    def _numexpr_supported(self) -> bool:
+        return self.operand._numexpr_supported()
+    
+    def _numexpr(self, names: Dict[str, str]) -> str:
+        # NaN is the only value that differs from itself
+        operand = self.operand._numexpr(names)
+        return f"({operand} != {operand})"
+    
+    def __repr__(self) -> str:
+        return f"{self.operand!r}.isnull()"
+
+
+def col(name: str) -> Column:
+    """
+    Reference a column in an expression.
+    
+    Args:
+        name: Column name
+        
+    Returns:
+        Column expression
+    """
+    return Column(name)
+
+
+def lit(value: Any) -> Literal:
+    """
+    Wrap a constant in an expression.
+    
+    Args:
+        value: Constant value
+        
+    Returns:
+        Literal expression
+    """
+    return Literal(value)
+
+
+def _wrap(value: Any) -> Expr:
+    """Turn plain values into literals."""
+    return value if isinstance(value, Expr) else Literal(value)
\ No newline at end of file
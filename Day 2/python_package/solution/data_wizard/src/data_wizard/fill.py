@@ -0,0 +1,513 @@
+"""
+Missing value fill strategies for ``DataProcessor.clean_data``.
+
+Every strategy fills whole columns with vectorized pandas operations:
+column statistics are computed once and applied with a single ``fillna``,
+group-wise fills run one ``groupby().transform`` over all target columns,
+and forward fills use ``ffill`` on the (optionally sorted) frame.
+
+Strategies also describe how they run chunk by chunk. ``fit`` resolves
+the values that depend on the whole stream in a pass over it, and
+``chunk_filler`` returns a function that fills consecutive chunks, carrying
+state such as the last seen value from one chunk to the next.
+"""
+
+import copy
+
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from data_wizard import plan
+
+ChunkReader = Callable[[], Iterator[pd.DataFrame]]
+Keys = Union[str, List[str]]
+
+
+class FillStrategy:
+    """Base class for fill strategies."""
+    
+    def __init__(self, columns: Optional[List[str]] = None):
+        """
+        Initialize the strategy.
+        
+        Args:
+            columns: Columns to fill, every numeric column by default
+        """
+        self.columns = list(columns) if columns is not None else None
+    
+    @property
+    def needs_pass(self) -> bool:
+        """Whether streaming needs a pass over the data to ``fit`` first."""
+        return False
+    
+    @property
+    def streamable(self) -> bool:
+        """Whether the strategy can fill a stream of chunks."""
+        return True
+    
+    def key_columns(self) -> List[str]:
+        """Return the columns read besides the filled ones."""
+        return []
+    
+    def target_columns(self, data: pd.DataFrame) -> List[str]:
+        """
+        Return the columns of ``data`` this strategy fills.
+        
+        Args:
+            data: Data to fill
+            
+        Returns:
+            Existing target columns, in the order given or in column order
+        """
+        if self.columns is not None:
+            return [c for c in self.columns if c in data.columns]
+        keys = self.key_columns()
+        return [c for c in plan.numeric_columns(data) if c not in keys]
+    
+    def column_values(self, data: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        """
+        Return one fill value per column, if the strategy has them.
+        
+        Args:
+            data: Data to fill
+            
+        Returns:
+            Dictionary mapping columns with gaps to their fill value, or
+            None when the value depends on the row
+        """
+        return None
+    
+    def fill(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fill missing values.
+        
+        Args:
+            data: Data to fill, never modified
+            
+        Returns:
+            New DataFrame with the gaps filled
+        """
+        values = self.column_values(data)
+        return plan.fill_missing(data, values) if values else data.copy()
+    
+    def fit(self, read_chunks: ChunkReader) -> 'FillStrategy':
+        """
+        Resolve the values that depend on the whole stream.
+        
+        Args:
+            read_chunks: Function returning a new iterator over the chunks
+            
+        Returns:
+            Strategy that fills chunks without another pass
+        """
+        return self
+    
+    def chunk_filler(self) -> Callable[[pd.DataFrame], pd.DataFrame]:
+        """
+        Return a function that fills consecutive chunks of one stream.
+        
+        Returns:
+            Function mapping each chunk to its filled copy
+        """
+        return self.fill
+    
+    def __repr__(self) -> str:
+        columns = "" if self.columns is None else repr(self.columns)
+        return f"{type(self).__name__}({columns})"
+
+
+class ConstantFill(FillStrategy):
+    """Fill missing values with a constant per column."""
+    
+    def __init__(self, values: Any, columns: Optional[List[str]] = None):
+        """
+        Initialize the strategy.
+        
+        Args:
+            values: Fill value for every target column, or a dictionary
+                mapping columns to their fill value
+            columns: Columns to fill when ``values`` is a single value,
+                every numeric column by default
+        """
+        if isinstance(values, dict):
+            columns = list(values)
+        super().__init__(columns)
+        self.values = values
+    
+    def column_values(self, data: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        if isinstance(self.values, dict):
+            return {c: self.values[c] for c in self.target_columns(data)}
+        return {c: self.values for c in self.target_columns(data)}
+    
+    def __repr__(self) -> str:
+        if isinstance(self.values, dict) or self.columns is None:
+            return f"ConstantFill({self.values!r})"
+        return f"ConstantFill({self.values!r}, {self.columns!r})"
+
+
+class MeanFill(FillStrategy):
+    """Fill missing values with the column mean."""
+    
+    @property
+    def needs_pass(self) -> bool:
+        return True
+    
+    def column_values(self, data: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        columns = [c for c in self.target_columns(data) if data[c].hasnans]
+        return data[columns].mean().to_dict()
+    
+    def fit(self, read_chunks: ChunkReader) -> FillStrategy:
+        means = plan.stream_means(read_chunks())
+        if self.columns is not None:
+            means = {c: means[c] for c in self.columns if c in means}
+        return ConstantFill(means)
+
+
+class MedianFill(FillStrategy):
+    """Fill missing values with the column median."""
+    
+    @property
+    def streamable(self) -> bool:
+        return False
+    
+    def column_values(self, data: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        columns = [c for c in self.target_columns(data) if data[c].hasnans]
+        return data[columns].median().to_dict()
+
+
+class GroupFill(FillStrategy):
+    """
+    Fill missing values with the mean or median of the row's group.
+    
+    Group statistics of all target columns come from a single
+    ``groupby().transform`` pass. Rows whose group has no value at all, or
+    whose key is missing, fall back to the statistic of the whole column.
+    """
+    
+    METHODS = ('mean', 'median')
+    
+    def __init__(self,
+                 by: Keys,
+                 how: str = 'mean',
+                 columns: Optional[List[str]] = None,
+                 fallback: bool = True,
+                 values: Optional[pd.DataFrame] = None):
+        """
+        Initialize the strategy.
+        
+        Args:
+            by: Column or columns that define the groups
+            how: Group statistic, 'mean' or 'median'
+            columns: Columns to fill, every numeric non-key column by default
+            fallback: Whether to fill what is left with the column statistic
+            values: Resolved fill values indexed by group, computed at run
+                time when None
+                
+        Raises:
+            ValueError: If ``how`` is not a supported statistic
+        """
+        if how not in self.METHODS:
+            raise ValueError(
+                f"Unknown group fill method '{how}', use one of {self.METHODS}"
+            )
+        super().__init__(columns)
+        self.by = [by] if isinstance(by, str) else list(by)
+        self.how = how
+        self.fallback = fallback
+        self.values = values
+    
+    @property
+    def needs_pass(self) -> bool:
+        return self.values is None
+    
+    @property
+    def streamable(self) -> bool:
+        return self.values is not None or self.how == 'mean'
+    
+    def key_columns(self) -> List[str]:
+        return list(self.by)
+    
+    def fill(self, data: pd.DataFrame) -> pd.DataFrame:
+        result = data.copy()
+        columns = [c for c in self.target_columns(data) if data[c].hasnans]
+        if not columns:
+            return result
+        
+        if self.values is None:
+            grouped = data.groupby(self.by, sort=False)[columns].transform(self.how)
+        else:
+            grouped = self._lookup(data, columns)
+        filled = data[columns].fillna(grouped)
+        if self.fallback:
+            filled = filled.fillna(getattr(data[columns], self.how)())
+        result[columns] = filled
+        return result
+    
+    def fit(self, read_chunks: ChunkReader) -> FillStrategy:
+        sums: Optional[pd.DataFrame] = None
+        counts: Optional[pd.DataFrame] = None
+        # Column totals over all rows, including those with a missing key
+        totals: Optional[pd.Series] = None
+        present: Optional[pd.Series] = None
+        for chunk in read_chunks():
+            columns = self.target_columns(chunk)
+            grouped = chunk.groupby(self.by)[columns]
+            chunk_sums, chunk_counts = grouped.sum(), grouped.count()
+            chunk_totals, chunk_present = chunk[columns].sum(), chunk[columns].count()
+            if sums is None:
+                sums, counts = chunk_sums, chunk_counts
+                totals, present = chunk_totals, chunk_present
+            else:
+                sums = sums.add(chunk_sums, fill_value=0)
+                counts = counts.add(chunk_counts, fill_value=0)
+                totals = totals.add(chunk_totals, fill_value=0)
+                present = present.add(chunk_present, fill_value=0)
+        if sums is None:
+            return self
+        
+        columns = list(sums.columns)
+        resolved = GroupFill(self.by, self.how, columns, fallback=False,
+                             values=sums / counts.replace(0, np.nan))
+        if not self.fallback:
+            return resolved
+        means = (totals / present)[present > 0]
+        return CombinedFill([resolved, ConstantFill(means.to_dict())])
+    
+    def _lookup(self, data: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """Look up the resolved group values of every row."""
+        if len(self.by) == 1:
+            keys = pd.Index(data[self.by[0]])
+        else:
+            keys = pd.MultiIndex.from_frame(data[self.by])
+        values = self.values.reindex(columns=columns).reindex(keys)
+        return values.set_axis(data.index)
+    
+    def __repr__(self) -> str:
+        by = self.by[0] if len(self.by) == 1 else self.by
+        columns = "" if self.columns is None else f", {self.columns!r}"
+        return f"GroupFill({by!r}, {self.how!r}{columns})"
+
+
+class ForwardFill(FillStrategy):
+    """
+    Fill missing values with the last earlier value.
+    
+    With ``order_by`` rows are visited in the order of that column, such
+    as a timestamp, and with ``by`` values are only carried within a group.
+    The rows keep their original order either way.
+    """
+    
+    def __init__(self,
+                 columns: Optional[List[str]] = None,
+                 by: Optional[Keys] = None,
+                 order_by: Optional[str] = None):
+        """
+        Initialize the strategy.
+        
+        Args:
+            columns: Columns to fill, every non-key column by default
+            by: Optional column or columns that define the groups
+            order_by: Optional column giving the order of the rows
+        """
+        super().__init__(columns)
+        self.by = [by] if isinstance(by, str) else list(by or [])
+        self.order_by = order_by
+    
+    @property
+    def streamable(self) -> bool:
+        return self.order_by is None
+    
+    def key_columns(self) -> List[str]:
+        return self.by + ([self.order_by] if self.order_by else [])
+    
+    def target_columns(self, data: pd.DataFrame) -> List[str]:
+        if self.columns is not None:
+            return super().target_columns(data)
+        keys = self.key_columns()
+        return [c for c in data.columns if c not in keys]
+    
+    def fill(self, data: pd.DataFrame) -> pd.DataFrame:
+        result = data.copy()
+        columns = self.target_columns(data)
+        if not columns:
+            return result
+        
+        order = None
+        if self.order_by is not None:
+            order = np.argsort(data[self.order_by].to_numpy(), kind='stable')
+            data = data.iloc[order]
+        filled = self._ffill(data, columns)
+        if order is not None:
+            inverse = np.empty_like(order)
+            inverse[order] = np.arange(len(order))
+            filled = filled.iloc[inverse]
+        result[columns] = filled.set_axis(result.index)
+        return result
+    
+    def chunk_filler(self) -> Callable[[pd.DataFrame], pd.DataFrame]:
+        last: Optional[Union[pd.Series, pd.DataFrame]] = None
+        
+        def fill_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+            nonlocal last
+            columns = self.target_columns(chunk)
+            if not columns or chunk.empty:
+                return chunk
+            filled = self._ffill(chunk, columns)
+            if not self.by:
+                if last is not None:
+                    filled = filled.fillna(last)
+                last = filled.iloc[-1]
+            else:
+                if last is not None:
+                    keys = self._keys(chunk)
+                    filled = filled.fillna(last.reindex(keys).set_axis(chunk.index))
+                tails = pd.concat([chunk[self.by], filled], axis=1)\
+                    .groupby(self.by).last()
+                last = tails if last is None else tails.combine_first(last)
+            result = chunk.copy()
+            result[columns] = filled
+            return result
+        return fill_chunk
+    
+    def _ffill(self, data: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """Forward fill the columns, within groups when ``by`` is set."""
+        if self.by:
+            return data.groupby(self.by, sort=False)[columns].ffill()
+        return data[columns].ffill()
+    
+    def _keys(self, data: pd.DataFrame) -> pd.Index:
+        """Return the group key of every row as an index."""
+        if len(self.by) == 1:
+            return pd.Index(data[self.by[0]])
+        return pd.MultiIndex.from_frame(data[self.by])
+    
+    def __repr__(self) -> str:
+        args = [] if self.columns is None else [repr(self.columns)]
+        if self.by:
+            args.append(f"by={self.by!r}")
+        if self.order_by is not None:
+            args.append(f"order_by={self.order_by!r}")
+        return f"ForwardFill({', '.join(args)})"
+
+
+class CombinedFill(FillStrategy):
+    """Apply several strategies in turn, each to the gaps the earlier ones left."""
+    
+    def __init__(self, strategies: List[FillStrategy]):
+        """
+        Initialize the strategy.
+        
+        Args:
+            strategies: Strategies in the order they are applied
+        """
+        super().__init__()
+        self.strategies = list(strategies)
+    
+    @property
+    def needs_pass(self) -> bool:
+        return any(s.needs_pass for s in self.strategies)
+    
+    @property
+    def streamable(self) -> bool:
+        return all(s.streamable for s in self.strategies)
+    
+    def key_columns(self) -> List[str]:
+        return [c for s in self.strategies for c in s.key_columns()]
+    
+    def column_values(self, data: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        values: Dict[str, Any] = {}
+        for strategy in self.strategies:
+            resolved = strategy.column_values(data)
+            if resolved is None:
+                return None
+            for column, value in resolved.items():
+                values.setdefault(column, value)
+        return values
+    
+    def fill(self, data: pd.DataFrame) -> pd.DataFrame:
+        values = self.column_values(data)
+        if values is not None:
+            return plan.fill_missing(data, values)
+        for strategy in self.strategies:
+            data = strategy.fill(data)
+        return data
+    
+    def fit(self, read_chunks: ChunkReader) -> FillStrategy:
+        fitted: List[FillStrategy] = []
+        for strategy in self.strategies:
+            if strategy.needs_pass:
+                earlier = CombinedFill(fitted)
+                strategy = strategy.fit(
+                    lambda: map(earlier.chunk_filler(), read_chunks())
+                )
+            fitted.append(strategy)
+        return CombinedFill(fitted)
+    
+    def chunk_filler(self) -> Callable[[pd.DataFrame], pd.DataFrame]:
+        fillers = [s.chunk_filler() for s in self.strategies]
+        
+        def fill_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+            for filler in fillers:
+                chunk = filler(chunk)
+            return chunk
+        return fill_chunk
+    
+    def __repr__(self) -> str:
+        return f"CombinedFill({self.strategies!r})"
+
+
+STRATEGIES = {
+    'mean': MeanFill,
+    'median': MedianFill,
+    'ffill': ForwardFill,
+}
+
+FillSpec = Union[str, FillStrategy, Dict[str, Any], float]
+
+
+def as_strategy(spec: FillSpec) -> FillStrategy:
+    """
+    Turn a fill specification into a strategy.
+    
+    Args:
+        spec: Strategy name ('mean', 'median' or 'ffill'), a strategy, a
+            constant for every numeric column, or a dictionary mapping
+            columns to any of these; in a dictionary, other strings are
+            constants and strategies apply to their key's column
+            
+    Returns:
+        Fill strategy
+        
+    Raises:
+        ValueError: If a strategy name is unknown, or a strategy in a
+            dictionary targets columns other than its key
+    """
+    if isinstance(spec, dict):
+        return CombinedFill([
+            _for_column(column, value) for column, value in spec.items()
+        ])
+    if isinstance(spec, FillStrategy):
+        return spec
+    if isinstance(spec, str):
+        if spec not in STRATEGIES:
+            raise ValueError(
+                f"Unknown fill strategy '{spec}', use one of {list(STRATEGIES)}"
+            )
+        return STRATEGIES[spec]()
+    return ConstantFill(spec)
+
+
+def _for_column(column: str, spec: Any) -> FillStrategy:
+    """Resolve the fill specification of a single column."""
+    if isinstance(spec, FillStrategy) or (isinstance(spec, str) and spec in STRATEGIES):
+        strategy = copy.copy(as_strategy(spec))
+        if strategy.columns is None:
+            strategy.columns = [column]
+        elif strategy.columns != [column]:
+            raise ValueError(
+                f"Fill strategy {strategy!r} for column '{column}' "
+                f"targets other columns {strategy.columns}"
+            )
+        return strategy
+    return ConstantFill({column: spec})
\ No newline at end of file
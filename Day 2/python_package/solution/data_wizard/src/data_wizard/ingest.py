@@ -0,0 +1,202 @@
+"""
+Concurrent ingestion of many CSV files.
+"""
+
+import glob
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from data_wizard.utils import validate_file_path
+
+logger = logging.getLogger(__name__)
+
+Sources = Union[str, List[str]]
+
+
+class FileResult:
+    """Outcome of loading a single file."""
+    
+    def __init__(self,
+                 path: str,
+                 rows: int = 0,
+                 seconds: float = 0.0,
+                 error: Optional[str] = None):
+        """
+        Initialize the result.
+        
+        Args:
+            path: Path of the file
+            rows: Number of rows parsed
+            seconds: Time spent validating and parsing the file
+            error: Error message if the file could not be loaded
+        """
+        self.path = path
+        self.rows = rows
+        self.seconds = seconds
+        self.error = error
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the file was loaded."""
+        return self.error is None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a JSON-serializable dictionary."""
+        return {'path': self.path, 'rows': self.rows,
+                'seconds': self.seconds, 'error': self.error}
+    
+    def __repr__(self) -> str:
+        status = 'ok' if self.ok else f"error={self.error!r}"
+        return f"FileResult({self.path!r}, rows={self.rows}, {status})"
+
+
+Loaded = Tuple[FileResult, Optional[pd.DataFrame]]
+
+
+class LoadReport:
+    """Per-file timings and failures of a multi-file load."""
+    
+    def __init__(self) -> None:
+        self.files: List[FileResult] = []
+    
+    @property
+    def succeeded(self) -> List[FileResult]:
+        """Results of the files that were loaded."""
+        return [f for f in self.files if f.ok]
+    
+    @property
+    def failed(self) -> List[FileResult]:
+        """Results of the files that could not be loaded."""
+        return [f for f in self.files if not f.ok]
+    
+    @property
+    def rows(self) -> int:
+        """Total number of rows loaded."""
+        return sum(f.rows for f in self.files)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the report in a form suitable for ``save_json_report``.
+        
+        Returns:
+            Dictionary with file counts, total rows and parse time, and the
+            per-file results
+        """
+        return {
+            'files': len(self.files),
+            'succeeded': len(self.succeeded),
+            'failed': len(self.failed),
+            'rows': self.rows,
+            'seconds': sum(f.seconds for f in self.files),
+            'results': [f.to_dict() for f in self.files]
+        }
+
+
+def expand_paths(glob_or_paths: Sources) -> List[str]:
+    """
+    Expand a glob pattern or a list of paths.
+    
+    Args:
+        glob_or_paths: Glob pattern (``**`` recurses) or list of paths
+        
+    Returns:
+        Sorted matches of the pattern, or the list as given
+    """
+    if isinstance(glob_or_paths, (str, os.PathLike)):
+        pattern = os.fspath(glob_or_paths)
+        if glob.has_magic(pattern):
+            return sorted(glob.glob(pattern, recursive=True))
+        return [pattern]
+    return [os.fspath(path) for path in glob_or_paths]
+
+
+def iter_files(glob_or_paths: Sources,
+               max_workers: Optional[int] = None,
+               readahead: Optional[int] = None,
+               report: Optional[LoadReport] = None,
+               **read_csv_kwargs: Any) -> Iterator[Loaded]:
+    """
+    Validate and parse files on a thread pool, yielding them in input order.
+    
+    At most ``readahead`` files are parsed ahead of the consumer, which
+    bounds memory however many files there are. A file that fails is
+    reported with its error and yields no frame; the batch continues.
+    
+    Args:
+        glob_or_paths: Glob pattern or list of paths
+        max_workers: Number of threads, defaults to the thread pool default
+        readahead: Maximum number of files parsed but not yet consumed,
+            twice the number of threads by default
+        report: Optional report that collects the per-file results
+        **read_csv_kwargs: Extra arguments for ``pd.read_csv``
+        
+    Yields:
+        (result, frame) pairs, with frame None for failed files
+    """
+    paths = iter(expand_paths(glob_or_paths))
+    max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    readahead = readahead or 2 * max_workers
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Deque[Future] = deque(
+            executor.submit(_read_file, path, read_csv_kwargs)
+            for _, path in zip(range(readahead), paths)
+        )
+        try:
+            while pending:
+                result, frame = pending.popleft().result()
+                path = next(paths, None)
+                if path is not None:
+                    pending.append(executor.submit(_read_file, path, read_csv_kwargs))
+                if report is not None:
+                    report.files.append(result)
+                yield result, frame
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def load_many(glob_or_paths: Sources,
+              max_workers: Optional[int] = None,
+              readahead: Optional[int] = None,
+              **read_csv_kwargs: Any) -> Tuple[pd.DataFrame, LoadReport]:
+    """
+    Load many CSV files concurrently into one DataFrame.
+    
+    Args:
+        glob_or_paths: Glob pattern or list of paths
+        max_workers: Number of threads
+        readahead: Maximum number of files parsed ahead of the concatenation
+        **read_csv_kwargs: Extra arguments for ``pd.read_csv``
+        
+    Returns:
+        Tuple of the concatenated rows of all loaded files, in input order
+        with a fresh index, and the load report
+    """
+    report = LoadReport()
+    frames = [
+        frame for _, frame in iter_files(glob_or_paths, max_workers, readahead,
+                                         report, **read_csv_kwargs)
+        if frame is not None
+    ]
+    data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    return data, report
+
+
+def _read_file(path: str,
+               read_csv_kwargs: Dict[str, Any]) -> Loaded:
+    """Validate and parse one file, capturing any error."""
+    start = time.perf_counter()
+    try:
+        if not validate_file_path(path):
+            raise ValueError(f"Invalid file path: {path}")
+        frame = pd.read_csv(path, **read_csv_kwargs)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Skipping {path}: {str(e)}")
+        return FileResult(path, seconds=time.perf_counter() - start, error=str(e)), None
+    return FileResult(path, len(frame), time.perf_counter() - start), frame
\ No newline at end of file
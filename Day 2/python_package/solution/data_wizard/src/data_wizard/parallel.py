@@ -0,0 +1,354 @@
+"""
+Multi-core execution of DataProcessor pipelines over partitioned CSV input.
+"""
+
+import io
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from data_wizard import dedupe, plan
+from data_wizard.expr import Expr
+from data_wizard.fill import FillSpec, as_strategy
+from data_wizard.utils import validate_file_path
+
+Partition = Tuple[str, int, Optional[int]]
+
+
+class ParallelProcessor:
+    """
+    Fluent DataProcessor-style pipeline that runs on a process pool.
+    
+    The input is split into partitions, one per file or one per byte range
+    of a large file (aligned to line boundaries, so fields must not contain
+    embedded newlines). Each worker parses its partition and runs the
+    partition-local part of the optimized plan: filters, column selection
+    and a first round of duplicate removal. The parent concatenates the
+    partitions in input order and runs the rest of the plan, starting with
+    a global duplicate removal and the first mean fill, so the result
+    matches the serial ``DataProcessor`` path row for row.
+    
+    Filter conditions are shipped to the workers and must be picklable,
+    e.g. module-level functions or ``functools.partial`` objects.
+    """
+    
+    def __init__(self,
+                 sources: Union[str, List[str]],
+                 max_workers: Optional[int] = None,
+                 partition_bytes: Optional[int] = None,
+                 spill_dir: Optional[str] = None,
+                 memory_limit: int = dedupe.MEMORY_LIMIT):
+        """
+        Initialize the ParallelProcessor.
+        
+        Args:
+            sources: Path or list of paths to CSV files sharing one header
+            max_workers: Number of worker processes, defaults to CPU count
+            partition_bytes: Target partition size; by default a single file
+                is split into one partition per worker and several files
+                are split one partition per file
+            spill_dir: Directory for out-of-core deduplication spill files,
+                the system temporary directory by default
+            memory_limit: Bytes of rows the out-of-core deduplication
+                holds in memory at once, in each worker
+                
+        Raises:
+            ValueError: If a path is invalid or the headers differ
+        """
+        self.sources = [sources] if isinstance(sources, str) else list(sources)
+        if not self.sources:
+            raise ValueError("At least one source file is required")
+        for path in self.sources:
+            if not validate_file_path(path):
+                raise ValueError(f"Invalid file path: {path}")
+        
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.partition_bytes = partition_bytes
+        self.spill_dir = spill_dir
+        self.memory_limit = memory_limit
+        self._columns = list(pd.read_csv(self.sources[0], nrows=0).columns)
+        for path in self.sources[1:]:
+            if list(pd.read_csv(path, nrows=0).columns) != self._columns:
+                raise ValueError(f"Header of {path} does not match {self.sources[0]}")
+        self._plan: List[plan.Step] = []
+    
+    def clean_data(self,
+                   drop_duplicates: bool = True,
+                   fill_numeric: bool = True,
+                   out_of_core: bool = False,
+                   fill: Optional[FillSpec] = None) -> 'ParallelProcessor':
+        """
+        Clean the data, see ``DataProcessor.clean_data``.
+        
+        Fills run on the combined data after the partition-local steps.
+        
+        Args:
+            drop_duplicates: Whether to remove duplicate rows
+            fill_numeric: Whether to fill missing numeric values with mean
+            out_of_core: Whether to deduplicate through spill files
+            fill: Optional fill strategy used instead of the mean
+            
+        Returns:
+            self for method chaining
+        """
+        if drop_duplicates:
+            self._plan.append(
+                plan.DropDuplicates(out_of_core, self.spill_dir, self.memory_limit))
+        if fill is not None:
+            self._plan.append(plan.Fill(as_strategy(fill)))
+        elif fill_numeric:
+            self._plan.append(plan.FillMean())
+        return self
+    
+    def filter_by_column(self,
+                         column: str,
+                         condition: callable) -> 'ParallelProcessor':
+        """
+        Filter data based on a condition for a specific column.
+        
+        Args:
+            column: Column name to filter on
+            condition: Picklable callable that takes a series and returns a
+                boolean mask
+                
+        Returns:
+            self for method chaining
+            
+        Raises:
+            ValueError: If the column doesn't exist or the condition cannot
+                be sent to a worker process
+        """
+        if column not in plan.output_columns(self._plan, self._columns):
+            raise ValueError(f"Column {column} not found in data.")
+        try:
+            pickle.dumps(condition)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise ValueError(
+                f"Condition for {column} must be picklable to run in parallel: {e}"
+            )
+        
+        self._plan.append(plan.Filter([(column, condition)]))
+        return self
+    
+    def filter(self, expression: Expr) -> 'ParallelProcessor':
+        """
+        Filter data with a column expression.
+        
+        Args:
+            expression: Boolean expression built with ``col``
+            
+        Returns:
+            self for method chaining
+            
+        Raises:
+            ValueError: If a column doesn't exist
+        """
+        missing = sorted(expression.columns() -
+                         set(plan.output_columns(self._plan, self._columns)))
+        if missing:
+            raise ValueError(f"Columns not found in data: {missing}")
+        
+        self._plan.append(plan.Filter([expression]))
+        return self
+    
+    def select_columns(self, columns: List[str]) -> 'ParallelProcessor':
+        """
+        Keep only the given columns.
+        
+        Args:
+            columns: Column names to keep, in output order
+            
+        Returns:
+            self for method chaining
+            
+        Raises:
+            ValueError: If a column doesn't exist
+        """
+        available = plan.output_columns(self._plan, self._columns)
+        missing = [c for c in columns if c not in available]
+        if missing:
+            raise ValueError(f"Columns {missing} not found in data.")
+        
+        self._plan.append(plan.Select(columns))
+        return self
+    
+    def collect(self) -> pd.DataFrame:
+        """
+        Run the pipeline and return the combined DataFrame.
+        
+        Returns:
+            The processed DataFrame, indexed like the serial result
+        """
+        local_steps, global_steps = self._split_plan()
+        results = self._map(local_steps, summarize=False)
+        
+        frames, offset = [], 0
+        for frame, row_count in results:
+            frame.index = frame.index + offset
+            frames.append(frame)
+            offset += row_count
+        data = pd.concat(frames) if frames else pd.DataFrame(
+            columns=plan.output_columns(self._plan, self._columns))
+        return plan.execute(data, global_steps)
+    
+    def save_csv(self, file_path: str) -> None:
+        """
+        Save the processed data to a CSV file.
+        
+        Args:
+            file_path: Path where to save the CSV file
+        """
+        self.collect().to_csv(file_path, index=False)
+    
+    def get_summary(self) -> Dict[str, Any]:
+        """
+        Get a summary of the processed data.
+        
+        When the whole plan is partition-local the workers summarize their
+        own partitions and only the summaries are merged.
+        
+        Returns:
+            Dictionary in the format of ``DataProcessor.get_summary``
+        """
+        local_steps, global_steps = self._split_plan()
+        if global_steps:
+            return summarize(self.collect())
+        
+        return merge_summaries([
+            summary for summary, _ in self._map(local_steps, summarize=True)
+        ])
+    
+    def _split_plan(self) -> Tuple[List[plan.Step], List[plan.Step]]:
+        """Split the optimized plan into partition-local and global parts."""
+        steps = plan.optimize(self._plan)
+        local_steps: List[plan.Step] = []
+        for step in steps:
+            deduplicated = any(isinstance(s, plan.DropDuplicates) for s in local_steps)
+            if isinstance(step, (plan.FillMean, plan.Fill)) or (
+                    isinstance(step, plan.Select) and deduplicated):
+                break
+            local_steps.append(step)
+        
+        global_steps = steps[len(local_steps):]
+        dedupes = [s for s in local_steps if isinstance(s, plan.DropDuplicates)]
+        if dedupes:
+            global_steps = [dedupes[0]] + global_steps
+        return local_steps, global_steps
+    
+    def _partitions(self) -> List[Partition]:
+        """Split the sources into (path, start, end) byte ranges."""
+        partitions: List[Partition] = []
+        for path in self.sources:
+            size = os.path.getsize(path)
+            target = self.partition_bytes
+            if target is None:
+                target = size if len(self.sources) > 1 else -(-size // self.max_workers)
+            partitions.extend(split_file(path, max(target, 1)))
+        return partitions
+    
+    def _map(self, steps: List[plan.Step], summarize: bool) -> List[Any]:
+        """Run the partition-local steps on every partition."""
+        usecols = plan.required_columns(plan.optimize(self._plan), self._columns)
+        tasks = [
+            (path, start, end, self._columns, usecols, steps, summarize)
+            for path, start, end in self._partitions()
+        ]
+        if self.max_workers == 1 or len(tasks) == 1:
+            return [_run_partition(task) for task in tasks]
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(_run_partition, tasks))
+
+
+def split_file(path: str, partition_bytes: int) -> List[Partition]:
+    """
+    Split a CSV file into byte ranges that start and end on line boundaries.
+    
+    Args:
+        path: Path to the CSV file
+        partition_bytes: Target size of each range
+        
+    Returns:
+        List of (path, start, end) tuples; the header is excluded and the
+        last range ends at None (end of file)
+    """
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        f.readline()
+        start = f.tell()
+        ranges: List[Partition] = []
+        while start < size:
+            f.seek(min(start + partition_bytes, size))
+            if f.tell() < size:
+                f.readline()
+            end = f.tell()
+            ranges.append((path, start, None if end >= size else end))
+            start = end
+    return ranges or [(path, start, None)]
+
+
+def _run_partition(task: Tuple) -> Tuple[Any, int]:
+    """Parse one partition and apply the partition-local steps."""
+    path, start, end, columns, usecols, steps, want_summary = task
+    with open(path, 'rb') as f:
+        f.seek(start)
+        raw = f.read() if end is None else f.read(end - start)
+    data = pd.read_csv(io.BytesIO(raw), header=None, names=columns,
+                       usecols=usecols) if raw.strip() else \
+        pd.DataFrame(columns=usecols)
+    row_count = len(data)
+    result = plan.execute(data, steps)
+    if want_summary:
+        return summarize(result), row_count
+    return result, row_count
+
+
+def summarize(data: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Summarize a DataFrame in the format of ``DataProcessor.get_summary``.
+    
+    Args:
+        data: Data to summarize
+        
+    Returns:
+        Dictionary containing summary statistics
+    """
+    numeric_cols = plan.numeric_columns(data)
+    return {
+        'row_count': len(data),
+        'column_count': len(data.columns),
+        'numeric_columns': list(numeric_cols),
+        'categorical_columns': list(set(data.columns) - set(numeric_cols)),
+        'missing_values': {k: int(v) for k, v in data.isnull().sum().items()}
+    }
+
+
+def merge_summaries(summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine summaries of disjoint partitions.
+    
+    A column counts as numeric only if it is numeric in every non-empty
+    partition.
+    
+    Args:
+        summaries: Per-partition summaries in the ``summarize`` format
+        
+    Returns:
+        Summary of the concatenated partitions
+    """
+    first = summaries[0]
+    columns = list(first['missing_values'])
+    typed = [s for s in summaries if s['row_count']] or summaries
+    numeric = [c for c in typed[0]['numeric_columns']
+               if all(c in s['numeric_columns'] for s in typed[1:])]
+    return {
+        'row_count': sum(s['row_count'] for s in summaries),
+        'column_count': first['column_count'],
+        'numeric_columns': numeric,
+        'categorical_columns': list(set(columns) - set(numeric)),
+        'missing_values': {
+            c: sum(s['missing_values'][c] for s in summaries) for c in columns
+        }
+    }
\ No newline at end of file
@@ -0,0 +1,566 @@
+"""
+Logical query plans for lazy and streaming DataProcessor pipelines.
+
+A plan is a list of steps recorded by the fluent ``DataProcessor`` calls.
+``optimize`` rewrites it, ``required_columns`` prunes the columns that have
+to be read, and ``execute`` / ``iter_execute`` run it in memory or chunk by
+chunk.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+)
+
+from data_wizard import dedupe
+from data_wizard.expr import Expr
+
+if TYPE_CHECKING:
+    from data_wizard.fill import FillStrategy
+
+Predicate = Union[Tuple[str, Callable], Expr]
+
+
+def is_numeric(dtype: Any) -> bool:
+    """
+    Check whether a dtype is numeric for cleaning and summaries.
+    
+    Integers and floats of every width count, including nullable and
+    downcast ones; booleans, categories and timedeltas do not.
+    
+    Args:
+        dtype: Column dtype
+        
+    Returns:
+        True for integer and floating dtypes
+    """
+    return (pd.api.types.is_integer_dtype(dtype) or
+            pd.api.types.is_float_dtype(dtype))
+
+
+def numeric_columns(data: pd.DataFrame) -> List[str]:
+    """
+    Return the numeric columns of a DataFrame in column order.
+    
+    Args:
+        data: DataFrame to inspect
+        
+    Returns:
+        Names of the columns with a numeric dtype
+    """
+    return [column for column, dtype in data.dtypes.items() if is_numeric(dtype)]
+
+
+def fill_missing(data: pd.DataFrame, values: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Fill missing values per column, like ``fillna`` with a dictionary.
+    
+    Nullable integer columns cannot hold a fractional value such as a
+    mean, so they are cast to nullable floats first when their fill value
+    has a fractional part. The cast depends only on the dtype and the value,
+    so every chunk of a stream gets the same dtype.
+    
+    Args:
+        data: Data to fill, never modified
+        values: Fill value per column
+        
+    Returns:
+        New DataFrame with the gaps filled
+    """
+    cast = {
+        column: 'Float64' for column, value in values.items()
+        if column in data.columns
+        and isinstance(data[column].dtype, pd.api.extensions.ExtensionDtype)
+        and pd.api.types.is_integer_dtype(data[column].dtype)
+        and pd.api.types.is_float(value) and not float(value).is_integer()
+    }
+    return (data.astype(cast) if cast else data).fillna(values)
+
+
+class Step:
+    """Base class for logical plan steps."""
+    
+    def output_columns(self, columns: List[str]) -> List[str]:
+        """
+        Return the columns produced by this step.
+        
+        Args:
+            columns: Columns of the step input
+            
+        Returns:
+            Columns of the step output
+        """
+        return columns
+    
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and vars(self) == vars(other)
+
+
+class DropDuplicates(Step):
+    """Remove duplicate rows, keeping the first occurrence."""
+    
+    def __init__(self,
+                 out_of_core: bool = False,
+                 spill_dir: Optional[str] = None,
+                 memory_limit: int = dedupe.MEMORY_LIMIT):
+        """
+        Initialize the step.
+        
+        Args:
+            out_of_core: Whether to deduplicate through hash-partitioned
+                spill files instead of an in-memory hash table
+            spill_dir: Directory for spill files, system temp by default
+            memory_limit: Bytes of partition data held in memory at once
+        """
+        self.out_of_core = out_of_core
+        self.spill_dir = spill_dir
+        self.memory_limit = memory_limit
+    
+    def __repr__(self) -> str:
+        return "DropDuplicates(out_of_core)" if self.out_of_core else "DropDuplicates()"
+
+
+class FillMean(Step):
+    """Fill missing numeric values with the column mean."""
+    
+    def __init__(self, values: Optional[Dict[str, float]] = None):
+        """
+        Initialize the step.
+        
+        Args:
+            values: Resolved fill values, computed at run time when None
+        """
+        self.values = values
+    
+    def __repr__(self) -> str:
+        return "FillMean()" if self.values is None else f"FillMean({self.values})"
+
+
+class Fill(Step):
+    """Fill missing values with a ``data_wizard.fill`` strategy."""
+    
+    def __init__(self, strategy: 'FillStrategy'):
+        """
+        Initialize the step.
+        
+        Args:
+            strategy: Fill strategy, resolved before streaming when it
+                needs a pass over the data
+        """
+        self.strategy = strategy
+    
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self.strategy is other.strategy
+    
+    def __repr__(self) -> str:
+        return f"Fill({self.strategy!r})"
+
+
+class Filter(Step):
+    """Keep rows for which every predicate holds."""
+    
+    def __init__(self, predicates: List[Predicate]):
+        """
+        Initialize the step.
+        
+        Args:
+            predicates: (column, condition) pairs or column expressions,
+                combined with a logical AND
+        """
+        self.predicates = list(predicates)
+    
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and \
+            len(self.predicates) == len(other.predicates) and \
+            all(_same_predicate(a, b)
+                for a, b in zip(self.predicates, other.predicates))
+    
+    def __repr__(self) -> str:
+        return f"Filter({[_describe(predicate) for predicate in self.predicates]})"
+
+
+class Select(Step):
+    """Keep only the given columns."""
+    
+    def __init__(self, columns: List[str]):
+        """
+        Initialize the step.
+        
+        Args:
+            columns: Columns to keep, in output order
+        """
+        self.columns = list(columns)
+    
+    def output_columns(self, columns: List[str]) -> List[str]:
+        return self.columns
+    
+    def __repr__(self) -> str:
+        return f"Select({self.columns})"
+
+
+def output_columns(steps: List[Step], columns: List[str]) -> List[str]:
+    """
+    Return the columns produced by a plan.
+    
+    Args:
+        steps: Plan steps
+        columns: Columns of the plan input
+        
+    Returns:
+        Columns of the plan output
+    """
+    for step in steps:
+        columns = step.output_columns(columns)
+    return columns
+
+
+def optimize(steps: List[Step]) -> List[Step]:
+    """
+    Rewrite a plan into an equivalent one that is cheaper to run.
+    
+    Filters are moved ahead of duplicate removal, adjacent filters are fused
+    into a single mask, and duplicate removals or fills that cannot change
+    the data any more are dropped. Filter conditions are assumed to be
+    row-wise predicates, as is the case for comparisons like ``x > 0``.
+    
+    Args:
+        steps: Plan steps in recording order
+        
+    Returns:
+        Optimized plan steps
+    """
+    optimized: List[Step] = []
+    for step in steps:
+        if isinstance(step, Filter):
+            position = len(optimized)
+            while position and isinstance(optimized[position - 1], DropDuplicates):
+                position -= 1
+            if position and isinstance(optimized[position - 1], Filter):
+                optimized[position - 1] = Filter(
+                    optimized[position - 1].predicates + step.predicates
+                )
+            else:
+                optimized.insert(position, Filter(step.predicates))
+        elif isinstance(step, (DropDuplicates, FillMean)) and _is_redundant(
+                optimized, type(step)):
+            continue
+        else:
+            optimized.append(step)
+    return optimized
+
+
+def _is_redundant(steps: List[Step], kind: type) -> bool:
+    """Check whether a step of ``kind`` repeats one that already ran."""
+    for step in reversed(steps):
+        if isinstance(step, kind):
+            return True
+        if kind is DropDuplicates and isinstance(step, (FillMean, Fill, Select)):
+            return False
+    return False
+
+
+def required_columns(steps: List[Step], columns: List[str]) -> List[str]:
+    """
+    Return the input columns a plan actually reads.
+    
+    Args:
+        steps: Plan steps
+        columns: Columns of the plan input
+        
+    Returns:
+        Subset of ``columns`` in their original order
+    """
+    available = [columns]
+    for step in steps:
+        available.append(step.output_columns(available[-1]))
+    
+    needed = set(available[-1])
+    for index in range(len(steps) - 1, -1, -1):
+        step = steps[index]
+        if isinstance(step, Filter):
+            for predicate in step.predicates:
+                needed.update(_predicate_columns(predicate))
+        elif isinstance(step, DropDuplicates):
+            needed.update(available[index])
+        elif isinstance(step, Fill):
+            needed.update(step.strategy.key_columns())
+    return [column for column in columns if column in needed]
+
+
+def explain(steps: List[Step]) -> str:
+    """
+    Render a plan as text, one step per line.
+    
+    Args:
+        steps: Plan steps
+        
+    Returns:
+        Human readable plan
+    """
+    return "\n".join(f"{index}: {step!r}" for index, step in enumerate(steps))
+
+
+def execute(data: pd.DataFrame, steps: List[Step]) -> pd.DataFrame:
+    """
+    Run a plan over an in-memory DataFrame.
+    
+    All steps are fused into a single row mask: filters and duplicate
+    removal only narrow the mask, fill values are computed where the fill
+    occurs in the plan but applied once at the end, and the input is copied
+    a single time when the result is materialized. A ``Fill`` strategy step
+    materializes the rows selected so far, and later steps continue from
+    its output.
+    
+    Args:
+        data: Input data, never modified
+        steps: Plan steps, usually the output of ``optimize``
+        
+    Returns:
+        New DataFrame with the plan applied
+    """
+    rows = np.ones(len(data), dtype=bool)
+    columns = list(data.columns)
+    fills: Dict[str, float] = {}
+    
+    for step in steps:
+        if isinstance(step, Filter):
+            rows &= filter_mask(data, step.predicates, fills)
+        elif isinstance(step, DropDuplicates):
+            if any(column in fills for column in columns):
+                data = _materialize(data, rows, columns, fills)
+                rows = np.ones(len(data), dtype=bool)
+                fills = {}
+            if step.out_of_core:
+                rows = unique_rows(data, rows, columns, step)
+            elif rows.all():
+                rows = ~data.duplicated(subset=columns).to_numpy()
+            else:
+                selected = np.flatnonzero(rows)
+                duplicated = data.iloc[selected][columns].duplicated().to_numpy()
+                rows[selected[duplicated]] = False
+        elif isinstance(step, FillMean):
+            fills.update(_fill_values(data, rows, columns, fills, step.values))
+        elif isinstance(step, Fill):
+            data = step.strategy.fill(_materialize(data, rows, columns, fills))
+            rows = np.ones(len(data), dtype=bool)
+            fills = {}
+        elif isinstance(step, Select):
+            columns = step.columns
+    
+    return _materialize(data, rows, columns, fills)
+
+
+def filter_mask(data: pd.DataFrame,
+                predicates: List[Predicate],
+                fills: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """
+    Evaluate filter predicates as a single row mask.
+    
+    Column expressions are combined with a logical AND and evaluated in one
+    pass; callable conditions are applied one column at a time.
+    
+    Args:
+        data: Data to filter
+        predicates: (column, condition) pairs or column expressions
+        fills: Pending fill values applied to the columns the predicates read
+        
+    Returns:
+        Boolean array with one entry per row
+    """
+    fills = fills or {}
+    mask = np.ones(len(data), dtype=bool)
+    expressions = [p for p in predicates if isinstance(p, Expr)]
+    if expressions:
+        combined = expressions[0]
+        for expression in expressions[1:]:
+            combined = combined & expression
+        filled = {c: fills[c] for c in combined.columns() if c in fills}
+        mask &= combined.mask(fill_missing(data, filled) if filled else data)
+    for predicate in predicates:
+        if isinstance(predicate, Expr):
+            continue
+        column, condition = predicate
+        values = data[column]
+        if column in fills:
+            values = fill_missing(data[[column]], {column: fills[column]})[column]
+        mask &= np.asarray(condition(values), dtype=bool)
+    return mask
+
+
+def unique_rows(data: pd.DataFrame,
+                rows: np.ndarray,
+                columns: List[str],
+                step: DropDuplicates) -> np.ndarray:
+    """
+    Narrow a row mask to first occurrences with the out-of-core dedupe.
+    
+    Args:
+        data: Input data
+        rows: Mask of the rows still selected
+        columns: Columns compared for equality
+        step: Out-of-core duplicate removal settings
+        
+    Returns:
+        Mask of the selected rows that are not duplicates of earlier ones
+    """
+    selected = np.flatnonzero(rows)
+    slices = (
+        data.iloc[selected[start:start + dedupe.MERGE_ROWS]][columns]
+        for start in range(0, len(selected), dedupe.MERGE_ROWS)
+    )
+    result = np.zeros(len(data), dtype=bool)
+    for positions, _ in dedupe.iter_unique(slices, step.spill_dir, step.memory_limit):
+        result[selected[positions]] = True
+    return result
+
+
+def _fill_values(data: pd.DataFrame,
+                 rows: np.ndarray,
+                 columns: List[str],
+                 fills: Dict[str, float],
+                 values: Optional[Dict[str, float]]) -> Dict[str, float]:
+    """Compute fill values for numeric columns that still have gaps."""
+    if values is not None:
+        return {c: v for c, v in values.items() if c in columns and c not in fills}
+    
+    result = {}
+    for column in columns:
+        if not is_numeric(data[column].dtype):
+            continue
+        if column in fills or not data[column].hasnans:
+            continue
+        series = data[column] if rows.all() else data[column][rows]
+        result[column] = series.mean()
+    return result
+
+
+def _predicate_columns(predicate: Predicate) -> List[str]:
+    """Return the columns a filter predicate reads."""
+    if isinstance(predicate, Expr):
+        return sorted(predicate.columns())
+    return [predicate[0]]
+
+
+def _same_predicate(first: Predicate, second: Predicate) -> bool:
+    """Compare predicates without building comparison expressions."""
+    if isinstance(first, Expr):
+        return first.equals(second)
+    return not isinstance(second, Expr) and first == second
+
+
+def _describe(predicate: Predicate) -> Any:
+    """Return what a filter predicate shows in plan output."""
+    return predicate if isinstance(predicate, Expr) else predicate[0]
+
+
+def _materialize(data: pd.DataFrame,
+                 rows: np.ndarray,
+                 columns: List[str],
+                 fills: Dict[str, float]) -> pd.DataFrame:
+    """Copy the selected rows and columns once and apply pending fills."""
+    result = data.loc[:, columns] if rows.all() else data.loc[rows, columns]
+    return fill_missing(result, fills) if fills else result
+
+
+def iter_execute(read_chunks: Callable[[], Iterator[pd.DataFrame]],
+                 steps: List[Step]) -> Iterator[pd.DataFrame]:
+    """
+    Run a plan chunk by chunk.
+    
+    Duplicates are tracked across chunks by row hash, or removed through
+    spill files for out-of-core steps, and every ``FillMean`` step is
+    resolved first with one extra pass over the data that precedes it in
+    the plan.
+    
+    Args:
+        read_chunks: Callable returning a fresh iterator over input chunks
+        steps: Plan steps, usually the output of ``optimize``
+        
+    Yields:
+        Processed chunks
+    """
+    resolved: List[Step] = []
+    for step in steps:
+        if isinstance(step, FillMean) and step.values is None:
+            step = FillMean(stream_means(_run_chunks(read_chunks(), resolved)))
+        elif isinstance(step, Fill) and step.strategy.needs_pass:
+            step = Fill(step.strategy.fit(lambda: _run_chunks(read_chunks(), resolved)))
+        resolved.append(step)
+    yield from _run_chunks(read_chunks(), resolved)
+
+
+def _run_chunks(chunks: Iterator[pd.DataFrame],
+                steps: List[Step]) -> Iterator[pd.DataFrame]:
+    """Apply resolved steps to every chunk."""
+    for index, step in enumerate(steps):
+        if isinstance(step, DropDuplicates) and step.out_of_core:
+            unique = dedupe.drop_duplicates(_run_chunks(chunks, steps[:index]),
+                                            step.spill_dir, step.memory_limit)
+            yield from _run_chunks(unique, steps[index + 1:])
+            return
+    
+    seen: Dict[int, Dict[int, List[Tuple[Any, ...]]]] = {
+        index: {} for index, step in enumerate(steps)
+        if isinstance(step, DropDuplicates)
+    }
+    fillers = {
+        index: step.strategy.chunk_filler()
+        for index, step in enumerate(steps)
+        if isinstance(step, Fill)
+    }
+    for chunk in chunks:
+        for index, step in enumerate(steps):
+            if isinstance(step, Filter):
+                chunk = chunk[filter_mask(chunk, step.predicates)]
+            elif isinstance(step, DropDuplicates):
+                keep = _first_seen(dedupe.row_hashes(chunk),
+                                   dedupe.row_values(chunk), seen[index])
+                chunk = chunk[keep]
+            elif isinstance(step, FillMean):
+                chunk = fill_missing(chunk, step.values)
+            elif isinstance(step, Fill):
+                chunk = fillers[index](chunk)
+            elif isinstance(step, Select):
+                chunk = chunk[step.columns]
+        yield chunk
+
+
+def _first_seen(hashes: np.ndarray,
+                rows: List[Tuple[Any, ...]],
+                seen: Dict[int, List[Tuple[Any, ...]]]) -> np.ndarray:
+    """Mark the rows new to ``seen``, comparing rows that share a hash in full."""
+    keep = np.zeros(len(hashes), dtype=bool)
+    for position, (value, row) in enumerate(zip(hashes.tolist(), rows)):
+        stored = seen.setdefault(value, [])
+        if row not in stored:
+            stored.append(row)
+            keep[position] = True
+    return keep
+
+
+def stream_means(chunks: Iterator[pd.DataFrame]) -> Dict[str, float]:
+    """
+    Compute the mean of every column that is numeric in all chunks.
+    
+    Args:
+        chunks: Iterator over DataFrame chunks
+        
+    Returns:
+        Dictionary mapping column names to means
+    """
+    sums: Dict[str, float] = {}
+    counts: Dict[str, int] = {}
+    numeric: Optional[List[str]] = None
+    for chunk in chunks:
+        cols = numeric_columns(chunk)
+        numeric = cols if numeric is None else [c for c in numeric if c in cols]
+        for col in cols:
+            values = chunk[col]
+            sums[col] = sums.get(col, 0.0) + float(values.sum())
+            counts[col] = counts.get(col, 0) + int(values.count())
+    return {
+        col: sums[col] / counts[col]
+        for col in (numeric or [])
+        if counts[col]
+    }
\ No newline at end of file
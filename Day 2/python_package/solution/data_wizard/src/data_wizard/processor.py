@@ -2,78 +2,290 @@
 Core data processing functionality for the Data Wizard package.
 """
 
+import numpy as np
 import pandas as pd
-from typing import Optional, Union, List, Dict, Any
+from typing import Optional, Union, List, Dict, Any, Iterator
 from pathlib import Path
 
+from data_wizard import dedupe, dtypes, ingest, plan
+from data_wizard.cache import CSVCache
+from data_wizard.expr import Expr
+from data_wizard.fill import FillSpec, as_strategy
+from data_wizard.summary import SummaryState
 from data_wizard.utils import validate_file_path, save_json_report
 
 
 class DataProcessor:
-    """Main class for data processing operations."""
+    """
+    Main class for data processing operations.
     
-    def __init__(self, file_path: Optional[str] = None):
+    For in-memory data the processor keeps per-column counters (row count,
+    null counts, dtypes and running statistics) that ``append``, filters,
+    duplicate removal and fills update from the rows they touch, so
+    ``get_summary`` does not rescan the frame. Assigning to ``data`` resets
+    the counters; edits made directly to the frame are not tracked.
+    """
+    
+    def __init__(self,
+                 file_path: Optional[str] = None,
+                 chunksize: Optional[int] = None,
+                 lazy: bool = False,
+                 cache: Optional[CSVCache] = None,
+                 spill_dir: Optional[str] = None,
+                 memory_limit: int = dedupe.MEMORY_LIMIT):
         """
         Initialize the DataProcessor.
         
         Args:
             file_path: Optional path to CSV file to load
+            chunksize: Optional number of rows per chunk. When given, the CSV
+                is streamed in chunks instead of being loaded at once.
+            lazy: Whether to record operations in a query plan that runs
+                once when the result is needed
+            cache: Optional columnar cache used for non-streaming loads
+            spill_dir: Directory for out-of-core deduplication spill files,
+                the system temporary directory by default
+            memory_limit: Bytes of rows the out-of-core deduplication
+                holds in memory at once
         """
-        self.data: Optional[pd.DataFrame] = None
+        self._data: Optional[pd.DataFrame] = None
+        self._summary: Optional[SummaryState] = None
+        self.chunksize = chunksize
+        self.lazy = lazy
+        self.cache = cache
+        self.spill_dir = spill_dir
+        self.memory_limit = memory_limit
+        self._source: Optional[ingest.Sources] = None
+        self._columns: List[str] = []
+        self._plan: List[plan.Step] = []
+        self._schema: dtypes.Schema = {}
+        self._parse_dtypes: Optional[dtypes.Schema] = None
+        self.optimize_dtypes = False
+        self.dtype_report: Optional[Dict[str, Any]] = None
+        self.load_report: Optional[ingest.LoadReport] = None
+        self._ingest_options: Dict[str, Any] = {}
         if file_path:
             self.load_csv(file_path)
     
-    def load_csv(self, file_path: str) -> 'DataProcessor':
+    @property
+    def data(self) -> Optional[pd.DataFrame]:
+        """The loaded DataFrame, or None while a deferred source is pending."""
+        return self._data
+    
+    @data.setter
+    def data(self, value: Optional[pd.DataFrame]) -> None:
+        self._data = value
+        self._summary = None
+    
+    @property
+    def streaming(self) -> bool:
+        """Whether operations are applied chunk by chunk."""
+        return self._source is not None and bool(self.chunksize)
+    
+    @property
+    def deferred(self) -> bool:
+        """Whether operations are recorded instead of applied immediately."""
+        return self.streaming or self.lazy
+    
+    def load_csv(self,
+                 file_path: str,
+                 chunksize: Optional[int] = None,
+                 lazy: Optional[bool] = None,
+                 optimize_dtypes: bool = False,
+                 schema: Optional[dtypes.Schema] = None) -> 'DataProcessor':
         """
         Load data from a CSV file.
         
+        With a chunksize (given here or to the constructor) nothing is read
+        up front: subsequent operations are recorded and applied chunk by
+        chunk when the data is consumed by ``save_csv``, ``get_summary`` or
+        ``iter_chunks``, so peak memory is bounded by the chunk size. In lazy
+        mode the file is read once, with only the columns the plan needs,
+        when the result is collected.
+        
+        With ``optimize_dtypes`` a sample of the file decides which string
+        columns are parsed as ``category``, and once the whole frame is
+        loaded its numeric columns are narrowed to the smallest dtype that
+        holds every value. The outcome, including the bytes saved compared
+        to the default dtypes, is stored in ``dtype_report``. Streamed chunks
+        only get the parse-time dtypes, so their numeric widths stay
+        consistent from chunk to chunk.
+        
         Args:
             file_path: Path to the CSV file
-            
+            chunksize: Optional number of rows per chunk
+            lazy: Optional override of the lazy mode given to the constructor
+            optimize_dtypes: Whether to infer and downcast dtypes
+            schema: Optional explicit column dtypes; these take precedence
+                over inferred ones and are never downcast
+                
         Returns:
             self for method chaining
             
         Raises:
-            ValueError: If file path is invalid or file doesn't exist
+            ValueError: If file path is invalid, file doesn't exist or
+                chunksize is not positive
         """
         if not validate_file_path(file_path):
             raise ValueError(f"Invalid file path: {file_path}")
         
-        self.data = pd.read_csv(file_path)
+        chunksize = chunksize or self.chunksize
+        if lazy is not None:
+            self.lazy = lazy
+        self._plan = []
+        if chunksize is not None and chunksize < 1:
+            raise ValueError("chunksize must be a positive integer")
+        
+        self.optimize_dtypes = optimize_dtypes
+        self.dtype_report = None
+        self.load_report = None
+        self._schema = dict(schema or {})
+        self._parse_dtypes = None
+        if optimize_dtypes or schema:
+            inferred = dtypes.infer_schema(file_path) if optimize_dtypes else {}
+            self._parse_dtypes = {**inferred, **self._schema}
+        if chunksize or self.lazy:
+            self.chunksize = chunksize
+            self.data = None
+            self._source = file_path
+            self._columns = list(pd.read_csv(file_path, nrows=0).columns)
+        else:
+            self._source = None
+            self.data = self._read_csv(file_path)
         return self
     
-    def clean_data(self, 
-                  drop_duplicates: bool = True, 
-                  fill_numeric: bool = True) -> 'DataProcessor':
+    def load_many(self,
+                  glob_or_paths: ingest.Sources,
+                  max_workers: Optional[int] = None,
+                  readahead: Optional[int] = None) -> 'DataProcessor':
+        """
+        Load many CSV files concurrently.
+        
+        Files are validated and parsed on a thread pool, at most
+        ``readahead`` of them ahead of the consumer. In eager mode their rows
+        are concatenated in input order into ``data``; with a chunksize or in
+        lazy mode they are read when the data is consumed, and streamed file
+        by file in chunks of at most ``chunksize`` rows. Files that cannot be
+        read are skipped, and ``load_report`` records the rows, parse time
+        and error of every file.
+        
+        Args:
+            glob_or_paths: Glob pattern or list of paths
+            max_workers: Number of reader threads
+            readahead: Maximum number of files parsed ahead of the consumer
+            
+        Returns:
+            self for method chaining
+            
+        Raises:
+            ValueError: If no path is given or matches the pattern, or no
+                file is readable in a deferred mode
+        """
+        paths = ingest.expand_paths(glob_or_paths)
+        if not paths:
+            raise ValueError(f"No files match {glob_or_paths}")
+        
+        self._plan = []
+        self.optimize_dtypes = False
+        self.dtype_report = None
+        self._schema = {}
+        self._parse_dtypes = None
+        self._ingest_options = {'max_workers': max_workers, 'readahead': readahead}
+        if self.chunksize or self.lazy:
+            header = next((p for p in paths if validate_file_path(p)), None)
+            if header is None:
+                raise ValueError(f"None of the files in {glob_or_paths} is readable")
+            self.data = None
+            self.load_report = None
+            self._source = paths
+            self._columns = list(pd.read_csv(header, nrows=0).columns)
+        else:
+            self._source = None
+            self.data = self._read_csv(paths)
+        return self
+    
+    def clean_data(self,
+                  drop_duplicates: bool = True,
+                  fill_numeric: bool = True,
+                  out_of_core: bool = False,
+                  fill: Optional[FillSpec] = None) -> 'DataProcessor':
         """
         Clean the loaded data.
         
+        In streaming mode duplicates are tracked across chunks by row hash
+        and missing values are filled with the mean of the whole stream,
+        which costs one extra pass over the file. In lazy mode both steps
+        are added to the query plan.
+        
+        ``fill`` replaces the mean fill with another strategy from
+        ``data_wizard.fill``: 'median', 'ffill', a constant, a strategy
+        such as ``GroupFill('region')`` or ``ForwardFill(order_by='time')``,
+        or a dictionary mapping columns to any of these. Median fills,
+        group medians and ordered forward fills need the whole column and
+        are not available in streaming mode.
+        
+        With ``out_of_core`` duplicates are instead found by hash-partitioning
+        rows into spill files under ``spill_dir`` and deduplicating one
+        partition at a time, so at most ``memory_limit`` bytes of rows are
+        held for the comparison regardless of the data size. The result is
+        identical to the in-memory path.
+        
         Args:
             drop_duplicates: Whether to remove duplicate rows
             fill_numeric: Whether to fill missing numeric values with mean
+            out_of_core: Whether to deduplicate through spill files
+            fill: Optional fill strategy used instead of the mean
             
         Returns:
             self for method chaining
             
         Raises:
-            ValueError: If no data is loaded
+            ValueError: If no data is loaded, the fill strategy is unknown
+                or it cannot run in streaming mode
         """
-        if self.data is None:
-            raise ValueError("No data loaded. Call load_csv first.")
+        self._require_data()
+        strategy = as_strategy(fill) if fill is not None else None
+        if strategy is not None and self.streaming and not strategy.streamable:
+            raise ValueError(f"{strategy!r} needs whole columns and cannot run in "
+                             "streaming mode; load without a chunksize instead")
         
-        if drop_duplicates:
-            self.data = self.data.drop_duplicates()
+        dedupe_step = plan.DropDuplicates(out_of_core, self.spill_dir,
+                                          self.memory_limit)
+        if self.deferred:
+            if drop_duplicates:
+                self._plan.append(dedupe_step)
+            if strategy is not None:
+                self._plan.append(plan.Fill(strategy))
+            elif fill_numeric:
+                self._plan.append(plan.FillMean())
+            return self
         
-        if fill_numeric:
-            numeric_cols = self.data.select_dtypes(include=['int64', 'float64']).columns
-            self.data[numeric_cols] = self.data[numeric_cols].fillna(
-                self.data[numeric_cols].mean()
-            )
+        if drop_duplicates and out_of_core:
+            rows = np.ones(len(self._data), dtype=bool)
+            columns = list(self._data.columns)
+            self._keep_rows(plan.unique_rows(self._data, rows, columns, dedupe_step))
+        elif drop_duplicates:
+            self._keep_rows(~self._data.duplicated().to_numpy())
+        
+        if strategy is not None:
+            values = strategy.column_values(self._data)
+            if values is None:
+                self.data = strategy.fill(self._data)
+            else:
+                self._data = plan.fill_missing(self._data, values)
+                if self._summary is not None:
+                    self._summary.fill(values)
+        elif fill_numeric:
+            numeric_cols = plan.numeric_columns(self._data)
+            means = self._data[numeric_cols].mean()
+            self._data = plan.fill_missing(self._data, means.to_dict())
+            if self._summary is not None:
+                self._summary.fill(means.to_dict())
         
         return self
     
-    def filter_by_column(self, 
-                        column: str, 
+    def filter_by_column(self,
+                        column: str,
                         condition: callable) -> 'DataProcessor':
         """
         Filter data based on a condition for a specific column.
@@ -88,15 +300,173 @@ class DataProcessor:
         Raises:
             ValueError: If no data is loaded or column doesn't exist
         """
-        if self.data is None:
-            raise ValueError("No data loaded. Call load_csv first.")
+        self._require_data()
         
-        if column not in self.data.columns:
+        if column not in self._current_columns():
             raise ValueError(f"Column {column} not found in data.")
         
-        self.data = self.data[condition(self.data[column])]
+        if self.deferred:
+            self._plan.append(plan.Filter([(column, condition)]))
+            return self
+        
+        self._keep_rows(np.asarray(condition(self._data[column]), dtype=bool))
         return self
     
+    def filter(self, expression: Expr) -> 'DataProcessor':
+        """
+        Filter data with a column expression.
+        
+        Unlike ``filter_by_column`` the whole expression is evaluated as one
+        vectorized mask, with ``numexpr`` when it is installed and every
+        referenced column is numeric. Consecutive filters are fused in lazy
+        and streaming mode.
+        
+        Args:
+            expression: Boolean expression built with ``col``, e.g.
+                ``(col('age') > 30) & (col('plan') == 'pro')``
+                
+        Returns:
+            self for method chaining
+            
+        Raises:
+            ValueError: If no data is loaded or a column doesn't exist
+        """
+        self._require_data()
+        
+        missing = sorted(expression.columns() - set(self._current_columns()))
+        if missing:
+            raise ValueError(f"Columns not found in data: {missing}")
+        
+        if self.deferred:
+            self._plan.append(plan.Filter([expression]))
+            return self
+        
+        self._keep_rows(expression.mask(self._data))
+        return self
+    
+    def select_columns(self, columns: List[str]) -> 'DataProcessor':
+        """
+        Keep only the given columns.
+        
+        In lazy mode columns that no later step needs are never read from
+        the source file.
+        
+        Args:
+            columns: Column names to keep, in output order
+            
+        Returns:
+            self for method chaining
+            
+        Raises:
+            ValueError: If no data is loaded or a column doesn't exist
+        """
+        self._require_data()
+        
+        missing = [c for c in columns if c not in self._current_columns()]
+        if missing:
+            raise ValueError(f"Columns {missing} not found in data.")
+        
+        if self.deferred:
+            self._plan.append(plan.Select(columns))
+            return self
+        
+        self._data = self._data[list(columns)]
+        if self._summary is not None:
+            self._summary.select(columns)
+        return self
+    
+    def append(self, rows: pd.DataFrame) -> 'DataProcessor':
+        """
+        Append rows to the loaded data.
+        
+        Only the new rows are scanned to update the summary counters.
+        
+        Args:
+            rows: DataFrame with the same columns as the loaded data
+            
+        Returns:
+            self for method chaining
+            
+        Raises:
+            ValueError: If no data is loaded, the data is streamed or the
+                columns differ
+        """
+        self._require_data()
+        if self.streaming:
+            raise ValueError("Cannot append to streamed data.")
+        
+        self.collect()
+        if set(rows.columns) != set(self._data.columns):
+            raise ValueError("Appended rows must have the same columns as the data.")
+        
+        rows = rows[list(self._data.columns)]
+        self._data = pd.concat([self._data, rows])
+        if self._summary is not None:
+            self._summary.append(rows, self._data)
+        return self
+    
+    def collect(self) -> pd.DataFrame:
+        """
+        Run the recorded plan and return the resulting DataFrame.
+        
+        The optimized plan is executed once and its result replaces
+        ``data``; later operations are recorded against that result. In
+        streaming mode this concatenates every chunk in memory.
+        
+        Returns:
+            The processed DataFrame
+            
+        Raises:
+            ValueError: If no data is loaded
+        """
+        self._require_data()
+        
+        if not self._plan and self.data is not None:
+            return self.data
+        
+        if self.streaming:
+            chunks = list(self.iter_chunks())
+            self.data = pd.concat(chunks) if chunks else pd.DataFrame(
+                columns=self._current_columns())
+        else:
+            steps = plan.optimize(self._plan)
+            data = self.data
+            if data is None:
+                data = self._read_csv(
+                    self._source, plan.required_columns(steps, self._columns)
+                )
+            self.data = plan.execute(data, steps)
+        self._source = None
+        self._plan = []
+        return self.data
+    
+    def explain(self) -> str:
+        """
+        Describe the optimized plan that the next collect will run.
+        
+        Returns:
+            The optimized plan, one step per line
+        """
+        return plan.explain(plan.optimize(self._plan))
+    
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over the processed data.
+        
+        Yields:
+            Processed chunks in streaming mode, otherwise the whole DataFrame
+            
+        Raises:
+            ValueError: If no data is loaded
+        """
+        self._require_data()
+        
+        if not self.streaming:
+            yield self.collect()
+            return
+        
+        yield from plan.iter_execute(self._read_chunks, plan.optimize(self._plan))
+    
     def save_csv(self, file_path: str) -> None:
         """
         Save the processed data to a CSV file.
@@ -107,10 +477,21 @@ class DataProcessor:
         Raises:
             ValueError: If no data is loaded
         """
-        if self.data is None:
-            raise ValueError("No data loaded. Call load_csv first.")
+        self._require_data()
+        
+        if not self.streaming:
+            self.collect().to_csv(file_path, index=False)
+            return
         
-        self.data.to_csv(file_path, index=False)
+        header_written = False
+        for chunk in self.iter_chunks():
+            chunk.to_csv(file_path, index=False,
+                         mode='a' if header_written else 'w',
+                         header=not header_written)
+            header_written = True
+        if not header_written:
+            pd.DataFrame(columns=self._current_columns()).to_csv(
+                file_path, index=False)
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -122,16 +503,119 @@ class DataProcessor:
         Raises:
             ValueError: If no data is loaded
         """
-        if self.data is None:
+        self._require_data()
+        
+        if self.streaming:
+            return self._streaming_summary()
+        
+        return self._summary_state().summary()
+    
+    def get_column_stats(self) -> Dict[str, Optional[Dict[str, float]]]:
+        """
+        Get running statistics of every numeric column.
+        
+        Returns:
+            Dictionary mapping column names to mean, std, variance, min, max
+            and count (None for columns without values)
+            
+        Raises:
+            ValueError: If no data is loaded or the data is streamed
+        """
+        self._require_data()
+        if self.streaming:
+            raise ValueError("Column statistics are not tracked for streamed data.")
+        
+        return self._summary_state().column_stats()
+    
+    def _require_data(self) -> None:
+        """Raise if neither a DataFrame nor a deferred source is loaded."""
+        if self.data is None and self._source is None:
             raise ValueError("No data loaded. Call load_csv first.")
+    
+    def _summary_state(self) -> SummaryState:
+        """Return the summary counters, building them on first use."""
+        self.collect()
+        if self._summary is None:
+            self._summary = SummaryState(self._data)
+        return self._summary
+    
+    def _keep_rows(self, mask: np.ndarray) -> None:
+        """Keep the masked rows and update the summary from the others."""
+        removed = None if self._summary is None else self._data[~mask]
+        self._data = self._data[mask]
+        if removed is not None:
+            self._summary.remove(removed, self._data)
+    
+    def _current_columns(self) -> List[str]:
+        """Return the column names the recorded plan will produce."""
+        columns = self._columns if self.data is None else list(self.data.columns)
+        return plan.output_columns(self._plan, columns)
+    
+    def _read_csv(self,
+                  file_path: ingest.Sources,
+                  columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read a whole CSV file, through the cache when one is configured."""
+        if isinstance(file_path, list):
+            data, self.load_report = ingest.load_many(
+                file_path, usecols=columns, **self._ingest_options
+            )
+            return data
         
-        numeric_cols = self.data.select_dtypes(include=['int64', 'float64']).columns
-        summary = {
-            'row_count': len(self.data),
-            'column_count': len(self.data.columns),
-            'numeric_columns': list(numeric_cols),
-            'categorical_columns': list(set(self.data.columns) - set(numeric_cols)),
-            'missing_values': self.data.isnull().sum().to_dict()
-        }
+        if self.cache is not None:
+            data = self.cache.load(file_path, columns=columns)
+            if self._parse_dtypes:
+                data = data.astype({c: d for c, d in self._parse_dtypes.items()
+                                    if c in data.columns})
+        else:
+            data = pd.read_csv(file_path, usecols=columns, dtype=self._parse_dtypes)
         
-        return summary 
\ No newline at end of file
+        if self.optimize_dtypes:
+            before = dtypes.estimate_default_memory(file_path, data)
+            dtypes.downcast(data, skip=self._schema)
+            self.dtype_report = dtypes.memory_report(before, data)
+        return data
+    
+    def _read_chunks(self) -> Iterator[pd.DataFrame]:
+        """Read the streaming source one chunk at a time."""
+        usecols = plan.required_columns(plan.optimize(self._plan), self._columns)
+        if isinstance(self._source, list):
+            yield from self._read_file_chunks(usecols)
+            return
+        
+        with pd.read_csv(self._source, chunksize=self.chunksize,
+                         usecols=usecols, dtype=self._parse_dtypes) as reader:
+            yield from reader
+    
+    def _read_file_chunks(self, usecols: List[str]) -> Iterator[pd.DataFrame]:
+        """Stream several files in chunks, indexed as one continuous file."""
+        self.load_report = ingest.LoadReport()
+        offset = 0
+        for _, frame in ingest.iter_files(self._source, report=self.load_report,
+                                          usecols=usecols, **self._ingest_options):
+            if frame is None:
+                continue
+            frame.index = pd.RangeIndex(offset, offset + len(frame))
+            offset += len(frame)
+            for start in range(0, len(frame), self.chunksize):
+                yield frame.iloc[start:start + self.chunksize]
+    
+    def _streaming_summary(self) -> Dict[str, Any]:
+        """Build the ``get_summary`` result one chunk at a time."""
+        columns = self._current_columns()
+        row_count = 0
+        numeric: Optional[List[str]] = None
+        missing = {col: 0 for col in columns}
+        for chunk in self.iter_chunks():
+            row_count += len(chunk)
+            cols = plan.numeric_columns(chunk)
+            numeric = cols if numeric is None else [c for c in numeric if c in cols]
+            for col, count in chunk.isnull().sum().items():
+                missing[col] += int(count)
+        numeric = numeric or []
+        return {
+            'row_count': row_count,
+            'column_count': len(columns),
+            'numeric_columns': numeric,
+            'categorical_columns': list(set(columns) - set(numeric)),
+            'missing_values': missing
+        }
\ No newline at end of file
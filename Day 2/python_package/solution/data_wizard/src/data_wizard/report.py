@@ -0,0 +1,219 @@
+"""
+JSON and NDJSON report writers.
+
+With ``orjson`` installed documents are serialized by it, which handles
+NumPy scalars and arrays natively; otherwise the standard library ``json``
+module is used. Objects neither encoder knows are converted through their
+``to_dict()`` or ``tolist()`` methods, which covers NumPy and pandas values
+without importing either here. Output is compressed with gzip, or with zstd
+when ``zstandard`` is installed, if asked for or if the file name ends in
+``.gz`` or ``.zst``.
+"""
+
+import gzip
+import json
+import logging
+import math
+import os
+import re
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Iterable, Optional, Type, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, os.PathLike]
+
+COMPRESSION_SUFFIXES = {'.gz': 'gzip', '.zst': 'zstd'}
+# orjson only indents by two spaces; it escapes newlines inside strings, so
+# every run of spaces that starts a line is indentation
+LEADING_SPACES = re.compile(rb'^( +)', re.MULTILINE)
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON.
+    
+    Non-finite floats are written as ``null`` by both encoders, so the
+    output is always valid JSON.
+    
+    Args:
+        data: JSON-like data, possibly holding NumPy or pandas values
+        indent: Whether to pretty-print with an indent of four spaces
+        
+    Returns:
+        Encoded document without a trailing newline
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if not indent:
+            return orjson.dumps(data, default=_default, option=option)
+        encoded = orjson.dumps(data, default=_default,
+                               option=option | orjson.OPT_INDENT_2)
+        return LEADING_SPACES.sub(lambda match: match.group(1) * 2, encoded)
+    return json.dumps(_finite(data), default=lambda value: _finite(_default(value)),
+                      ensure_ascii=False, allow_nan=False,
+                      indent=4 if indent else None).encode('utf-8')
+
+
+def write_json(data: Any,
+               output_path: PathLike,
+               indent: bool = True,
+               compression: Optional[str] = 'infer') -> None:
+    """
+    Write data as a single JSON document.
+    
+    Args:
+        data: JSON-like data, possibly holding NumPy or pandas values
+        output_path: Path of the output file
+        indent: Whether to pretty-print the document
+        compression: 'gzip', 'zstd', None, or 'infer' from the file suffix
+        
+    Raises:
+        IOError: If there's an error writing the file
+        ValueError: If the compression is unknown
+        ImportError: If zstd compression is requested without zstandard
+    """
+    try:
+        with open_output(output_path, compression) as f:
+            f.write(dumps(data, indent))
+        logger.info(f"Report saved successfully to {output_path}")
+    except Exception as e:
+        logger.error(f"Error saving report: {str(e)}")
+        raise
+
+
+def write_ndjson(records: Iterable[Any],
+                 output_path: PathLike,
+                 compression: Optional[str] = 'infer') -> int:
+    """
+    Write records as newline-delimited JSON, one line per record.
+    
+    Records are encoded and written as the iterable produces them, so a
+    generator of records is never held in memory.
+    
+    Args:
+        records: JSON-like records
+        output_path: Path of the output file
+        compression: 'gzip', 'zstd', None, or 'infer' from the file suffix
+        
+    Returns:
+        Number of records written
+    """
+    with NDJSONWriter(output_path, compression) as writer:
+        for record in records:
+            writer.write(record)
+    return writer.count
+
+
+class NDJSONWriter:
+    """
+    Incremental newline-delimited JSON writer.
+    
+    Example:
+        with NDJSONWriter('summaries.ndjson.gz') as writer:
+            for chunk in processor.iter_chunks():
+                writer.write({'rows': len(chunk)})
+    """
+    
+    def __init__(self,
+                 output_path: PathLike,
+                 compression: Optional[str] = 'infer'):
+        """
+        Open the output file.
+        
+        Args:
+            output_path: Path of the output file
+            compression: 'gzip', 'zstd', None, or 'infer' from the file suffix
+        """
+        self.output_path = output_path
+        self.count = 0
+        self._file = open_output(output_path, compression)
+    
+    def write(self, record: Any) -> None:
+        """
+        Append one record.
+        
+        Args:
+            record: JSON-like record, possibly holding NumPy or pandas values
+        """
+        self._file.write(dumps(record) + b'\n')
+        self.count += 1
+    
+    def close(self) -> None:
+        """Flush and close the output file."""
+        if not self._file.closed:
+            self._file.close()
+            logger.info(f"Wrote {self.count} records to {self.output_path}")
+    
+    def __enter__(self) -> 'NDJSONWriter':
+        return self
+    
+    def __exit__(self,
+                 exc_type: Optional[Type[BaseException]],
+                 exc: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
+
+
+def open_output(output_path: PathLike,
+                compression: Optional[str] = 'infer') -> IO[bytes]:
+    """
+    Open a binary output file, compressed if requested.
+    
+    Args:
+        output_path: Path of the output file
+        compression: 'gzip', 'zstd', None, or 'infer' from the file suffix
+        
+    Returns:
+        Writable binary file object
+        
+    Raises:
+        ValueError: If the compression is unknown
+        ImportError: If zstd compression is requested without zstandard
+    """
+    if compression == 'infer':
+        compression = COMPRESSION_SUFFIXES.get(Path(output_path).suffix.lower())
+    if compression is None:
+        return open(output_path, 'wb')
+    if compression == 'gzip':
+        return gzip.open(output_path, 'wb', compresslevel=6)
+    if compression == 'zstd':
+        if zstandard is None:
+            raise ImportError("zstd compression requires the zstandard package")
+        return zstandard.open(output_path, 'wb')
+    raise ValueError(f"Unknown compression: {compression}")
+
+
+def _finite(value: Any) -> Any:
+    """Replace non-finite floats with None, as orjson writes them."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+def _default(value: Any) -> Any:
+    """Convert objects the JSON encoders do not handle."""
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if isinstance(value, os.PathLike):
+        return os.fspath(value)
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
\ No newline at end of file
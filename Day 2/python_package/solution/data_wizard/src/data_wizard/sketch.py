@@ -0,0 +1,163 @@
+"""
+Mergeable quantile sketches for approximate percentiles.
+"""
+
+import math
+import numpy as np
+from typing import List, Optional, Union
+
+import pandas as pd
+
+NumericData = Union[List[float], pd.Series, np.ndarray]
+
+# Large batches are folded in block by block to bound temporary memory
+BLOCK_SIZE = 1 << 20
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch (Karnin, Lang and Liberty, 2016).
+    
+    The sketch keeps a stack of compactors; level ``h`` holds items that each
+    stand for ``2 ** h`` input values. When a level overflows it is sorted
+    and every other item, starting at a random offset, is promoted to the
+    next level. Memory grows with ``k * log(n / k)`` and sketches built on
+    different shards can be merged.
+    """
+    
+    def __init__(self,
+                 epsilon: float = 0.01,
+                 k: Optional[int] = None,
+                 seed: Optional[int] = None):
+        """
+        Initialize an empty sketch.
+        
+        Args:
+            epsilon: Target normalized rank error of quantile queries
+            k: Size of the top compactor, derived from epsilon when omitted
+            seed: Optional seed for the compaction coin flips
+            
+        Raises:
+            ValueError: If epsilon is not in (0, 1) or k is too small
+        """
+        if k is None:
+            if not 0 < epsilon < 1:
+                raise ValueError("epsilon must be between 0 and 1")
+            k = math.ceil((2.296 / epsilon) ** (1 / 0.9723))
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        
+        self.k = k
+        self.count = 0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+    
+    @property
+    def epsilon(self) -> float:
+        """Approximate normalized rank error for the current k."""
+        return 2.296 / self.k ** 0.9723
+    
+    def update(self, batch: NumericData) -> 'KLLSketch':
+        """
+        Add a batch of values to the sketch, ignoring NaN.
+        
+        Args:
+            batch: Numeric data to add
+            
+        Returns:
+            self for method chaining
+        """
+        values = np.asarray(batch).ravel()
+        for start in range(0, len(values), BLOCK_SIZE):
+            block = values[start:start + BLOCK_SIZE].astype(float, copy=False)
+            block = block[~np.isnan(block)]
+            if len(block) == 0:
+                continue
+            self.count += len(block)
+            self.min = min(self.min, float(block.min()))
+            self.max = max(self.max, float(block.max()))
+            self._levels[0] = np.concatenate([self._levels[0], block])
+            self._compress()
+        return self
+    
+    def merge(self, other: 'KLLSketch') -> 'KLLSketch':
+        """
+        Fold another sketch into this one.
+        
+        Args:
+            other: Sketch built over another shard
+            
+        Returns:
+            self for method chaining
+        """
+        if other.count == 0:
+            return self
+        
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+    
+    def quantile(self, q: Union[float, List[float]]) -> Union[float, np.ndarray]:
+        """
+        Estimate one or more quantiles.
+        
+        Args:
+            q: Quantile or list of quantiles between 0 and 1
+            
+        Returns:
+            Estimated value, or array of values for a list of quantiles
+            
+        Raises:
+            ValueError: If the sketch is empty or q is out of range
+        """
+        if self.count == 0:
+            raise ValueError("Cannot estimate quantiles of an empty sketch")
+        qs = np.atleast_1d(np.asarray(q, dtype=float))
+        if np.any((qs < 0) | (qs > 1)):
+            raise ValueError("Quantiles must be between 0 and 1")
+        
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(len(level), 2.0 ** height)
+            for height, level in enumerate(self._levels)
+        ])
+        order = np.argsort(items, kind='stable')
+        items, cumulative = items[order], np.cumsum(weights[order])
+        
+        index = np.searchsorted(cumulative, qs * cumulative[-1], side='left')
+        result = items[np.minimum(index, len(items) - 1)]
+        result = np.where(qs <= 0, self.min, np.where(qs >= 1, self.max, result))
+        return float(result[0]) if np.ndim(q) == 0 else result
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def _capacity(self, level: int) -> int:
+        """Capacity of a level; lower levels shrink geometrically."""
+        depth = len(self._levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+    
+    def _compress(self) -> None:
+        """Compact overflowing levels from the bottom up."""
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                keep = len(items) - len(items) % 2
+                promoted = items[self._rng.integers(2):keep:2]
+                self._levels[level] = items[keep:]
+                self._levels[level + 1] = np.concatenate(
+                    [self._levels[level + 1], promoted]
+                )
+            level += 1
\ No newline at end of file
@@ -2,47 +2,382 @@
 Statistical operations for data analysis.
 """
 
+import os
+
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Union, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Union, Optional, Tuple
+
+from data_wizard.sketch import KLLSketch
+
+NumericData = Union[List[float], pd.Series, np.ndarray, str, os.PathLike, memoryview]
+
+OUTLIER_RETURN_TYPES = ('list', 'array', 'mask', 'indices')
+CORRELATION_METHODS = ('pearson', 'spearman')
+
+# Arrays longer than this are processed block by block instead of through
+# NumPy calls that allocate full-size temporaries or sorted copies
+BLOCK_SIZE = 1 << 20
+SELECT_BINS = 4096
+
+
+class RunningStats:
+    """
+    Single-pass accumulator for count, mean, variance, min and max.
+    
+    Batches are folded in with the parallel form of Welford's algorithm, so
+    the data never has to be held in memory at once, and partial states
+    computed on different shards can be combined with ``merge``.
+    """
+    
+    def __init__(self, skipna: bool = True, block_size: int = 1 << 20):
+        """
+        Initialize an empty accumulator.
+        
+        Args:
+            skipna: Whether to ignore NaN values
+            block_size: Number of values folded in per vectorized step
+        """
+        self.skipna = skipna
+        self.block_size = block_size
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+    
+    def update(self, batch: NumericData) -> 'RunningStats':
+        """
+        Fold a batch of values into the running statistics.
+        
+        Args:
+            batch: Numeric data to add
+            
+        Returns:
+            self for method chaining
+        """
+        values = as_array(batch).ravel()
+        for start in range(0, len(values), self.block_size):
+            block = values[start:start + self.block_size].astype(float, copy=False)
+            if self.skipna:
+                block = block[~np.isnan(block)]
+            if len(block) == 0:
+                continue
+            mean = float(block.mean())
+            self._combine(len(block), mean, float(((block - mean) ** 2).sum()),
+                          float(block.min()), float(block.max()))
+        return self
+    
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """
+        Fold the state of another accumulator into this one.
+        
+        Args:
+            other: Accumulator holding statistics of another shard
+            
+        Returns:
+            self for method chaining
+        """
+        if other.count:
+            self._combine(other.count, other.mean, other.m2, other.min, other.max)
+        return self
+    
+    def update_repeated(self, value: float, count: int) -> 'RunningStats':
+        """
+        Fold in the same value ``count`` times without materializing it.
+        
+        Args:
+            value: Value to add
+            count: Number of copies
+            
+        Returns:
+            self for method chaining
+        """
+        if count:
+            self._combine(count, float(value), 0.0, float(value), float(value))
+        return self
+    
+    def subtract(self, other: 'RunningStats') -> 'RunningStats':
+        """
+        Remove the values summarized by another accumulator.
+        
+        This reverses ``merge`` for count, mean and variance. Minimum and
+        maximum cannot be reverted and are left unchanged; callers that
+        remove a bound have to recompute them.
+        
+        Args:
+            other: Accumulator holding statistics of the removed values
+            
+        Returns:
+            self for method chaining
+            
+        Raises:
+            ValueError: If more values are removed than were added
+        """
+        if other.count > self.count:
+            raise ValueError("Cannot remove more values than were added")
+        if other.count == self.count:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            self.min, self.max = float('inf'), float('-inf')
+            return self
+        if other.count:
+            total = self.count - other.count
+            mean = (self.mean * self.count - other.mean * other.count) / total
+            delta = other.mean - mean
+            m2 = self.m2 - other.m2 - delta ** 2 * total * other.count / self.count
+            self.count, self.mean, self.m2 = total, mean, max(m2, 0.0)
+        return self
+    
+    def _combine(self, count: int, mean: float, m2: float,
+                 minimum: float, maximum: float) -> None:
+        """Combine a partial state using Chan's pairwise update."""
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+        self.min = float(np.minimum(self.min, minimum))
+        self.max = float(np.maximum(self.max, maximum))
+    
+    @property
+    def variance(self) -> float:
+        """Population variance of the values seen so far."""
+        return self.m2 / self.count if self.count else float('nan')
+    
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the values seen so far."""
+        return float(np.sqrt(self.variance))
+    
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Return the statistics in the format of ``calculate_basic_stats``.
+        
+        Returns:
+            Dictionary with mean, std, variance, min, max and count
+            
+        Raises:
+            ValueError: If no values have been added
+        """
+        if self.count == 0:
+            raise ValueError("Cannot calculate statistics on empty data")
+        
+        return {
+            'mean': float(self.mean),
+            'std': self.std,
+            'variance': float(self.variance),
+            'min': float(self.min),
+            'max': float(self.max),
+            'count': int(self.count)
+        }
+
+def as_array(data: NumericData) -> np.ndarray:
+    """
+    Return data as an ndarray, copying only when unavoidable.
+    
+    Paths to ``.npy`` files are opened memory-mapped, ndarrays (including
+    memmaps) and Series with NumPy dtypes are used as they are, and objects
+    supporting the buffer protocol are wrapped without a copy. Other inputs,
+    such as lists, are converted.
+    
+    Args:
+        data: Numeric data, a path to a ``.npy`` file, or a buffer
+        
+    Returns:
+        Array view of the data
+    """
+    if isinstance(data, (str, os.PathLike)):
+        return np.load(data, mmap_mode='r')
+    if isinstance(data, np.ndarray):
+        return data
+    if isinstance(data, pd.Series):
+        if isinstance(data.dtype, np.dtype):
+            return data.to_numpy()
+        return data.to_numpy(dtype=float, na_value=np.nan)
+    try:
+        return np.asarray(memoryview(data))
+    except TypeError:
+        return np.asarray(data)
+
+def _blocks(values: np.ndarray) -> Iterator[Tuple[int, np.ndarray]]:
+    """Yield (offset, float block) pairs covering a 1-D array."""
+    for start in range(0, len(values), BLOCK_SIZE):
+        yield start, values[start:start + BLOCK_SIZE].astype(float, copy=False)
+
+def _percentiles(values: np.ndarray, percentiles: List[float]) -> List[float]:
+    """
+    Compute exact percentiles with linear interpolation, like np.percentile.
+    
+    Small arrays go straight to NumPy. Larger ones are never sorted or
+    copied: each requested order statistic is located by repeatedly
+    histogramming the blocks that fall into a shrinking value range, and
+    the final candidates (at most ``BLOCK_SIZE`` values) are selected with
+    ``np.partition``.
+    """
+    if len(values) <= BLOCK_SIZE:
+        return [float(v) for v in np.percentile(values, percentiles)]
+    
+    # Infinite values are counted rather than selected: histogram bins need
+    # finite edges, so the search runs over the range of the finite values
+    minimum, maximum = float('inf'), float('-inf')
+    below = above = 0
+    for _, block in _blocks(values):
+        if np.isnan(block).any():
+            return [float('nan')] * len(percentiles)
+        negative = np.count_nonzero(block == -np.inf)
+        positive = np.count_nonzero(block == np.inf)
+        if negative or positive:
+            block = block[np.isfinite(block)]
+            below, above = below + negative, above + positive
+        if len(block):
+            minimum = min(minimum, float(block.min()))
+            maximum = max(maximum, float(block.max()))
+    
+    positions = [(len(values) - 1) * p / 100 for p in percentiles]
+    ranks = sorted({int(np.floor(pos)) for pos in positions} |
+                   {min(int(np.floor(pos)) + 1, len(values) - 1) for pos in positions})
+    finite = [rank for rank in ranks if below <= rank < len(values) - above]
+    selected = _select_ranks(values, finite, minimum, maximum, below)
+    selected.update({rank: float('-inf') for rank in ranks if rank < below})
+    selected.update({rank: float('inf') for rank in ranks
+                     if rank >= len(values) - above})
+    
+    result = []
+    for pos in positions:
+        low = int(np.floor(pos))
+        high = min(low + 1, len(values) - 1)
+        a, b = selected[low], selected[high]
+        if a == b or pos == low:
+            result.append(float(a))
+        else:
+            result.append(float(a + (b - a) * (pos - low)))
+    return result
+
+def _select_ranks(values: np.ndarray,
+                  ranks: List[int],
+                  minimum: float,
+                  maximum: float,
+                  below: int = 0) -> Dict[int, float]:
+    """
+    Find order statistics of a large array without sorting it.
+    
+    The ranks must fall among the values in ``[minimum, maximum]``, which
+    have to be finite; ``below`` is the number of values under ``minimum``.
+    """
+    # rank -> [low, high, high_inclusive, values below low]
+    state = {rank: [minimum, maximum, True, below] for rank in ranks}
+    selected: Dict[int, float] = {}
+    while state:
+        edges = {}
+        for rank, (low, high, _, _) in state.items():
+            if low == high:
+                selected[rank] = low
+            else:
+                edges[rank] = np.linspace(low, high, SELECT_BINS + 1)
+        state = {rank: state[rank] for rank in edges}
+        collapsed = [r for r in edges if np.any(np.diff(edges[r]) <= 0)]
+        if collapsed:
+            for rank in collapsed:
+                selected[rank] = _select_in_range(values, rank, state.pop(rank))
+                del edges[rank]
+        if not state:
+            break
+        
+        counts = {rank: np.zeros(SELECT_BINS, dtype=np.int64) for rank in state}
+        for _, block in _blocks(values):
+            for rank, (low, high, inclusive, _) in state.items():
+                counts[rank] += np.histogram(block, bins=edges[rank])[0]
+                if not inclusive:
+                    counts[rank][-1] -= np.count_nonzero(block == high)
+        
+        ready = {}
+        for rank, bounds in state.items():
+            cumulative = np.cumsum(counts[rank])
+            target = rank - bounds[3]
+            index = int(np.searchsorted(cumulative, target, side='right'))
+            bounds[3] += int(cumulative[index] - counts[rank][index])
+            bounds[2] = bounds[2] and index == SELECT_BINS - 1
+            bounds[0], bounds[1] = edges[rank][index], edges[rank][index + 1]
+            if counts[rank][index] <= BLOCK_SIZE:
+                ready[rank] = bounds
+        for rank, bounds in ready.items():
+            selected[rank] = _select_in_range(values, rank, state.pop(rank))
+    return selected
 
-NumericData = Union[List[float], pd.Series, np.ndarray]
+def _select_in_range(values: np.ndarray, rank: int, bounds: List[Any]) -> float:
+    """Select an order statistic among the values inside a value range."""
+    low, high, inclusive, below = bounds
+    parts = []
+    for _, block in _blocks(values):
+        upper = block <= high if inclusive else block < high
+        parts.append(block[(block >= low) & upper])
+    candidates = np.concatenate(parts)
+    return float(np.partition(candidates, rank - below)[rank - below])
 
 def calculate_basic_stats(data: NumericData) -> Dict[str, float]:
     """
     Calculate basic statistical measures.
     
     Args:
-        data: Numeric data to analyze
-        
+        data: Numeric data to analyze, a path to a ``.npy`` file (opened
+            memory-mapped) or a buffer
+            
     Returns:
         Dictionary containing basic statistics
         
     Raises:
         ValueError: If input data is empty
     """
-    data = np.array(data)
+    data = as_array(data)
     if len(data) == 0:
         raise ValueError("Cannot calculate statistics on empty data")
     
+    running = RunningStats(skipna=False, block_size=BLOCK_SIZE).update(data)
     stats = {
-        'mean': float(np.mean(data)),
-        'median': float(np.median(data)),
-        'std': float(np.std(data)),
-        'min': float(np.min(data)),
-        'max': float(np.max(data)),
-        'count': int(len(data))
+        'mean': float(running.mean),
+        'median': _percentiles(data, [50])[0],
+        'std': running.std,
+        'min': float(running.min),
+        'max': float(running.max),
+        'count': int(running.count)
     }
     return stats
 
-def calculate_percentiles(data: NumericData, 
-                        percentiles: Optional[List[float]] = None) -> Dict[str, float]:
+def calculate_streaming_stats(batches: Iterable[NumericData]) -> Dict[str, float]:
+    """
+    Calculate basic statistics over data delivered in batches.
+    
+    Args:
+        batches: Iterable of numeric batches, e.g. chunks read from disk
+        
+    Returns:
+        Dictionary with mean, std, variance, min, max and count
+        
+    Raises:
+        ValueError: If the batches contain no values
+    """
+    stats = RunningStats()
+    for batch in batches:
+        stats.update(batch)
+    return stats.to_dict()
+
+def calculate_percentiles(data: Union[NumericData, KLLSketch], 
+                        percentiles: Optional[List[float]] = None,
+                        approximate: bool = False,
+                        epsilon: float = 0.01) -> Dict[str, float]:
     """
     Calculate percentiles of the data.
     
+    Exact percentiles need the whole array in memory. With ``approximate``
+    (or when ``data`` already is a ``KLLSketch``, e.g. one merged from
+    several workers) they are read from a quantile sketch instead, with a
+    rank error of about ``epsilon``.
+    
     Args:
-        data: Numeric data to analyze
+        data: Numeric data to analyze, or a prebuilt quantile sketch
         percentiles: List of percentiles to calculate (0-100)
+        approximate: Whether to estimate percentiles with a sketch
+        epsilon: Rank error of the sketch in approximate mode
         
     Returns:
         Dictionary mapping percentile names to values
@@ -50,45 +385,247 @@ def calculate_percentiles(data: NumericData,
     Raises:
         ValueError: If input data is empty or percentiles are invalid
     """
-    data = np.array(data)
+    if percentiles is None:
+        percentiles = [25, 50, 75]
+    
+    if not all(0 <= p <= 100 for p in percentiles):
+        raise ValueError("Percentiles must be between 0 and 100")
+    
+    sketch = _as_sketch(data, approximate, epsilon)
+    if sketch is not None:
+        if sketch.count == 0:
+            raise ValueError("Cannot calculate percentiles on empty data")
+        values = sketch.quantile([p / 100 for p in percentiles])
+        return {f'p{p}': float(v) for p, v in zip(percentiles, values)}
+    
+    data = as_array(data)
     if len(data) == 0:
         raise ValueError("Cannot calculate percentiles on empty data")
     
-    if percentiles is None:
-        percentiles = [25, 50, 75]
+    values = _percentiles(data, percentiles)
+    return {f'p{p}': v for p, v in zip(percentiles, values)}
+
+def calculate_grouped_stats(data: NumericData,
+                            keys: Union[List[Any], pd.Series, np.ndarray],
+                            percentiles: Optional[List[float]] = None) -> pd.DataFrame:
+    """
+    Calculate basic statistics and percentiles for every group of a key.
+    
+    All groups are handled in one vectorized pass: the keys are factorized,
+    the values are sorted by group and then by value, and every statistic is
+    read from contiguous group segments with ``reduceat`` or index
+    arithmetic. There is no per-group Python work, so millions of groups
+    cost about as much as a few.
     
+    As with ``calculate_basic_stats``, a NaN value makes every statistic of
+    its group NaN except the count. Rows with a missing key are ignored.
+    
+    Args:
+        data: Numeric values
+        keys: Group key of every value
+        percentiles: Percentiles (0-100) to add as ``p<percentile>`` columns
+        
+    Returns:
+        DataFrame indexed by sorted group key with the columns of
+        ``calculate_basic_stats`` followed by the requested percentiles
+        
+    Raises:
+        ValueError: If inputs have different lengths, are empty or
+            percentiles are invalid
+    """
+    percentiles = percentiles or []
     if not all(0 <= p <= 100 for p in percentiles):
         raise ValueError("Percentiles must be between 0 and 100")
     
-    return {f'p{p}': float(np.percentile(data, p)) for p in percentiles}
+    values = as_array(data).ravel()
+    name = keys.name if isinstance(keys, pd.Series) else None
+    if not isinstance(keys, (pd.Series, np.ndarray)):
+        keys = np.asarray(keys)
+    if len(values) != len(keys):
+        raise ValueError("Values and keys must have the same length")
+    
+    codes, uniques = pd.factorize(keys, sort=True)
+    present = codes >= 0
+    if not present.all():
+        values, codes = values[present], codes[present]
+    if len(values) == 0:
+        raise ValueError("Cannot calculate statistics on empty data")
+    
+    # Sort by value, then stably by group: cheaper than a two-key lexsort
+    order = np.argsort(values)
+    order = order[np.argsort(codes[order], kind='stable')]
+    values = values[order].astype(float, copy=False)
+    codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    counts = np.diff(np.r_[starts, len(values)])
+    
+    mean = np.add.reduceat(values, starts) / counts
+    deviations = values - np.repeat(mean, counts)
+    std = np.sqrt(np.add.reduceat(deviations * deviations, starts) / counts)
+    has_nan = np.isnan(values[starts + counts - 1])
+    
+    def percentile(p: float) -> np.ndarray:
+        position = (counts - 1) * p / 100
+        low = np.floor(position).astype(np.int64)
+        high = np.minimum(low + 1, counts - 1)
+        a, b = values[starts + low], values[starts + high]
+        return np.where(has_nan, np.nan, a + (b - a) * (position - low))
+    
+    result = {
+        'mean': mean,
+        'median': percentile(50),
+        'std': std,
+        'min': np.where(has_nan, np.nan, values[starts]),
+        'max': values[starts + counts - 1],
+        'count': counts
+    }
+    for p in percentiles:
+        result[f'p{p}'] = percentile(p)
+    index = pd.Index(uniques[codes[starts]], name=name)
+    return pd.DataFrame(result, index=index)
 
-def detect_outliers(data: NumericData, threshold: float = 1.5) -> List[float]:
+def calculate_iqr_bounds(data: Union[NumericData, KLLSketch],
+                         threshold: float = 1.5,
+                         approximate: bool = False,
+                         epsilon: float = 0.01) -> Tuple[float, float]:
     """
-    Detect outliers using IQR method.
+    Calculate the lower and upper IQR outlier bounds.
     
     Args:
-        data: Numeric data to analyze
+        data: Numeric data to analyze, or a prebuilt quantile sketch
         threshold: IQR multiplier for outlier detection
+        approximate: Whether to estimate the quartiles with a sketch
+        epsilon: Rank error of the sketch in approximate mode
         
     Returns:
-        List of values identified as outliers
+        Tuple of (lower_bound, upper_bound)
         
     Raises:
         ValueError: If input data is empty
     """
-    data = np.array(data)
-    if len(data) == 0:
+    try:
+        quartiles = calculate_percentiles(data, [25, 75], approximate, epsilon)
+    except ValueError:
         raise ValueError("Cannot detect outliers in empty data")
     
-    q1 = np.percentile(data, 25)
-    q3 = np.percentile(data, 75)
+    q1, q3 = quartiles['p25'], quartiles['p75']
     iqr = q3 - q1
+    return q1 - threshold * iqr, q3 + threshold * iqr
+
+def detect_outliers(data: Union[NumericData, pd.DataFrame],
+                    threshold: float = 1.5,
+                    approximate: bool = False,
+                    epsilon: float = 0.01,
+                    return_type: str = 'list') -> Any:
+    """
+    Detect outliers using IQR method.
     
-    lower_bound = q1 - threshold * iqr
-    upper_bound = q3 + threshold * iqr
+    The comparison against the bounds is a single vectorized pass. For a
+    2-D array or a DataFrame the bounds of every (numeric) column are
+    computed in one call, missing values are ignored, and the result is a
+    dictionary keyed by column (column position for arrays), except for
+    ``'mask'`` which returns a 2-D mask of the input's shape.
     
-    outliers = [float(x) for x in data if x < lower_bound or x > upper_bound]
-    return outliers
+    Args:
+        data: Numeric data to analyze, 1-D or 2-D
+        threshold: IQR multiplier for outlier detection
+        approximate: Whether to estimate the quartiles with a sketch
+        epsilon: Rank error of the sketch in approximate mode
+        return_type: 'list' for a list of floats, 'array' for an ndarray of
+            outlier values, 'mask' for a boolean mask, or 'indices' for
+            the positions of the outliers
+            
+    Returns:
+        Outliers in the requested format
+        
+    Raises:
+        ValueError: If input data is empty or return_type is unknown
+    """
+    if return_type not in OUTLIER_RETURN_TYPES:
+        raise ValueError(
+            f"return_type must be one of {OUTLIER_RETURN_TYPES}, got {return_type!r}"
+        )
+    
+    if not isinstance(data, pd.DataFrame):
+        data = as_array(data)
+    if data.ndim == 2:
+        return _detect_outliers_2d(data, threshold, approximate, epsilon,
+                                   return_type)
+    
+    values = data
+    if len(values) == 0:
+        raise ValueError("Cannot detect outliers in empty data")
+    
+    lower_bound, upper_bound = calculate_iqr_bounds(
+        values, threshold, approximate, epsilon
+    )
+    if return_type == 'mask' or len(values) <= BLOCK_SIZE:
+        mask = (values < lower_bound) | (values > upper_bound)
+        return _format_outliers(values, mask, return_type)
+    
+    parts = []
+    for start, block in _blocks(values):
+        mask = (block < lower_bound) | (block > upper_bound)
+        if return_type == 'indices':
+            parts.append(np.flatnonzero(mask) + start)
+        else:
+            parts.append(values[start:start + len(block)][mask])
+    result = np.concatenate(parts)
+    return result.astype(float).tolist() if return_type == 'list' else result
+
+def _detect_outliers_2d(data: Union[np.ndarray, pd.DataFrame],
+                        threshold: float,
+                        approximate: bool,
+                        epsilon: float,
+                        return_type: str) -> Any:
+    """Detect outliers column by column with vectorized bounds."""
+    if isinstance(data, pd.DataFrame):
+        frame = data.select_dtypes(include='number')
+        columns = list(frame.columns)
+        values = frame.to_numpy(dtype=float)
+    else:
+        values = np.asarray(data, dtype=float)
+        columns = list(range(values.shape[1]))
+    if values.size == 0:
+        raise ValueError("Cannot detect outliers in empty data")
+    
+    if approximate:
+        sketches = [KLLSketch(epsilon=epsilon).update(values[:, i])
+                    for i in range(values.shape[1])]
+        q1, q3 = np.array([sketch.quantile([0.25, 0.75]) for sketch in sketches]).T
+    else:
+        q1, q3 = np.nanpercentile(values, [25, 75], axis=0)
+    iqr = q3 - q1
+    mask = (values < q1 - threshold * iqr) | (values > q3 + threshold * iqr)
+    
+    if return_type == 'mask':
+        if isinstance(data, pd.DataFrame):
+            return pd.DataFrame(mask, index=data.index, columns=columns)
+        return mask
+    return {
+        column: _format_outliers(values[:, i], mask[:, i], return_type)
+        for i, column in enumerate(columns)
+    }
+
+def _format_outliers(values: np.ndarray, mask: np.ndarray, return_type: str) -> Any:
+    """Convert an outlier mask into the requested result format."""
+    if return_type == 'mask':
+        return mask
+    if return_type == 'indices':
+        return np.flatnonzero(mask)
+    if return_type == 'array':
+        return values[mask]
+    return values[mask].astype(float).tolist()
+
+def _as_sketch(data: Union[NumericData, KLLSketch],
+               approximate: bool,
+               epsilon: float) -> Optional[KLLSketch]:
+    """Return a quantile sketch for data, or None in exact mode."""
+    if isinstance(data, KLLSketch):
+        return data
+    if approximate:
+        return KLLSketch(epsilon=epsilon).update(as_array(data))
+    return None
 
 def calculate_correlation(x: NumericData, y: NumericData) -> float:
     """
@@ -104,10 +641,130 @@ def calculate_correlation(x: NumericData, y: NumericData) -> float:
     Raises:
         ValueError: If inputs have different lengths or are empty
     """
-    x, y = np.array(x), np.array(y)
+    x, y = as_array(x), as_array(y)
     if len(x) != len(y):
         raise ValueError("Inputs must have the same length")
     if len(x) == 0:
         raise ValueError("Cannot calculate correlation for empty data")
     
-    return float(np.corrcoef(x, y)[0, 1]) 
\ No newline at end of file
+    if len(x) <= BLOCK_SIZE:
+        return float(np.corrcoef(x, y)[0, 1])
+    
+    mean_x = RunningStats(skipna=False, block_size=BLOCK_SIZE).update(x).mean
+    mean_y = RunningStats(skipna=False, block_size=BLOCK_SIZE).update(y).mean
+    sxy = sxx = syy = 0.0
+    for start, block_x in _blocks(x):
+        dx = block_x - mean_x
+        dy = y[start:start + BLOCK_SIZE].astype(float, copy=False) - mean_y
+        sxy += float(dx @ dy)
+        sxx += float(dx @ dx)
+        syy += float(dy @ dy)
+    return sxy / float(np.sqrt(sxx * syy))
+
+def calculate_correlation_matrix(data: Union[pd.DataFrame, np.ndarray],
+                                 method: str = 'pearson',
+                                 pairwise: bool = True) -> pd.DataFrame:
+    """
+    Calculate the correlation of every pair of numeric columns.
+    
+    Rows are read in blocks of about ``BLOCK_SIZE`` values, and each block
+    adds its contribution to all pairs at once through matrix products, so
+    temporaries stay bounded however tall or wide the input is. Spearman
+    correlation is the Pearson correlation of average ranks; ranking needs
+    whole columns, so it holds one float array of ranks, O(n * k) memory for
+    n rows and k columns, filled one column at a time.
+    
+    With ``pairwise`` every pair uses the rows where both columns are
+    present, as in ``DataFrame.corr``; otherwise a NaN makes all
+    correlations of its column NaN. For Spearman, ranks are taken over the
+    non-missing values of each column before pairing.
+    
+    Args:
+        data: DataFrame, whose numeric columns are used, or a 2-D array with
+            one column per variable
+        method: 'pearson' or 'spearman'
+        pairwise: Whether to drop missing values pair by pair
+        
+    Returns:
+        Square DataFrame of correlations labelled by column
+        
+    Raises:
+        ValueError: If the method is unknown or the input is not 2-D
+    """
+    if method not in CORRELATION_METHODS:
+        raise ValueError(f"method must be one of {CORRELATION_METHODS}")
+    
+    if isinstance(data, pd.DataFrame):
+        labels = [column for column, dtype in data.dtypes.items()
+                  if pd.api.types.is_integer_dtype(dtype)
+                  or pd.api.types.is_float_dtype(dtype)]
+        frame = data[labels]
+    else:
+        values = as_array(data)
+        if values.ndim != 2:
+            raise ValueError("Array input must be 2-D")
+        labels = list(range(values.shape[1]))
+        frame = values
+    if method == 'spearman':
+        ranks = np.empty((len(frame), len(labels)))
+        for i in range(len(labels)):
+            if isinstance(frame, pd.DataFrame):
+                column = frame.iloc[:, i]
+            else:
+                column = pd.Series(frame[:, i])
+            ranks[:, i] = column.rank().to_numpy(dtype=float, na_value=np.nan)
+        frame = ranks
+    
+    def blocks() -> Iterator[np.ndarray]:
+        step = max(1, BLOCK_SIZE // max(len(labels), 1))
+        for start in range(0, len(frame), step):
+            if isinstance(frame, pd.DataFrame):
+                yield frame.iloc[start:start + step].to_numpy(dtype=float,
+                                                              na_value=np.nan)
+            else:
+                yield frame[start:start + step].astype(float, copy=False)
+    
+    # First pass: column means, used as shifts to keep the sums well conditioned
+    total = np.zeros(len(labels))
+    present = np.zeros(len(labels))
+    for block in blocks():
+        missing = np.isnan(block)
+        total += np.where(missing, 0.0, block).sum(axis=0)
+        present += (~missing).sum(axis=0)
+    has_nan = bool((present < len(frame)).any())
+    with np.errstate(invalid='ignore', divide='ignore'):
+        shift = total / present
+    
+    if not (pairwise and has_nan):
+        # Second pass: centered Gram matrix, one matrix product per block
+        gram = np.zeros((len(labels), len(labels)))
+        for block in blocks():
+            centered = block - shift
+            gram += centered.T @ centered
+        with np.errstate(invalid='ignore', divide='ignore'):
+            scale = np.sqrt(np.diag(gram))
+            corr = gram / np.outer(scale, scale)
+    else:
+        # Second pass: co-moments over the rows where both columns are present
+        counts = np.zeros((len(labels), len(labels)))
+        sums = np.zeros_like(counts)
+        squares = np.zeros_like(counts)
+        products = np.zeros_like(counts)
+        for block in blocks():
+            mask = ~np.isnan(block)
+            centered = np.where(mask, block - np.nan_to_num(shift), 0.0)
+            weights = mask.astype(float)
+            counts += weights.T @ weights
+            sums += centered.T @ weights
+            squares += (centered * centered).T @ weights
+            products += centered.T @ centered
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = products - sums * sums.T / counts
+            var = squares - sums * sums / counts
+            corr = cov / np.sqrt(var * var.T)
+        corr[counts < 2] = np.nan
+    
+    corr = np.clip(corr, -1.0, 1.0)
+    valid = np.isfinite(np.diag(corr))
+    np.fill_diagonal(corr, np.where(valid, 1.0, np.nan))
+    return pd.DataFrame(corr, index=labels, columns=labels)
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+Incrementally maintained per-column counters behind DataProcessor.get_summary.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from data_wizard import plan
+from data_wizard.stats import RunningStats
+
+
+class SummaryState:
+    """
+    Row count, null counts, dtypes and running statistics of a DataFrame.
+    
+    The state is built with one pass over the frame and then kept up to date
+    from the rows that each operation appends or removes and from the values
+    it fills in, so reading the summary costs O(columns). Minimum and maximum
+    cannot be reverted when rows are removed; they are rescanned for a
+    column only when a removed value was one of its bounds.
+    """
+    
+    def __init__(self, data: pd.DataFrame):
+        """
+        Build the state with a full pass over the data.
+        
+        Args:
+            data: DataFrame to summarize
+        """
+        self.row_count = len(data)
+        self.columns: List[str] = list(data.columns)
+        self.dtypes: Dict[str, Any] = dict(data.dtypes.items())
+        self.nulls: Dict[str, int] = {
+            col: int(count) for col, count in data.isnull().sum().items()
+        }
+        self.stats: Dict[str, RunningStats] = {
+            col: RunningStats().update(data[col]) for col in self.numeric_columns()
+        }
+    
+    def numeric_columns(self) -> List[str]:
+        """Return the numeric columns in frame order."""
+        return [c for c in self.columns if plan.is_numeric(self.dtypes[c])]
+    
+    def append(self, rows: pd.DataFrame, data: pd.DataFrame) -> None:
+        """
+        Account for rows appended to the frame.
+        
+        Args:
+            rows: The appended rows
+            data: The frame after the append, used for dtype changes
+        """
+        self.row_count += len(rows)
+        for col, count in rows.isnull().sum().items():
+            self.nulls[col] += int(count)
+        self.dtypes = dict(data.dtypes.items())
+        numeric = self.numeric_columns()
+        for col in list(self.stats):
+            if col not in numeric:
+                del self.stats[col]
+        for col in numeric:
+            if col in self.stats:
+                self.stats[col].update(rows[col])
+            else:
+                self.stats[col] = RunningStats().update(data[col])
+    
+    def remove(self, rows: pd.DataFrame, data: pd.DataFrame) -> None:
+        """
+        Account for rows removed from the frame.
+        
+        Args:
+            rows: The removed rows
+            data: The frame after the removal, used to rescan bounds
+        """
+        if len(rows) == 0:
+            return
+        self.row_count -= len(rows)
+        for col, count in rows[self.columns].isnull().sum().items():
+            self.nulls[col] -= int(count)
+        for col, running in self.stats.items():
+            removed = RunningStats().update(rows[col])
+            running.subtract(removed)
+            if running.count and (removed.min <= running.min or
+                                  removed.max >= running.max):
+                running.min = float(data[col].min())
+                running.max = float(data[col].max())
+    
+    def fill(self, values: Dict[str, float]) -> None:
+        """
+        Account for missing values filled with a constant per column.
+        
+        Args:
+            values: Fill value of each column whose nulls were all filled
+        """
+        for col, value in values.items():
+            count = self.nulls[col]
+            if count == 0 or pd.isna(value):
+                continue
+            self.nulls[col] = 0
+            if col in self.stats:
+                self.stats[col].update_repeated(value, count)
+    
+    def select(self, columns: List[str]) -> None:
+        """
+        Keep only the given columns.
+        
+        Args:
+            columns: Columns kept, in output order
+        """
+        self.columns = list(columns)
+        self.dtypes = {c: self.dtypes[c] for c in columns}
+        self.nulls = {c: self.nulls[c] for c in columns}
+        self.stats = {c: s for c, s in self.stats.items() if c in columns}
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        Return the summary in the format of ``DataProcessor.get_summary``.
+        
+        Returns:
+            Dictionary containing summary statistics
+        """
+        numeric_cols = self.numeric_columns()
+        return {
+            'row_count': self.row_count,
+            'column_count': len(self.columns),
+            'numeric_columns': numeric_cols,
+            'categorical_columns': list(set(self.columns) - set(numeric_cols)),
+            'missing_values': dict(self.nulls)
+        }
+    
+    def column_stats(self) -> Dict[str, Optional[Dict[str, float]]]:
+        """
+        Return the running statistics of every numeric column.
+        
+        Returns:
+            Dictionary mapping columns to ``RunningStats.to_dict`` results,
+            or None for columns without any values
+        """
+        return {
+            col: running.to_dict() if running.count else None
+            for col, running in self.stats.items()
+        }
\ No newline at end of file
@@ -3,9 +3,8 @@ Utility functions for the Data Wizard package.
 """
 
 import os
-import json
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pathlib import Path
 
 # Set up logging
@@ -37,24 +36,26 @@ def validate_file_path(file_path: str) -> bool:
     
     return True
 
-def save_json_report(data: Dict[str, Any], output_path: str) -> None:
+def save_json_report(data: Dict[str, Any],
+                     output_path: str,
+                     compression: Optional[str] = 'infer') -> None:
     """
     Save dictionary data as JSON file.
     
+    NumPy and pandas values are serialized directly; see
+    ``data_wizard.report`` for the NDJSON writer.
+    
     Args:
         data: Dictionary to save
         output_path: Path where to save the JSON file
+        compression: 'gzip', 'zstd', None, or 'infer' from the file suffix
         
     Raises:
         IOError: If there's an error writing the file
     """
-    try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
-        logger.info(f"Report saved successfully to {output_path}")
-    except Exception as e:
-        logger.error(f"Error saving report: {str(e)}")
-        raise
+    # Imported here so that importing utils does not load the JSON encoders
+    from data_wizard.report import write_json
+    write_json(data, output_path, compression=compression)
 
 def format_number(value: float, decimal_places: int = 2) -> str:
     """
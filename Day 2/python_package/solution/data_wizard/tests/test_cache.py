@@ -0,0 +1,107 @@
+"""
+Tests for the columnar CSV cache.
+"""
+
+import os
+
+import pytest
+import pandas as pd
+import numpy as np
+from data_wizard.cache import CSVCache
+from data_wizard.processor import DataProcessor
+
+@pytest.fixture
+def sample_data():
+    """Create sample data for testing."""
+    return pd.DataFrame({
+        'id': [1, 2, 2, 3, 4],
+        'value': [10.0, 20.0, 20.0, None, 40.0],
+        'category': ['A', 'B', 'B', 'C', 'D']
+    })
+
+@pytest.fixture
+def temp_csv(tmp_path, sample_data):
+    """Create a temporary CSV file with sample data."""
+    file_path = tmp_path / "test.csv"
+    sample_data.to_csv(file_path, index=False)
+    return str(file_path)
+
+def is_memory_mapped(array):
+    """Check whether an array is backed by a memory-mapped file."""
+    while array is not None and not isinstance(array, np.memmap):
+        array = array.base
+    return array is not None
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an empty cache in a temporary directory."""
+    return CSVCache(str(tmp_path / "cache"))
+
+def test_miss_then_hit(cache, temp_csv, sample_data):
+    """Test that the second load is served from the cache."""
+    first = cache.load(temp_csv)
+    assert cache.size() > 0
+    second = cache.load(temp_csv)
+    
+    pd.testing.assert_frame_equal(first, sample_data)
+    pd.testing.assert_frame_equal(second, sample_data)
+    assert is_memory_mapped(second['value'].values)
+
+def test_column_subset(cache, temp_csv):
+    """Test loading only some columns from a cached entry."""
+    cache.load(temp_csv)
+    result = cache.load(temp_csv, columns=['category', 'id'])
+    assert list(result.columns) == ['category', 'id']
+
+def test_cached_data_is_writable(cache, temp_csv):
+    """Test that memory-mapped columns can be modified in memory."""
+    cache.load(temp_csv)
+    data = cache.load(temp_csv)
+    data.loc[0, 'value'] = -1.0
+    assert cache.load(temp_csv).loc[0, 'value'] == 10.0
+
+def test_modified_source_is_reloaded(cache, temp_csv):
+    """Test that changing the source file replaces the cache entry."""
+    cache.load(temp_csv)
+    pd.DataFrame({'id': [9]}).to_csv(temp_csv, index=False)
+    os.utime(temp_csv, ns=(1, 1))
+    
+    assert list(cache.load(temp_csv)['id']) == [9]
+    assert len(list(cache.cache_dir.iterdir())) == 1
+
+def test_invalidate(cache, temp_csv):
+    """Test explicit invalidation."""
+    cache.load(temp_csv)
+    assert cache.invalidate(temp_csv) == 1
+    assert cache.size() == 0
+
+def test_lru_eviction(tmp_path, sample_data):
+    """Test that the least recently used entry is evicted first."""
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"data_{i}.csv"
+        sample_data.to_csv(path, index=False)
+        paths.append(str(path))
+    cache = CSVCache(str(tmp_path / "cache"))
+    cache.load(paths[0])
+    entry_size = cache.size()
+    cache.max_bytes = 2 * entry_size
+    
+    cache.load(paths[1])
+    os.utime(cache.cache_dir / cache.key(paths[0]) / 'meta.json', (1, 1))
+    os.utime(cache.cache_dir / cache.key(paths[1]) / 'meta.json', (2, 2))
+    cache.load(paths[2])
+    
+    remaining = {meta['source'] for _, meta in cache._entries()}
+    assert remaining == {os.path.abspath(paths[1]), os.path.abspath(paths[2])}
+
+def test_processor_uses_cache(cache, temp_csv, sample_data):
+    """Test eager and lazy DataProcessor loads through the cache."""
+    DataProcessor(temp_csv, cache=cache)
+    processor = DataProcessor(temp_csv, cache=cache)
+    pd.testing.assert_frame_equal(processor.data, sample_data)
+    
+    lazy = DataProcessor(temp_csv, lazy=True, cache=cache)
+    result = lazy.select_columns(['value']).clean_data().collect()
+    assert list(result.columns) == ['value']
+    assert len(result) == 4
\ No newline at end of file
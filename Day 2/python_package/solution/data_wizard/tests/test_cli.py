@@ -0,0 +1,138 @@
+"""
+Tests for the data-wizard batch runner.
+"""
+
+import gzip
+import json
+
+import pytest
+import numpy as np
+import pandas as pd
+from data_wizard import cli
+from data_wizard.processor import DataProcessor
+
+@pytest.fixture
+def sales_dir(tmp_path):
+    """Create a directory of sales CSV files."""
+    rng = np.random.default_rng(0)
+    for index in range(4):
+        df = pd.DataFrame({
+            'order_id': rng.integers(0, 50, 200),
+            'region': rng.choice(['EU', 'US', 'APAC'], 200),
+            'revenue': rng.normal(1000, 300, 200).round(0)
+        })
+        df.loc[rng.choice(200, 10, replace=False), 'revenue'] = np.nan
+        df.to_csv(tmp_path / f"sales-{index}.csv", index=False)
+    return tmp_path
+
+def write_spec(path, jobs, workers=2):
+    """Write a job spec file."""
+    path.write_text(json.dumps({'workers': workers, 'jobs': jobs}))
+    return str(path)
+
+def job(sales_dir, **overrides):
+    """Build a job entry reading every sales file."""
+    entry = {
+        'name': 'sales',
+        'inputs': [str(sales_dir / "sales-*.csv")],
+        'clean': True,
+        'filters': [{'column': 'revenue', 'op': '>', 'value': 900},
+                    {'column': 'region', 'op': 'isin', 'value': ['EU', 'US']}],
+        'select': ['order_id', 'revenue'],
+        'stats': {'percentiles': [50]},
+        'output': {'dir': str(sales_dir / "out")}
+    }
+    entry.update(overrides)
+    return entry
+
+def expected_output(path):
+    """Run the job steps on one file with DataProcessor."""
+    processor = DataProcessor(str(path)).clean_data()
+    processor.filter_by_column('revenue', lambda x: x > 900)
+    processor.filter_by_column('region', lambda x: x.isin(['EU', 'US']))
+    return processor.select_columns(['order_id', 'revenue']).data.reset_index(drop=True)
+
+@pytest.mark.parametrize("chunksize", [None, 64])
+def test_cli_runs_jobs(sales_dir, capsys, chunksize):
+    """Test per-file outputs, merged statistics and the throughput line."""
+    spec = write_spec(sales_dir / "spec.json", [job(sales_dir, chunksize=chunksize)])
+    assert cli.main([spec]) == 0
+    assert capsys.readouterr().out.startswith("sales: 4 files, ")
+    
+    outputs = []
+    for index in range(4):
+        result = pd.read_csv(sales_dir / "out" / f"sales-{index}.csv")
+        expected = expected_output(sales_dir / f"sales-{index}.csv")
+        if chunksize is None:
+            pd.testing.assert_frame_equal(result, expected)
+        outputs.append(result)
+    
+    report = json.loads((sales_dir / "out" / "report.json").read_text())
+    combined = pd.concat(outputs)
+    assert report['rows_out'] == len(combined)
+    revenue = report['stats']['revenue']
+    assert revenue['count'] == combined['revenue'].count()
+    assert revenue['mean'] == pytest.approx(combined['revenue'].mean())
+    assert set(report['stats']) == {'order_id', 'revenue'}
+
+def test_cli_ndjson_output(sales_dir):
+    """Test compressed NDJSON output and a single-job spec."""
+    entry = job(sales_dir, output={'dir': str(sales_dir / "out"), 'format': 'ndjson',
+                                   'compression': 'gzip'})
+    spec = sales_dir / "spec.json"
+    spec.write_text(json.dumps(entry))
+    assert cli.main([str(spec), '--workers', '1']) == 0
+    
+    with gzip.open(sales_dir / "out" / "sales-0.ndjson.gz", 'rt') as f:
+        records = [json.loads(line) for line in f]
+    expected = expected_output(sales_dir / "sales-0.csv")
+    assert [r['order_id'] for r in records] == expected['order_id'].tolist()
+
+def test_cli_reports_failed_files(sales_dir):
+    """Test that a bad file fails alone and sets the exit status."""
+    (sales_dir / "sales-9.csv").write_text("order_id,region\n1,EU\n")
+    spec = write_spec(sales_dir / "spec.json", [job(sales_dir)])
+    assert cli.main([spec]) == 1
+    report = json.loads((sales_dir / "out" / "report.json").read_text())
+    assert report['files'] == 5 and report['failed'] == 1
+
+def test_cli_filter_empties_first_chunks(tmp_path):
+    """Test that chunks emptied by the filter do not repeat the header."""
+    (tmp_path / "small.csv").write_text("a,b\n1,x\n2,y\n3,z\n4,w\n20,v\n30,u\n")
+    entry = {'inputs': [str(tmp_path / "small.csv")], 'chunksize': 2,
+             'filters': [{'column': 'a', 'op': '>', 'value': 10}],
+             'output': {'dir': str(tmp_path / "out")}}
+    assert cli.main([write_spec(tmp_path / "spec.json", [entry])]) == 0
+    lines = (tmp_path / "out" / "small.csv").read_text().splitlines()
+    assert lines == ["a,b", "20,v", "30,u"]
+
+def test_cli_same_name_in_subdirectories(sales_dir):
+    """Test that inputs sharing a file name get separate outputs."""
+    for index, day in enumerate(('day1', 'day2')):
+        (sales_dir / day).mkdir()
+        (sales_dir / f"sales-{index}.csv").rename(sales_dir / day / "sales.csv")
+    entry = job(sales_dir, inputs=[str(sales_dir / "day*" / "sales.csv")])
+    assert cli.main([write_spec(sales_dir / "spec.json", [entry])]) == 0
+    for day in ('day1', 'day2'):
+        result = pd.read_csv(sales_dir / "out" / day / "sales.csv")
+        expected = expected_output(sales_dir / day / "sales.csv")
+        pd.testing.assert_frame_equal(result, expected)
+
+def test_cli_colliding_outputs(sales_dir, capsys):
+    """Test that inputs mapping to one output file are rejected."""
+    (sales_dir / "sales-0.tsv").write_text("order_id,region,revenue\n1,EU,1000\n")
+    entry = job(sales_dir, inputs=[str(sales_dir / "sales-0.*")])
+    assert cli.main([write_spec(sales_dir / "spec.json", [entry])]) == 2
+    assert "sales-0.csv" in capsys.readouterr().err
+
+@pytest.mark.parametrize("entry", [
+    {'name': 'x'},
+    {'inputs': ['a.csv'], 'filters': [{'column': 'a', 'op': '~'}]},
+    {'inputs': ['a.csv'], 'output': {'format': 'xml'}},
+    {'inputs': ['a.csv'], 'unknown': 1},
+])
+def test_cli_invalid_spec(tmp_path, capsys, entry):
+    """Test that malformed specs are rejected before any work starts."""
+    spec = write_spec(tmp_path / "spec.json", [entry])
+    assert cli.main([spec]) == 2
+    assert capsys.readouterr().err.startswith("data-wizard: ")
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""
+Tests for out-of-core duplicate removal.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from data_wizard import dedupe
+from data_wizard.processor import DataProcessor
+
+@pytest.fixture
+def duplicated_frame():
+    """Create a frame with many duplicates and missing values."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'id': rng.integers(0, 300, 3000),
+        'value': rng.integers(0, 3, 3000).astype(float),
+        'category': rng.choice(['A', 'B'], 3000)
+    })
+    df.loc[rng.choice(3000, 200, replace=False), 'value'] = np.nan
+    return df
+
+@pytest.fixture(autouse=True)
+def few_partitions(monkeypatch):
+    """Use four partitions per level to keep the spill trees small."""
+    monkeypatch.setattr(dedupe, 'PARTITION_BITS', 2)
+
+def chunked(df, size):
+    """Split a frame into chunks of the given size."""
+    return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+def test_drop_duplicates_matches_pandas(tmp_path, duplicated_frame, monkeypatch):
+    """Test that the spilled result equals the in-memory dedupe."""
+    monkeypatch.setattr(dedupe, 'MERGE_ROWS', 50)
+    result = pd.concat(dedupe.drop_duplicates(
+        chunked(duplicated_frame, 257), spill_dir=str(tmp_path), memory_limit=20_000
+    ))
+    pd.testing.assert_frame_equal(result, duplicated_frame.drop_duplicates())
+    assert list(tmp_path.iterdir()) == []
+
+def test_drop_duplicates_bounded_partitions(tmp_path, duplicated_frame, monkeypatch):
+    """Test that no partition larger than the limit is deduplicated at once."""
+    sizes = []
+    original = dedupe._dedupe_partition
+    
+    def recording(path, size, workdir, memory_limit, depth):
+        if size <= memory_limit or dedupe.PARTITION_BITS * (depth + 2) > 64:
+            sizes.append(size)
+        return original(path, size, workdir, memory_limit, depth)
+    
+    monkeypatch.setattr(dedupe, '_dedupe_partition', recording)
+    list(dedupe.drop_duplicates(chunked(duplicated_frame, 500),
+                                spill_dir=str(tmp_path), memory_limit=15_000))
+    assert max(sizes) <= 15_000
+
+def test_drop_duplicates_bounded_fan_in(tmp_path, duplicated_frame, monkeypatch):
+    """Test that a deep split is merged back in rounds of few open files."""
+    fan_ins = []
+    original = dedupe._merge
+    
+    def recording(streams):
+        fan_ins.append(len(streams))
+        return original(streams)
+    
+    monkeypatch.setattr(dedupe, '_merge', recording)
+    monkeypatch.setattr(dedupe, 'MERGE_FAN_IN', 3)
+    monkeypatch.setattr(dedupe, 'MERGE_ROWS', 64)
+    result = pd.concat(dedupe.drop_duplicates(
+        chunked(duplicated_frame, 257), spill_dir=str(tmp_path), memory_limit=2_000
+    ))
+    pd.testing.assert_frame_equal(result, duplicated_frame.drop_duplicates())
+    assert len(fan_ins) > 3
+    assert max(fan_ins) <= 3
+    assert list(tmp_path.iterdir()) == []
+
+def test_drop_duplicates_identical_rows(tmp_path):
+    """Test rows that can never be split apart by further hash bits."""
+    df = pd.DataFrame({'a': [1] * 500, 'b': ['x'] * 500})
+    result = pd.concat(dedupe.drop_duplicates(chunked(df, 50), spill_dir=str(tmp_path),
+                                              memory_limit=100))
+    pd.testing.assert_frame_equal(result, df.iloc[:1])
+
+def test_row_hashes_ignore_chunk_dtypes():
+    """Test that equal rows hash alike across inferred column dtypes."""
+    as_int = pd.DataFrame({'a': [1, 2], 'b': ['x', None]})
+    as_float = pd.DataFrame({'a': [1.0, 2.0], 'b': ['x', np.nan]})
+    np.testing.assert_array_equal(dedupe.row_hashes(as_int),
+                                  dedupe.row_hashes(as_float))
+
+def test_drop_duplicates_across_chunk_dtypes(tmp_path):
+    """Test duplicates whose chunks were parsed with different dtypes."""
+    chunks = [pd.DataFrame({'a': [1, 2]}), pd.DataFrame({'a': [2.0, np.nan]},
+                                                       index=[2, 3])]
+    result = pd.concat(dedupe.drop_duplicates(chunks, spill_dir=str(tmp_path)))
+    assert result['a'].tolist()[:2] == [1.0, 2.0]
+    assert len(result) == 3
+
+@pytest.mark.parametrize("mode", [{}, {'lazy': True}, {'chunksize': 300}])
+def test_processor_out_of_core(tmp_path, duplicated_frame, mode):
+    """Test out-of-core cleaning in eager, lazy and streaming mode."""
+    file_path = tmp_path / "dups.csv"
+    duplicated_frame.to_csv(file_path, index=False)
+    spill_dir = tmp_path / "spill"
+    spill_dir.mkdir()
+    
+    expected = DataProcessor(str(file_path)).clean_data()
+    processor = DataProcessor(str(file_path), spill_dir=str(spill_dir),
+                              memory_limit=40_000, **mode)
+    processor.clean_data(out_of_core=True)
+    
+    output_path = tmp_path / "out.csv"
+    processor.save_csv(str(output_path))
+    expected.save_csv(str(tmp_path / "expected.csv"))
+    pd.testing.assert_frame_equal(pd.read_csv(output_path),
+                                  pd.read_csv(tmp_path / "expected.csv"))
+    assert list(spill_dir.iterdir()) == []
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""
+Tests for load-time dtype optimization.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from data_wizard.dtypes import downcast, infer_schema
+from data_wizard.processor import DataProcessor
+
+@pytest.fixture
+def typed_csv(tmp_path):
+    """Create a CSV with small integers, a low-cardinality string and gaps."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'id': np.arange(2000),
+        'small': rng.integers(0, 100, 2000),
+        'score': rng.integers(0, 8, 2000) / 4,
+        'price': rng.normal(100, 15, 2000),
+        'region': rng.choice(['north', 'south', 'east', 'west'], 2000),
+        'name': [f"user-{i}" for i in range(2000)]
+    })
+    df.loc[[5, 17], 'score'] = np.nan
+    df.loc[1999, 'id'] = 100_000
+    file_path = tmp_path / "typed.csv"
+    df.to_csv(file_path, index=False)
+    return str(file_path)
+
+def test_infer_schema(typed_csv):
+    """Test that only low-cardinality strings become categories."""
+    assert infer_schema(typed_csv) == {'region': 'category'}
+
+def test_downcast_uses_full_range():
+    """Test that integer widths follow the full value range."""
+    df = pd.DataFrame({'a': [1, 2, 300], 'b': [1, 2, 3], 'c': [0.5, np.nan, 1.0],
+                       'd': [0.1, 0.2, 0.3]})
+    downcast(df)
+    assert str(df['a'].dtype) == 'int16'
+    assert str(df['b'].dtype) == 'int8'
+    assert str(df['c'].dtype) == 'float32'
+    assert str(df['d'].dtype) == 'float64'  # float32 would change the values
+
+def test_load_csv_optimize_dtypes(typed_csv):
+    """Test that an optimized load keeps values and reports savings."""
+    default = DataProcessor(typed_csv).data
+    processor = DataProcessor().load_csv(typed_csv, optimize_dtypes=True)
+    
+    assert str(processor.data['id'].dtype) == 'int32'
+    assert str(processor.data['small'].dtype) == 'int8'
+    assert str(processor.data['score'].dtype) == 'float32'
+    assert str(processor.data['region'].dtype) == 'category'
+    pd.testing.assert_frame_equal(processor.data, default, check_dtype=False,
+                                  check_categorical=False)
+    report = processor.dtype_report
+    assert report['bytes_saved'] > 0
+    assert report['bytes_after'] < report['bytes_before']
+    assert report['dtypes']['small'] == 'int8'
+
+def test_load_csv_explicit_schema(typed_csv):
+    """Test that an explicit schema overrides inference and downcasting."""
+    processor = DataProcessor().load_csv(
+        typed_csv, optimize_dtypes=True, schema={'small': 'int64', 'name': 'category'}
+    )
+    assert str(processor.data['small'].dtype) == 'int64'
+    assert str(processor.data['name'].dtype) == 'category'
+    
+    plain = DataProcessor().load_csv(typed_csv, schema={'region': 'category'})
+    assert str(plain.data['region'].dtype) == 'category'
+    assert str(plain.data['small'].dtype) == 'int64'
+    assert plain.dtype_report is None
+
+def test_clean_and_summarize_downcast(typed_csv):
+    """Test that cleaning and summaries treat narrow dtypes as numeric."""
+    processor = DataProcessor().load_csv(typed_csv, optimize_dtypes=True)
+    summary = processor.get_summary()
+    assert summary['numeric_columns'] == ['id', 'small', 'score', 'price']
+    assert set(summary['categorical_columns']) == {'region', 'name'}
+    
+    processor.clean_data()
+    assert not processor.data['score'].isnull().any()
+    assert processor.get_summary()['missing_values']['score'] == 0
+
+def test_streaming_schema(typed_csv):
+    """Test that streamed chunks are parsed with the inferred categories."""
+    processor = DataProcessor().load_csv(typed_csv, chunksize=500,
+                                         optimize_dtypes=True)
+    chunks = list(processor.iter_chunks())
+    assert all(str(chunk['region'].dtype) == 'category' for chunk in chunks)
+    assert all(str(chunk['small'].dtype) == 'int64' for chunk in chunks)
+
+@pytest.mark.parametrize("mode", [{}, {'lazy': True}, {'chunksize': 2}])
+def test_clean_nullable_integer_schema(tmp_path, mode):
+    """Test that a fractional mean fills a nullable integer column."""
+    path = tmp_path / "nullable.csv"
+    path.write_text("n,x\n1,a\n,b\n4,c\n")
+    processor = DataProcessor().load_csv(str(path), schema={'n': 'Int64'}, **mode)
+    result = processor.clean_data().collect()
+    assert result['n'].tolist() == [1.0, 2.5, 4.0]
+    assert str(result['n'].dtype) == 'Float64'
\ No newline at end of file
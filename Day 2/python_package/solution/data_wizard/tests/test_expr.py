@@ -0,0 +1,149 @@
+"""
+Tests for compiled filter expressions.
+"""
+
+import pickle
+
+import pytest
+import numpy as np
+import pandas as pd
+from data_wizard import expr
+from data_wizard.expr import col
+from data_wizard.parallel import ParallelProcessor
+from data_wizard.plan import Filter
+from data_wizard.processor import DataProcessor
+
+@pytest.fixture
+def users():
+    """Create a frame with numeric, string and missing values."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'age': rng.integers(18, 80, 1000),
+        'score': rng.normal(50, 10, 1000),
+        'plan': rng.choice(['free', 'pro', 'team'], 1000)
+    })
+    df.loc[rng.choice(1000, 50, replace=False), 'score'] = np.nan
+    return df
+
+@pytest.fixture
+def users_csv(tmp_path, users):
+    """Write the users frame to a CSV file."""
+    path = tmp_path / "users.csv"
+    users.to_csv(path, index=False)
+    return str(path)
+
+@pytest.mark.parametrize("use_numexpr", [True, False])
+def test_numeric_mask_matches_pandas(users, monkeypatch, use_numexpr):
+    """Test numeric expressions with and without numexpr."""
+    if not use_numexpr:
+        monkeypatch.setattr(expr, 'numexpr', None)
+    condition = ((col('age') > 30) & ~(col('score') * 2 <= 90)) | (col('age') == 18)
+    expected = ((users['age'] > 30) & ~(users['score'] * 2 <= 90)) | \
+        (users['age'] == 18)
+    mask = condition.mask(users)
+    assert mask.dtype == bool
+    np.testing.assert_array_equal(mask, expected.to_numpy())
+
+@pytest.mark.parametrize("use_numexpr", [True, False])
+def test_narrow_integer_overflow_matches_pandas(monkeypatch, use_numexpr):
+    """Test that small and unsigned integers wrap around as in pandas."""
+    if not use_numexpr:
+        monkeypatch.setattr(expr, 'numexpr', None)
+    df = pd.DataFrame({
+        'small': np.array([100, -100, 5], dtype=np.int8),
+        'big': np.array([2**63 + 5, 1, 0], dtype=np.uint64)
+    })
+    doubled = col('small') + col('small') > 100
+    np.testing.assert_array_equal(doubled.mask(df),
+                                  (df['small'] + df['small'] > 100).to_numpy())
+    np.testing.assert_array_equal((col('big') > 5).mask(df), [True, False, False])
+
+def test_mixed_mask_matches_pandas(users):
+    """Test string comparisons, membership and missing value tests."""
+    condition = (col('plan') == 'pro') & col('age').between(30, 40) | \
+        col('score').isnull()
+    expected = ((users['plan'] == 'pro') & users['age'].between(30, 40) |
+                users['score'].isna())
+    np.testing.assert_array_equal(condition.mask(users), expected.to_numpy())
+    
+    members = col('plan').isin(['team', 'pro']) & col('score').notnull()
+    expected = users['plan'].isin(['team', 'pro']) & users['score'].notna()
+    np.testing.assert_array_equal(members.mask(users), expected.to_numpy())
+
+@pytest.mark.parametrize("use_numexpr", [True, False])
+def test_missing_values_match_pandas(users, monkeypatch, use_numexpr):
+    """Test inequality, membership and null tests on a float column with NaN."""
+    if not use_numexpr:
+        monkeypatch.setattr(expr, 'numexpr', None)
+    condition = (col('score') != 50) & ~col('age').isin([20, 30, 40]) | \
+        col('score').isnull()
+    expected = (users['score'] != 50) & ~users['age'].isin([20, 30, 40]) | \
+        users['score'].isna()
+    assert condition._numexpr_supported()
+    np.testing.assert_array_equal(condition.mask(users), expected.to_numpy())
+
+def test_nullable_columns_exclude_missing():
+    """Test that missing values in nullable columns never match."""
+    df = pd.DataFrame({'a': pd.array([1, None, 3], dtype='Int64')})
+    np.testing.assert_array_equal((col('a') > 0).mask(df), [True, False, True])
+
+def test_expression_base_is_abstract():
+    """Test that expression nodes must implement evaluation."""
+    with pytest.raises(TypeError):
+        expr.Expr()
+
+def test_expression_truth_value():
+    """Test that unparenthesized chains fail loudly."""
+    with pytest.raises(TypeError, match="parentheses"):
+        col('age') > 30 and col('plan') == 'pro'
+    with pytest.raises(TypeError):
+        col('age') > 30 & col('plan') == 'pro'
+
+def test_expression_columns_repr_and_pickle():
+    """Test introspection and pickling of expressions."""
+    condition = (col('age') > 30) & (col('plan') == 'pro')
+    assert condition.columns() == {'age', 'plan'}
+    assert repr(condition) == "((col('age') > 30) & (col('plan') == 'pro'))"
+    assert pickle.loads(pickle.dumps(condition)).equals(condition)
+    assert not condition.equals((col('age') > 31) & (col('plan') == 'pro'))
+    assert Filter([condition]) == Filter([pickle.loads(pickle.dumps(condition))])
+
+@pytest.mark.parametrize("mode", [{}, {'lazy': True}, {'chunksize': 128}])
+def test_processor_filter(users_csv, mode):
+    """Test expression filters in eager, lazy and streaming mode."""
+    expected = DataProcessor(users_csv).clean_data()
+    expected.filter_by_column('age', lambda x: x > 30)
+    expected.filter_by_column('plan', lambda x: x == 'pro')
+    
+    processor = DataProcessor(users_csv, **mode).clean_data()
+    processor.filter((col('age') > 30) & (col('plan') == 'pro'))
+    result = pd.concat(processor.iter_chunks())
+    pd.testing.assert_frame_equal(result, expected.data)
+
+def test_filters_fuse_in_plan(users_csv):
+    """Test that consecutive expression filters become one step."""
+    processor = DataProcessor(users_csv, lazy=True)
+    processor.filter(col('age') > 30).filter(col('score') < 60).select_columns(['plan'])
+    assert processor.explain().splitlines() == [
+        "0: Filter([(col('age') > 30), (col('score') < 60)])",
+        "1: Select(['plan'])"
+    ]
+    expected = DataProcessor(users_csv)
+    expected.filter_by_column('age', lambda x: x > 30)
+    expected.filter_by_column('score', lambda x: x < 60).select_columns(['plan'])
+    pd.testing.assert_frame_equal(processor.collect(), expected.data)
+
+def test_filter_missing_column(users_csv):
+    """Test that unknown columns are rejected up front."""
+    with pytest.raises(ValueError, match="missing"):
+        DataProcessor(users_csv).filter(col('missing') > 1)
+    with pytest.raises(ValueError):
+        ParallelProcessor(users_csv).filter(col('missing') > 1)
+
+def test_parallel_filter(users_csv):
+    """Test that expressions are shipped to worker processes."""
+    condition = (col('age') > 30) & (col('plan') != 'free')
+    parallel = ParallelProcessor(users_csv, max_workers=2, partition_bytes=4000)
+    parallel.filter(condition)
+    expected = DataProcessor(users_csv).filter(condition)
+    pd.testing.assert_frame_equal(parallel.collect(), expected.data)
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""
+Tests for the missing value fill strategies.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from data_wizard.fill import ConstantFill, ForwardFill, GroupFill, as_strategy
+from data_wizard.parallel import ParallelProcessor
+from data_wizard.processor import DataProcessor
+
+@pytest.fixture
+def readings():
+    """Create sensor readings with gaps, out of time order."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'sensor': rng.choice(['a', 'b', 'c'], 300),
+        'time': rng.permutation(300),
+        'temp': rng.normal(20, 5, 300).round(1),
+        'load': rng.integers(0, 100, 300).astype(float),
+        'status': rng.choice(['ok', 'warn'], 300)
+    })
+    df.loc[rng.choice(300, 60, replace=False), 'temp'] = np.nan
+    df.loc[rng.choice(300, 30, replace=False), 'load'] = np.nan
+    df.loc[rng.choice(300, 30, replace=False), 'status'] = None
+    return df
+
+@pytest.fixture
+def readings_csv(tmp_path, readings):
+    """Write the readings frame to a CSV file."""
+    path = tmp_path / "readings.csv"
+    readings.to_csv(path, index=False)
+    return str(path)
+
+def test_group_fill_matches_per_group_statistic(readings):
+    """Test that group fills use each group's own mean or median."""
+    for how in ('mean', 'median'):
+        result = GroupFill('sensor', how).fill(readings)
+        expected = readings.copy()
+        for column in ('temp', 'load'):
+            expected[column] = readings.groupby('sensor')[column].transform(
+                lambda s: s.fillna(getattr(s, how)()))
+        pd.testing.assert_frame_equal(result, expected)
+
+def test_group_fill_falls_back_to_column_statistic():
+    """Test rows of groups without any value."""
+    df = pd.DataFrame({'g': ['a', 'a', 'b', None], 'x': [1.0, 3.0, np.nan, np.nan]})
+    assert GroupFill('g').fill(df)['x'].tolist() == [1.0, 3.0, 2.0, 2.0]
+    assert GroupFill('g', fallback=False).fill(df)['x'].isna().sum() == 2
+    with pytest.raises(ValueError):
+        GroupFill('g', how='mode')
+
+def test_forward_fill_in_time_order(readings):
+    """Test that ordered forward fills keep the original row order."""
+    strategy = ForwardFill(['temp', 'status'], by='sensor', order_by='time')
+    result = strategy.fill(readings)
+    expected = readings.sort_values('time')
+    columns = ['temp', 'status']
+    expected[columns] = expected.groupby('sensor')[columns].ffill()
+    pd.testing.assert_frame_equal(result, expected.loc[readings.index])
+
+def test_as_strategy():
+    """Test names, constants and per-column specifications."""
+    df = pd.DataFrame({'x': [1.0, np.nan, 5.0, 4.0], 'y': [np.nan, 2.0, np.nan, 1.0],
+                       'label': ['p', None, 'q', None]})
+    spec = {'x': 'median', 'y': 0, 'label': ConstantFill('none')}
+    result = as_strategy(spec).fill(df)
+    assert result['x'].tolist() == [1.0, 4.0, 5.0, 4.0]
+    assert result['y'].tolist() == [0.0, 2.0, 0.0, 1.0]
+    assert result['label'].tolist() == ['p', 'none', 'q', 'none']
+    assert as_strategy(-1).fill(df)['label'].isna().sum() == 2
+    with pytest.raises(ValueError):
+        as_strategy('mode')
+
+def test_as_strategy_binds_dict_keys():
+    """Test string constants and strategies bound to their dictionary key."""
+    df = pd.DataFrame({'x': [1.0, np.nan], 'y': [np.nan, 2.0], 'label': ['p', None]})
+    result = as_strategy({'label': 'unknown', 'y': ForwardFill()}).fill(df)
+    assert result['label'].tolist() == ['p', 'unknown']
+    assert result['x'].isna().sum() == 1
+    assert result['y'].isna().sum() == 1
+    with pytest.raises(ValueError):
+        as_strategy({'x': GroupFill('label', columns=['y'])})
+
+@pytest.mark.parametrize("fill", [
+    'median',
+    'ffill',
+    {'temp': GroupFill('sensor'), 'status': 'ffill'},
+    ForwardFill(by='sensor', order_by='time'),
+])
+def test_clean_data_fill_modes_agree(readings_csv, fill):
+    """Test that eager, lazy and parallel cleaning give the same result."""
+    eager = DataProcessor(readings_csv).clean_data(fill=fill)
+    lazy = DataProcessor(readings_csv, lazy=True).clean_data(fill=fill).collect()
+    parallel = ParallelProcessor(readings_csv, max_workers=2).clean_data(fill=fill)
+    parallel = parallel.collect()
+    pd.testing.assert_frame_equal(lazy, eager.data)
+    pd.testing.assert_frame_equal(parallel, eager.data)
+
+@pytest.mark.parametrize("fill", ['mean', GroupFill('sensor'), ForwardFill(by='sensor'),
+                                  {'temp': 'ffill', 'load': 0}])
+def test_clean_data_streaming_fill(readings_csv, fill):
+    """Test that streamed fills match the eager result across chunk boundaries."""
+    eager = DataProcessor(readings_csv).clean_data(fill=fill).data
+    streamed = DataProcessor(readings_csv, chunksize=32).clean_data(fill=fill)
+    pd.testing.assert_frame_equal(streamed.collect(), eager)
+
+def test_group_fill_streaming_fallback_with_missing_keys(tmp_path):
+    """Test that the streamed fallback also averages rows without a key."""
+    path = tmp_path / "keys.csv"
+    path.write_text("g,x\na,\na,2\n,150\nb,\n")
+    eager = DataProcessor(str(path)).clean_data(fill=GroupFill('g')).data
+    streamed = DataProcessor(str(path), chunksize=2).clean_data(fill=GroupFill('g'))
+    pd.testing.assert_frame_equal(streamed.collect(), eager)
+    assert eager['x'].tolist() == [2.0, 2.0, 150.0, 76.0]
+
+def test_clean_data_streaming_rejects_whole_column_fills(readings_csv):
+    """Test that fills needing whole columns fail early in streaming mode."""
+    processor = DataProcessor(readings_csv, chunksize=32)
+    for fill in ('median', GroupFill('sensor', 'median'), ForwardFill(order_by='time')):
+        with pytest.raises(ValueError):
+            processor.clean_data(fill=fill)
+
+def test_clean_data_fill_keeps_summary(readings_csv):
+    """Test that tracked counters match a fresh summary after a fill."""
+    for fill in ('median', ForwardFill(by='sensor')):
+        processor = DataProcessor(readings_csv)
+        processor.get_summary()
+        summary = processor.clean_data(fill=fill).get_summary()
+        fresh = DataProcessor()
+        fresh.data = processor.data.copy()
+        assert summary == fresh.get_summary()
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Tests for concurrent multi-file ingestion.
+"""
+
+import threading
+
+import pytest
+import pandas as pd
+from data_wizard import ingest
+from data_wizard.processor import DataProcessor
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    """Create a directory of small CSV files and one malformed file."""
+    for index in range(12):
+        pd.DataFrame({
+            'id': range(index * 10, index * 10 + 10),
+            'value': [float(index)] * 10
+        }).to_csv(tmp_path / f"part-{index:02d}.csv", index=False)
+    (tmp_path / "part-05.csv").write_text('id,value\n1,2,3,4\n"unterminated\n')
+    return tmp_path
+
+def test_expand_paths(csv_dir):
+    """Test glob expansion and plain path lists."""
+    paths = ingest.expand_paths(str(csv_dir / "part-*.csv"))
+    assert len(paths) == 12
+    assert paths == sorted(paths)
+    assert ingest.expand_paths(['b.csv', 'a.csv']) == ['b.csv', 'a.csv']
+
+def test_load_many_reports_failures(csv_dir):
+    """Test that bad files are reported without aborting the batch."""
+    paths = ingest.expand_paths(str(csv_dir / "*.csv")) + [str(csv_dir / "missing.csv")]
+    data, report = ingest.load_many(paths, max_workers=4)
+    
+    assert len(data) == 110
+    assert list(data.index) == list(range(110))
+    assert data['value'].unique().tolist() == [float(i) for i in range(12) if i != 5]
+    assert [f.path for f in report.failed] == [paths[5], paths[-1]]
+    assert all(f.seconds >= 0 for f in report.files)
+    summary = report.to_dict()
+    assert (summary['files'], summary['succeeded'], summary['rows']) == (13, 11, 110)
+
+def test_iter_files_bounded_readahead(csv_dir, monkeypatch):
+    """Test that no more than readahead files are parsed ahead."""
+    started = []
+    lock = threading.Lock()
+    original = ingest._read_file
+    
+    def counting(path, kwargs):
+        with lock:
+            started.append(path)
+        return original(path, kwargs)
+    
+    monkeypatch.setattr(ingest, '_read_file', counting)
+    for consumed, _ in enumerate(ingest.iter_files(str(csv_dir / "*.csv"),
+                                                    max_workers=2, readahead=3)):
+        assert len(started) <= 3 + consumed + 1
+
+@pytest.mark.parametrize("mode", [{}, {'lazy': True}, {'chunksize': 4}])
+def test_processor_load_many(csv_dir, mode):
+    """Test multi-file loading in eager, lazy and streaming mode."""
+    expected = pd.concat(
+        pd.read_csv(path) for path in sorted(csv_dir.glob("*.csv"))
+        if path.name != "part-05.csv"
+    ).drop_duplicates(subset=['value'])
+    
+    processor = DataProcessor(**mode).load_many(str(csv_dir / "*.csv"), max_workers=3)
+    processor.filter_by_column('id', lambda x: x % 10 == 0).select_columns(['value'])
+    chunks = list(processor.iter_chunks())
+    assert all(len(chunk) <= mode.get('chunksize', 110) for chunk in chunks)
+    result = pd.concat(chunks)
+    assert result['value'].tolist() == expected['value'].tolist()
+    assert len(processor.load_report.failed) == 1
+
+def test_processor_load_many_no_match(tmp_path):
+    """Test a pattern that matches no files."""
+    with pytest.raises(ValueError):
+        DataProcessor().load_many(str(tmp_path / "*.csv"))
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""
+Tests for the package namespace and its import cost.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+import data_wizard
+
+# Generous enough for a cold CI runner; importing pandas alone takes longer
+IMPORT_BUDGET_SECONDS = 0.25
+
+def run_python(code):
+    """Run code in a fresh interpreter that sees the package under test."""
+    env = dict(os.environ)
+    source = os.path.dirname(os.path.dirname(data_wizard.__file__))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [source, env.get('PYTHONPATH')]))
+    result = subprocess.run([sys.executable, '-c', code], env=env, check=True,
+                            capture_output=True, text=True)
+    return result.stdout
+
+def test_import_does_not_load_heavy_dependencies():
+    """Test that pandas and numpy are only imported on first use."""
+    output = run_python(
+        "import sys, data_wizard\n"
+        "from data_wizard import format_number, validate_file_path\n"
+        "print(sorted(m for m in ('pandas', 'numpy') if m in sys.modules))\n"
+        "data_wizard.DataProcessor\n"
+        "print('pandas' in sys.modules)"
+    )
+    assert output.split() == ['[]', 'True']
+
+def test_import_time_budget():
+    """Test that importing the package stays within the time budget."""
+    timings = [float(run_python(
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import data_wizard\n"
+        "print(time.perf_counter() - start)"
+    )) for _ in range(3)]
+    assert min(timings) < IMPORT_BUDGET_SECONDS
+
+def test_lazy_attributes():
+    """Test that lazily imported names resolve like eager imports."""
+    from data_wizard.stats import calculate_basic_stats
+    assert data_wizard.calculate_basic_stats is calculate_basic_stats
+    assert set(data_wizard.__all__) <= set(dir(data_wizard))
+    with pytest.raises(AttributeError):
+        data_wizard.missing_name
\ No newline at end of file
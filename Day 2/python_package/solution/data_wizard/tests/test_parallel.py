@@ -0,0 +1,128 @@
+"""
+Tests for the process-pool backend.
+"""
+
+import functools
+import operator
+
+import pytest
+import pandas as pd
+import numpy as np
+from data_wizard.processor import DataProcessor
+from data_wizard.parallel import ParallelProcessor, split_file
+
+above_95 = functools.partial(operator.lt, 95)
+above_10 = functools.partial(operator.lt, 10)
+
+@pytest.fixture
+def csv_files(tmp_path):
+    """Create three CSV files with duplicates spanning file boundaries."""
+    rng = np.random.default_rng(0)
+    paths = []
+    for i in range(3):
+        df = pd.DataFrame({
+            'id': rng.integers(0, 40, 300),
+            'value': rng.normal(100, 15, 300).round(0),
+            'category': rng.choice(['A', 'B', 'C'], 300)
+        })
+        df.loc[rng.choice(300, 20, replace=False), 'value'] = np.nan
+        path = tmp_path / f"part_{i}.csv"
+        df.to_csv(path, index=False)
+        paths.append(str(path))
+    return paths
+
+@pytest.fixture
+def combined_csv(tmp_path, csv_files):
+    """Concatenate the partition files into a single CSV."""
+    path = tmp_path / "combined.csv"
+    pd.concat([pd.read_csv(p) for p in csv_files]).to_csv(path, index=False)
+    return str(path)
+
+def serial(path):
+    """Run the reference pipeline on the serial path."""
+    processor = DataProcessor(path)
+    processor.filter_by_column('id', above_10).clean_data()
+    return processor.filter_by_column('value', above_95)
+
+def test_split_file_covers_all_rows(combined_csv):
+    """Test that byte ranges are line aligned and cover the whole file."""
+    ranges = split_file(combined_csv, 1000)
+    assert len(ranges) > 1
+    with open(combined_csv, 'rb') as f:
+        content = f.read()
+    body = b''.join(content[start:end] for _, start, end in ranges)
+    assert content.endswith(body)
+    assert all(content[start - 1:start] == b'\n' for _, start, _ in ranges)
+
+@pytest.mark.parametrize("partition_bytes", [None, 2000])
+def test_row_ranges_match_serial(combined_csv, partition_bytes):
+    """Test that splitting one file by rows matches the serial result."""
+    parallel = ParallelProcessor(combined_csv, max_workers=3,
+                                 partition_bytes=partition_bytes)
+    parallel.filter_by_column('id', above_10).clean_data()
+    parallel.filter_by_column('value', above_95)
+    
+    expected = serial(combined_csv)
+    pd.testing.assert_frame_equal(parallel.collect(), expected.data)
+    assert parallel.get_summary() == expected.get_summary()
+
+def test_files_match_serial(csv_files, combined_csv):
+    """Test that one partition per file matches the serial result."""
+    parallel = ParallelProcessor(csv_files, max_workers=2)
+    parallel.filter_by_column('id', above_10).clean_data()
+    parallel.filter_by_column('value', above_95)
+    pd.testing.assert_frame_equal(parallel.collect(), serial(combined_csv).data)
+
+def test_local_summary_is_merged(combined_csv):
+    """Test the merged summary of a purely partition-local plan."""
+    parallel = ParallelProcessor(combined_csv, max_workers=2, partition_bytes=3000)
+    parallel.filter_by_column('value', above_95)
+    
+    expected = DataProcessor(combined_csv).filter_by_column('value', above_95)
+    assert parallel.get_summary() == expected.get_summary()
+
+def test_save_csv(tmp_path, combined_csv):
+    """Test writing the combined output."""
+    parallel = ParallelProcessor(combined_csv, max_workers=2)
+    parallel.select_columns(['category', 'id']).clean_data()
+    output_path = tmp_path / "out.csv"
+    parallel.save_csv(str(output_path))
+    
+    expected = pd.read_csv(combined_csv)[['category', 'id']].drop_duplicates()
+    pd.testing.assert_frame_equal(pd.read_csv(output_path),
+                                  expected.reset_index(drop=True))
+
+def test_unpicklable_condition(combined_csv):
+    """Test that lambdas are rejected up front."""
+    parallel = ParallelProcessor(combined_csv)
+    with pytest.raises(ValueError):
+        parallel.filter_by_column('id', lambda x: x > 1)
+
+def test_out_of_core_spill_settings(tmp_path, combined_csv):
+    """Test that out-of-core cleaning uses the configured spill settings."""
+    spill_dir = tmp_path / "spill"
+    spill_dir.mkdir()
+    parallel = ParallelProcessor(combined_csv, max_workers=2,
+                                 spill_dir=str(spill_dir), memory_limit=20_000)
+    result = parallel.clean_data(out_of_core=True).collect()
+    
+    expected = DataProcessor(combined_csv).clean_data()
+    pd.testing.assert_frame_equal(result, expected.data)
+    assert list(spill_dir.iterdir()) == []
+    
+    missing = ParallelProcessor(combined_csv, max_workers=2,
+                                spill_dir=str(tmp_path / "missing"))
+    with pytest.raises(OSError):
+        missing.clean_data(out_of_core=True).collect()
+
+def test_mismatched_headers(tmp_path, csv_files):
+    """Test that files with different headers are rejected."""
+    other = tmp_path / "other.csv"
+    other.write_text("a,b\n1,2\n")
+    with pytest.raises(ValueError):
+        ParallelProcessor(csv_files + [str(other)])
+
+def test_invalid_path():
+    """Test that missing files are rejected."""
+    with pytest.raises(ValueError):
+        ParallelProcessor("nonexistent.csv")
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""
+Tests for query plan optimization and execution.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from data_wizard import dedupe
+from data_wizard.plan import (
+    DropDuplicates,
+    FillMean,
+    Filter,
+    Select,
+    optimize,
+    required_columns,
+    execute,
+    iter_execute
+)
+
+@pytest.fixture
+def sample_data():
+    """Create sample data for testing."""
+    return pd.DataFrame({
+        'id': [1, 2, 2, 3, 4],
+        'value': [10.0, 20.0, 20.0, None, 40.0],
+        'category': ['A', 'B', 'B', 'C', 'D']
+    })
+
+def above(limit):
+    """Build a row-wise predicate."""
+    return lambda x: x > limit
+
+def test_optimize_pushes_filter_before_duplicates():
+    """Test that filters move ahead of duplicate removal and fuse."""
+    first, second = ('id', above(1)), ('value', above(15))
+    steps = optimize([
+        Filter([first]),
+        DropDuplicates(),
+        Filter([second])
+    ])
+    assert steps == [Filter([first, second]), DropDuplicates()]
+
+def test_optimize_keeps_filter_after_fill():
+    """Test that filters never move ahead of the fill they depend on."""
+    predicate = ('value', above(15))
+    steps = optimize([DropDuplicates(), FillMean(), Filter([predicate])])
+    assert steps == [DropDuplicates(), FillMean(), Filter([predicate])]
+
+def test_optimize_drops_redundant_steps():
+    """Test that repeated cleaning steps are removed."""
+    predicate = ('id', above(1))
+    steps = optimize([
+        DropDuplicates(), FillMean(), Filter([predicate]),
+        DropDuplicates(), FillMean()
+    ])
+    assert steps == [DropDuplicates(), FillMean(), Filter([predicate]),
+                     DropDuplicates()]
+
+def test_required_columns_prunes_after_select():
+    """Test column pruning for a plan that selects before deduplicating."""
+    steps = [Filter([('category', above('A'))]), Select(['id']), DropDuplicates()]
+    assert required_columns(steps, ['id', 'value', 'category']) == ['id', 'category']
+
+def test_required_columns_keeps_duplicate_inputs():
+    """Test that duplicate removal before a select needs every column."""
+    steps = [DropDuplicates(), Select(['id'])]
+    assert required_columns(steps, ['id', 'value']) == ['id', 'value']
+
+def test_execute_matches_eager(sample_data):
+    """Test that the fused executor matches step-by-step pandas."""
+    steps = [DropDuplicates(), FillMean(), Filter([('value', above(20))])]
+    expected = sample_data.drop_duplicates()
+    expected = expected.fillna({'value': expected['value'].mean()})
+    expected = expected[expected['value'] > 20]
+    
+    result = execute(sample_data, optimize(steps))
+    pd.testing.assert_frame_equal(result, expected)
+
+def test_execute_does_not_modify_input(sample_data):
+    """Test that the input frame is left untouched."""
+    original = sample_data.copy()
+    execute(sample_data, [FillMean(), Select(['value'])])
+    pd.testing.assert_frame_equal(sample_data, original)
+
+def test_execute_duplicates_after_fill():
+    """Test that rows made identical by a fill are deduplicated."""
+    data = pd.DataFrame({'a': [1.0, None, 3.0, 2.0]})
+    result = execute(data, [FillMean(), DropDuplicates()])
+    assert list(result['a']) == [1.0, 2.0, 3.0]
+
+def test_iter_execute_resolves_fill(sample_data):
+    """Test that streaming fills use the mean of the whole stream."""
+    chunks = lambda: iter([sample_data.iloc[:2], sample_data.iloc[2:]])
+    result = pd.concat(iter_execute(chunks, [DropDuplicates(), FillMean()]))
+    assert len(result) == 4
+    assert result['value'].iloc[2] == pytest.approx(70.0 / 3)
+
+def test_iter_execute_duplicates_compare_rows(monkeypatch):
+    """Test that streamed rows sharing a hash are only dropped when equal."""
+    big = 2**53
+    data = pd.DataFrame({'id': [big, big + 1, big, 5], 'tag': ['a', 'a', 'a', None]})
+    chunks = lambda: iter([data.iloc[:2], data.iloc[2:]])
+    result = pd.concat(iter_execute(chunks, [DropDuplicates()]))
+    assert result['id'].tolist() == [big, big + 1, 5]
+    
+    monkeypatch.setattr(dedupe, 'row_hashes',
+                        lambda chunk: np.zeros(len(chunk), dtype=np.uint64))
+    result = pd.concat(iter_execute(chunks, [DropDuplicates()]))
+    assert result['id'].tolist() == [big, big + 1, 5]
\ No newline at end of file
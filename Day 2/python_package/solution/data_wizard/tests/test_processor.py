@@ -91,4 +91,182 @@ def test_get_summary(sample_data):
     assert summary['column_count'] == 3
     assert set(summary['numeric_columns']) == {'id', 'value'}
     assert summary['categorical_columns'] == ['category']
-    assert summary['missing_values']['value'] == 1 
\ No newline at end of file
+    assert summary['missing_values']['value'] == 1 
+
+@pytest.fixture
+def large_csv(tmp_path):
+    """Create a CSV with duplicates and missing values spread over many rows."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'id': rng.integers(0, 50, 500),
+        'value': rng.normal(100, 15, 500).round(1),
+        'category': rng.choice(['A', 'B', 'C'], 500)
+    })
+    df.loc[rng.choice(500, 40, replace=False), 'value'] = np.nan
+    file_path = tmp_path / "large.csv"
+    df.to_csv(file_path, index=False)
+    return str(file_path)
+
+def test_streaming_load_is_deferred(temp_csv):
+    """Test that a chunked load does not materialize the data."""
+    processor = DataProcessor(temp_csv, chunksize=2)
+    assert processor.streaming
+    assert processor.data is None
+
+def test_streaming_invalid_chunksize(temp_csv):
+    """Test that a non-positive chunksize is rejected."""
+    with pytest.raises(ValueError):
+        DataProcessor().load_csv(temp_csv, chunksize=-1)
+
+def test_streaming_filter_unknown_column(temp_csv):
+    """Test filtering a missing column in streaming mode."""
+    processor = DataProcessor(temp_csv, chunksize=2)
+    with pytest.raises(ValueError):
+        processor.filter_by_column('missing', lambda x: x > 0)
+
+@pytest.mark.parametrize("chunksize", [1, 7, 64, 1000])
+def test_streaming_matches_eager(tmp_path, large_csv, chunksize):
+    """Test that chunked processing writes the same rows as the eager path."""
+    eager = DataProcessor(large_csv)
+    eager.clean_data().filter_by_column('value', lambda x: x > 95)
+    streamed = DataProcessor(large_csv, chunksize=chunksize)
+    streamed.clean_data().filter_by_column('value', lambda x: x > 95)
+    
+    eager_path = tmp_path / "eager.csv"
+    streamed_path = tmp_path / "streamed.csv"
+    eager.save_csv(str(eager_path))
+    streamed.save_csv(str(streamed_path))
+    
+    pd.testing.assert_frame_equal(pd.read_csv(streamed_path),
+                                  pd.read_csv(eager_path))
+    assert streamed.get_summary() == eager.get_summary()
+
+@pytest.mark.parametrize("chunksize", [2, 3])
+def test_streaming_chained_dedupe_mixed_dtypes(tmp_path, chunksize):
+    """Test chained dedupe when chunks infer int and float for one column."""
+    path = tmp_path / "mixed.csv"
+    path.write_text("a,b\n1,5\n2,6\n1,5\n3,\n1,5\n")
+    eager = DataProcessor(str(path)).clean_data().clean_data()
+    streamed = DataProcessor(str(path), chunksize=chunksize).clean_data().clean_data()
+    pd.testing.assert_frame_equal(streamed.collect().reset_index(drop=True),
+                                  eager.data.reset_index(drop=True), check_dtype=False)
+
+def test_streaming_iter_chunks_bounded(large_csv):
+    """Test that no chunk exceeds the configured chunk size."""
+    processor = DataProcessor(large_csv, chunksize=64)
+    chunks = list(processor.clean_data().iter_chunks())
+    assert all(len(chunk) <= 64 for chunk in chunks)
+    assert sum(len(chunk) for chunk in chunks) == processor.get_summary()['row_count']
+
+def test_streaming_save_empty_result(tmp_path, temp_csv):
+    """Test that a fully filtered stream still writes the header."""
+    processor = DataProcessor(temp_csv, chunksize=2)
+    processor.filter_by_column('value', lambda x: x > 1000)
+    output_path = tmp_path / "empty.csv"
+    processor.save_csv(str(output_path))
+    assert list(pd.read_csv(output_path).columns) == ['id', 'value', 'category']
+def test_lazy_load_is_deferred(temp_csv):
+    """Test that a lazy load records a plan instead of reading the file."""
+    processor = DataProcessor(temp_csv, lazy=True)
+    processor.clean_data().filter_by_column('value', lambda x: x > 20)
+    assert processor.data is None
+    assert processor.explain().splitlines() == [
+        "0: DropDuplicates()",
+        "1: FillMean()",
+        "2: Filter(['value'])"
+    ]
+
+def test_lazy_matches_eager(large_csv):
+    """Test that lazy execution produces the same frame as eager calls."""
+    eager = DataProcessor(large_csv)
+    eager.filter_by_column('id', lambda x: x > 10).clean_data()
+    eager.filter_by_column('value', lambda x: x > 95)
+    lazy = DataProcessor(large_csv, lazy=True)
+    lazy.filter_by_column('id', lambda x: x > 10).clean_data()
+    lazy.filter_by_column('value', lambda x: x > 95)
+    
+    pd.testing.assert_frame_equal(lazy.collect(), eager.data)
+    assert lazy.get_summary() == eager.get_summary()
+
+def test_lazy_in_memory_data(sample_data):
+    """Test lazy mode over a DataFrame that is already loaded."""
+    processor = DataProcessor(lazy=True)
+    processor.data = sample_data.copy()
+    processor.clean_data().select_columns(['value'])
+    pd.testing.assert_frame_equal(processor.data, sample_data)
+    
+    result = processor.collect()
+    assert list(result.columns) == ['value']
+    assert len(result) == 4
+
+def test_lazy_select_unknown_column(temp_csv):
+    """Test selecting a missing column in lazy mode."""
+    processor = DataProcessor(temp_csv, lazy=True)
+    processor.select_columns(['id'])
+    with pytest.raises(ValueError):
+        processor.filter_by_column('value', lambda x: x > 0)
+
+def test_streaming_select_columns(tmp_path, large_csv):
+    """Test that a streamed selection only writes the chosen columns."""
+    processor = DataProcessor(large_csv, chunksize=100)
+    processor.select_columns(['category', 'id']).clean_data()
+    output_path = tmp_path / "selected.csv"
+    processor.save_csv(str(output_path))
+    
+    expected = pd.read_csv(large_csv)[['category', 'id']].drop_duplicates()
+    pd.testing.assert_frame_equal(pd.read_csv(output_path),
+                                  expected.reset_index(drop=True))
+
+def assert_summary_is_fresh(processor):
+    """Check the incremental counters against a rebuild from the data."""
+    fresh = DataProcessor()
+    fresh.data = processor.data.copy()
+    assert processor.get_summary() == fresh.get_summary()
+    
+    stats, expected = processor.get_column_stats(), fresh.get_column_stats()
+    assert stats.keys() == expected.keys()
+    for column, values in expected.items():
+        assert stats[column] == (values if values is None else pytest.approx(values))
+
+def test_incremental_summary(large_csv):
+    """Test that summary counters follow every in-memory operation."""
+    processor = DataProcessor(large_csv)
+    processor.get_summary()
+    
+    processor.filter_by_column('id', lambda x: x > 10)
+    assert_summary_is_fresh(processor)
+    processor.clean_data()
+    assert_summary_is_fresh(processor)
+    processor.append(pd.DataFrame({
+        'value': [np.nan, 500.0], 'category': ['A', 'Z'], 'id': [7, 8]
+    }))
+    assert_summary_is_fresh(processor)
+    processor.filter_by_column('value', lambda x: x < 120)
+    assert_summary_is_fresh(processor)
+    processor.select_columns(['value', 'category'])
+    assert_summary_is_fresh(processor)
+
+def test_incremental_summary_reset_on_assignment(sample_data):
+    """Test that assigning new data resets the summary counters."""
+    processor = DataProcessor()
+    processor.data = sample_data.copy()
+    assert processor.get_summary()['row_count'] == 5
+    processor.data = sample_data.head(2)
+    assert processor.get_summary()['row_count'] == 2
+
+def test_append_changes_dtype(sample_data):
+    """Test that appended rows can turn an integer column into floats."""
+    processor = DataProcessor()
+    processor.data = sample_data.copy()
+    processor.get_summary()
+    processor.append(pd.DataFrame({'id': [None], 'value': [1.0], 'category': ['E']}))
+    assert processor.get_summary()['missing_values']['id'] == 1
+    assert_summary_is_fresh(processor)
+
+def test_append_invalid(temp_csv, sample_data):
+    """Test appending mismatched columns or to a streamed source."""
+    processor = DataProcessor(temp_csv)
+    with pytest.raises(ValueError):
+        processor.append(sample_data[['id']])
+    with pytest.raises(ValueError):
+        DataProcessor(temp_csv, chunksize=2).append(sample_data)
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Tests for the JSON and NDJSON report writers.
+"""
+
+import gzip
+import json
+
+import pytest
+import numpy as np
+import pandas as pd
+from data_wizard import report
+from data_wizard.report import NDJSONWriter, write_json, write_ndjson
+from data_wizard.utils import save_json_report
+
+@pytest.fixture(params=['orjson', 'json'])
+def encoder(request, monkeypatch):
+    """Run a test with and without orjson."""
+    if request.param == 'json':
+        monkeypatch.setattr(report, 'orjson', None)
+    elif report.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+def numpy_summary():
+    """Build a summary holding NumPy and pandas values."""
+    return {
+        'rows': np.int64(3),
+        'mean': np.float32(1.5),
+        'flags': np.array([True, False]),
+        'values': np.arange(6, dtype=np.int32).reshape(2, 3),
+        'nulls': pd.Series({'a': 0, 'b': 2}),
+        'name': "值"
+    }
+
+EXPECTED = {
+    'rows': 3,
+    'mean': 1.5,
+    'flags': [True, False],
+    'values': [[0, 1, 2], [3, 4, 5]],
+    'nulls': {'a': 0, 'b': 2},
+    'name': "值"
+}
+
+def test_write_json_numpy_values(tmp_path, encoder):
+    """Test that NumPy and pandas values are serialized natively."""
+    path = tmp_path / "report.json"
+    write_json(numpy_summary(), str(path))
+    assert json.loads(path.read_text(encoding='utf-8')) == EXPECTED
+
+def test_write_json_missing_values_and_indent(tmp_path, encoder):
+    """Test that NaN and infinity become null in a four-space indented file."""
+    path = tmp_path / "report.json"
+    save_json_report({'mean': float('nan'), 'values': np.array([1.0, np.inf]),
+                      'nulls': pd.Series({'a': np.nan})}, str(path))
+    text = path.read_text(encoding='utf-8')
+    assert json.loads(text) == {'mean': None, 'values': [1.0, None],
+                                'nulls': {'a': None}}
+    assert text.splitlines()[1] == '    "mean": null,'
+    assert '        1.0,' in text.splitlines()
+
+def test_write_json_compression(tmp_path, encoder):
+    """Test gzip output chosen explicitly or from the suffix."""
+    inferred = tmp_path / "report.json.gz"
+    save_json_report(numpy_summary(), str(inferred))
+    explicit = tmp_path / "report.json"
+    write_json(numpy_summary(), str(explicit), indent=False, compression='gzip')
+    
+    for path in (inferred, explicit):
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            assert json.load(f) == EXPECTED
+
+def test_write_ndjson_records(tmp_path, encoder):
+    """Test one line per record written from a generator."""
+    path = tmp_path / "records.ndjson"
+    records = ({'index': np.int64(i), 'values': np.full(2, i / 2)} for i in range(5))
+    assert write_ndjson(records, str(path), compression=None) == 5
+    
+    lines = path.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {'index': i, 'values': [i / 2] * 2} for i in range(5)
+    ]
+
+def test_ndjson_writer_zstd(tmp_path):
+    """Test zstd compressed NDJSON output."""
+    zstandard = pytest.importorskip("zstandard")
+    path = tmp_path / "records.ndjson.zst"
+    with NDJSONWriter(str(path)) as writer:
+        writer.write({'a': 1})
+        writer.write({'a': 2})
+    with zstandard.open(path, 'rt') as f:
+        assert [json.loads(line) for line in f] == [{'a': 1}, {'a': 2}]
+
+def test_write_json_invalid(tmp_path):
+    """Test unknown compressions and unserializable values."""
+    with pytest.raises(ValueError):
+        write_json({}, str(tmp_path / "report.json"), compression='lz4')
+    with pytest.raises(TypeError):
+        write_json({'value': object()}, str(tmp_path / "report.json"))
\ No newline at end of file
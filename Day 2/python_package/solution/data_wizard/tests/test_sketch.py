@@ -0,0 +1,69 @@
+"""
+Tests for quantile sketches.
+"""
+
+import pytest
+import numpy as np
+from data_wizard.sketch import KLLSketch
+
+@pytest.fixture
+def large_data():
+    """Create a large skewed sample."""
+    return np.random.default_rng(0).lognormal(0, 1, 200_000)
+
+def rank_error(data, value, q):
+    """Return the normalized rank error of an estimated quantile."""
+    return abs(np.searchsorted(np.sort(data), value) / len(data) - q)
+
+@pytest.mark.parametrize("q", [0.01, 0.25, 0.5, 0.75, 0.99])
+def test_quantile_within_error_bound(large_data, q):
+    """Test that estimates stay within the configured rank error."""
+    sketch = KLLSketch(epsilon=0.01, seed=1)
+    for batch in np.array_split(large_data, 50):
+        sketch.update(batch)
+    assert rank_error(large_data, sketch.quantile(q), q) < 0.02
+
+def test_sketch_stays_small(large_data):
+    """Test that memory does not grow with the input size."""
+    sketch = KLLSketch(epsilon=0.01, seed=1).update(large_data)
+    retained = sum(len(level) for level in sketch._levels)
+    assert retained < 10 * sketch.k
+    assert sketch.count == len(large_data)
+
+def test_merge_matches_single_sketch(large_data):
+    """Test that sketches built on shards can be merged."""
+    shards = [KLLSketch(epsilon=0.01, seed=i).update(part)
+              for i, part in enumerate(np.array_split(large_data, 8))]
+    merged = shards[0]
+    for shard in shards[1:]:
+        merged.merge(shard)
+    
+    assert merged.count == len(large_data)
+    assert rank_error(large_data, merged.quantile(0.5), 0.5) < 0.02
+
+def test_extreme_quantiles_are_exact(large_data):
+    """Test that the minimum and maximum are tracked exactly."""
+    sketch = KLLSketch(seed=1).update(large_data)
+    assert sketch.quantile(0) == large_data.min()
+    assert sketch.quantile(1) == large_data.max()
+
+def test_quantile_list():
+    """Test querying several quantiles at once."""
+    sketch = KLLSketch(seed=1).update(np.arange(100.0))
+    assert list(sketch.quantile([0.0, 1.0])) == [0.0, 99.0]
+
+def test_nan_is_ignored():
+    """Test that NaN values are skipped."""
+    sketch = KLLSketch().update([1.0, np.nan, 2.0])
+    assert sketch.count == 2
+
+@pytest.mark.parametrize("kwargs", [{'epsilon': 0}, {'epsilon': 1.5}, {'k': 4}])
+def test_invalid_parameters(kwargs):
+    """Test that invalid sketch parameters are rejected."""
+    with pytest.raises(ValueError):
+        KLLSketch(**kwargs)
+
+def test_empty_sketch():
+    """Test querying an empty sketch."""
+    with pytest.raises(ValueError):
+        KLLSketch().quantile(0.5)
\ No newline at end of file
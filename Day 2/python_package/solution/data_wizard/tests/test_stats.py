@@ -2,15 +2,25 @@
 Tests for statistical functions.
 """
 
+import array
+
 import pytest
 import numpy as np
 import pandas as pd
+from data_wizard import stats
 from data_wizard.stats import (
+    RunningStats,
     calculate_basic_stats,
+    calculate_grouped_stats,
+    calculate_streaming_stats,
+    calculate_iqr_bounds,
     calculate_percentiles,
     detect_outliers,
-    calculate_correlation
+    calculate_correlation,
+    calculate_correlation_matrix,
+    as_array
 )
+from data_wizard.sketch import KLLSketch
 
 @pytest.fixture
 def sample_data():
@@ -113,4 +123,292 @@ def test_calculate_correlation_no_correlation():
 def test_calculate_correlation_invalid():
     """Test correlation calculation with invalid inputs."""
     with pytest.raises(ValueError):
-        calculate_correlation([1, 2], [1, 2, 3]) 
\ No newline at end of file
+        calculate_correlation([1, 2], [1, 2, 3]) 
+def test_running_stats_matches_numpy():
+    """Test that batched accumulation matches whole-array numpy results."""
+    data = np.random.default_rng(0).normal(50, 10, 10_000)
+    running = RunningStats(block_size=333)
+    for batch in np.array_split(data, 7):
+        running.update(batch)
+    
+    assert running.count == len(data)
+    assert running.mean == pytest.approx(np.mean(data))
+    assert running.std == pytest.approx(np.std(data))
+    assert running.min == np.min(data)
+    assert running.max == np.max(data)
+
+def test_running_stats_merge():
+    """Test that merged shard states equal a single accumulator."""
+    data = np.arange(1000, dtype=float) ** 1.5
+    left = RunningStats().update(data[:300])
+    right = RunningStats().update(data[300:])
+    merged = left.merge(right).to_dict()
+    expected = RunningStats().update(data).to_dict()
+    
+    assert merged == pytest.approx(expected)
+
+def test_running_stats_subtract():
+    """Test that subtracting a shard restores the remaining statistics."""
+    data = np.arange(1000, dtype=float) ** 1.5
+    running = RunningStats().update(data).subtract(RunningStats().update(data[700:]))
+    expected = RunningStats().update(data[:700])
+    
+    assert running.count == 700
+    assert running.mean == pytest.approx(expected.mean)
+    assert running.variance == pytest.approx(expected.variance)
+    with pytest.raises(ValueError):
+        running.subtract(RunningStats().update(data))
+
+def test_running_stats_update_repeated():
+    """Test folding in repeated values without materializing them."""
+    running = RunningStats().update([1.0, 5.0]).update_repeated(3.0, 4)
+    expected = RunningStats().update([1.0, 5.0, 3.0, 3.0, 3.0, 3.0])
+    assert running.to_dict() == pytest.approx(expected.to_dict())
+
+def test_running_stats_skips_nan():
+    """Test that NaN values are ignored by default."""
+    stats = RunningStats().update([1.0, np.nan, 3.0]).to_dict()
+    assert stats['count'] == 2
+    assert stats['mean'] == 2.0
+
+def test_running_stats_empty():
+    """Test statistics of an empty accumulator."""
+    with pytest.raises(ValueError):
+        RunningStats().update([]).to_dict()
+
+def test_calculate_streaming_stats():
+    """Test statistics over a generator of batches."""
+    batches = (np.full(10, value) for value in range(5))
+    stats = calculate_streaming_stats(batches)
+    assert stats['count'] == 50
+    assert stats['mean'] == 2.0
+    assert stats['variance'] == pytest.approx(2.0)
+def test_calculate_percentiles_approximate():
+    """Test approximate percentiles against the exact ones."""
+    data = np.random.default_rng(0).normal(0, 1, 100_000)
+    exact = calculate_percentiles(data, [10, 50, 90])
+    approx = calculate_percentiles(data, [10, 50, 90], approximate=True)
+    assert approx == pytest.approx(exact, abs=0.1)
+
+def test_calculate_percentiles_from_sketch():
+    """Test percentiles read from a merged sketch."""
+    sketch = KLLSketch().update(range(50)).merge(KLLSketch().update(range(50, 101)))
+    result = calculate_percentiles(sketch, [0, 100])
+    assert result == {'p0': 0.0, 'p100': 100.0}
+
+def test_detect_outliers_approximate(outlier_data):
+    """Test outlier detection with sketch-based bounds."""
+    assert detect_outliers(outlier_data, approximate=True) == [100.0]
+
+def test_calculate_iqr_bounds(sample_data):
+    """Test IQR bound calculation."""
+    assert calculate_iqr_bounds(sample_data) == (-1.0, 7.0)
+@pytest.mark.parametrize("return_type,expected", [
+    ('list', [100.0]),
+    ('array', np.array([100])),
+    ('indices', np.array([7])),
+    ('mask', np.array([False] * 7 + [True])),
+])
+def test_detect_outliers_return_types(outlier_data, return_type, expected):
+    """Test every outlier result format."""
+    result = detect_outliers(outlier_data, return_type=return_type)
+    np.testing.assert_array_equal(result, expected)
+
+def test_detect_outliers_invalid_return_type(outlier_data):
+    """Test outlier detection with an unknown result format."""
+    with pytest.raises(ValueError):
+        detect_outliers(outlier_data, return_type='set')
+
+def test_detect_outliers_2d(outlier_data):
+    """Test per-column bounds on a 2-D array."""
+    data = np.column_stack([outlier_data, outlier_data[::-1]])
+    result = detect_outliers(data, return_type='indices')
+    np.testing.assert_array_equal(result[0], [7])
+    np.testing.assert_array_equal(result[1], [0])
+    assert detect_outliers(data, return_type='mask').shape == data.shape
+
+def test_detect_outliers_dataframe(outlier_data):
+    """Test per-column bounds on a DataFrame with missing values."""
+    df = pd.DataFrame({
+        'a': outlier_data,
+        'b': [1.0, 2.0, None, 2.0, 1.0, 2.0, -50.0, 1.0],
+        'label': list('abcdefgh')
+    })
+    assert detect_outliers(df) == {'a': [100.0], 'b': [-50.0]}
+    mask = detect_outliers(df, return_type='mask')
+    assert list(mask.columns) == ['a', 'b']
+    assert mask.values.sum() == 2
+
+@pytest.fixture
+def npy_file(tmp_path):
+    rng = np.random.default_rng(0)
+    values = np.round(rng.normal(0, 10, 5000), 1)
+    values[[3, 70]] = [500.0, -400.0]
+    path = tmp_path / 'values.npy'
+    np.save(path, values)
+    return path, values
+
+def test_as_array_avoids_copies(npy_file):
+    """Test that arrays, memmaps and buffers are used without copying."""
+    path, values = npy_file
+    assert as_array(values) is values
+    assert isinstance(as_array(path), np.memmap)
+    assert np.shares_memory(as_array(pd.Series(values, copy=False)), values)
+    buffer = array.array('d', [1.0, 2.0, 3.0])
+    view = as_array(buffer)
+    buffer[0] = 7.0
+    assert view[0] == 7.0
+
+def test_stats_on_npy_path(npy_file):
+    """Test statistics computed from a memory-mapped .npy file."""
+    path, values = npy_file
+    result = calculate_basic_stats(str(path))
+    assert result['mean'] == pytest.approx(values.mean())
+    assert result['median'] == np.median(values)
+    assert detect_outliers(path) == detect_outliers(values)
+
+def test_stats_on_buffer():
+    """Test statistics computed from buffer-protocol objects."""
+    data = array.array('i', [1, 2, 3, 4, 5])
+    assert calculate_basic_stats(data)['mean'] == 3.0
+    assert calculate_percentiles(memoryview(data), [50]) == {'p50': 3.0}
+
+def test_blockwise_matches_numpy(npy_file, monkeypatch):
+    """Test that the block-wise paths for large inputs match NumPy."""
+    path, values = npy_file
+    expected = detect_outliers(values, return_type='indices')
+    monkeypatch.setattr(stats, 'BLOCK_SIZE', 256)
+    monkeypatch.setattr(stats, 'SELECT_BINS', 16)
+    
+    percentiles = [0, 1, 25, 50, 75, 99.9, 100]
+    result = calculate_percentiles(path, percentiles)
+    np.testing.assert_allclose(list(result.values()),
+                               np.percentile(values, percentiles))
+    assert calculate_basic_stats(path)['median'] == np.median(values)
+    np.testing.assert_array_equal(detect_outliers(path, return_type='indices'),
+                                  expected)
+    assert detect_outliers(path) == values[expected].tolist()
+    noise = np.random.default_rng(1).normal(size=len(values))
+    assert calculate_correlation(path, values + noise) == pytest.approx(
+        np.corrcoef(values, values + noise)[0, 1])
+
+def test_blockwise_percentiles_with_ties(monkeypatch):
+    """Test exact block-wise selection on heavily duplicated values."""
+    monkeypatch.setattr(stats, 'BLOCK_SIZE', 64)
+    data = np.repeat([1.0, 2.0, 2.0, 5.0, 1e9], 200)
+    percentiles = [10, 33.3, 50, 80, 95]
+    result = calculate_percentiles(data, percentiles)
+    np.testing.assert_allclose(list(result.values()),
+                               np.percentile(data, percentiles))
+
+def test_blockwise_percentiles_nan(monkeypatch):
+    """Test that NaN input yields NaN percentiles like NumPy."""
+    monkeypatch.setattr(stats, 'BLOCK_SIZE', 16)
+    data = np.arange(100.0)
+    data[5] = np.nan
+    assert np.isnan(calculate_percentiles(data, [50])['p50'])
+
+def test_blockwise_percentiles_inf(monkeypatch):
+    """Test that infinite values keep the finite percentiles exact."""
+    monkeypatch.setattr(stats, 'BLOCK_SIZE', 16)
+    monkeypatch.setattr(stats, 'SELECT_BINS', 4)
+    data = np.random.default_rng(0).normal(size=200)
+    data[[3, 50, 120]] = [np.inf, -np.inf, np.inf]
+    percentiles = [0, 1, 25, 50, 75, 99.5, 100]
+    result = list(calculate_percentiles(data, percentiles).values())
+    assert result[0] == -np.inf and result[5:] == [np.inf, np.inf]
+    np.testing.assert_allclose(result[1:5], np.percentile(data, percentiles[1:5]))
+    assert calculate_basic_stats(data)['median'] == np.median(data)
+
+def test_calculate_grouped_stats_matches_flat():
+    """Test that every group matches the flat statistics of its values."""
+    rng = np.random.default_rng(0)
+    values = rng.normal(0, 10, 2000)
+    keys = pd.Series(rng.choice(['north', 'south', 'east', 'west', 'solo'], 2000),
+                     name='region')
+    keys[keys == 'solo'] = ['solo'] + ['east'] * ((keys == 'solo').sum() - 1)
+    result = calculate_grouped_stats(values, keys, percentiles=[10, 90])
+    
+    assert list(result.index) == ['east', 'north', 'solo', 'south', 'west']
+    assert result.index.name == 'region'
+    for key, row in result.iterrows():
+        group = values[(keys == key).to_numpy()]
+        expected = calculate_basic_stats(group)
+        expected.update(calculate_percentiles(group, [10, 90]))
+        for name, value in expected.items():
+            assert row[name] == pytest.approx(value)
+
+def test_calculate_grouped_stats_many_groups():
+    """Test against a pandas groupby with one group per few rows."""
+    rng = np.random.default_rng(1)
+    keys = rng.integers(0, 200_000, 1_000_000)
+    values = rng.integers(0, 100, 1_000_000)
+    result = calculate_grouped_stats(values, keys, percentiles=[75])
+    grouped = pd.Series(values, dtype=float).groupby(keys)
+    
+    np.testing.assert_allclose(result['median'], grouped.median())
+    np.testing.assert_allclose(result['p75'], grouped.quantile(0.75))
+    np.testing.assert_allclose(result['std'], grouped.std(ddof=0), atol=1e-9)
+    np.testing.assert_array_equal(result['count'], grouped.size())
+
+def test_calculate_grouped_stats_missing_values():
+    """Test NaN values and missing keys."""
+    result = calculate_grouped_stats([1.0, np.nan, 3.0, 4.0, 5.0],
+                                     np.array(['a', 'a', 'b', 'b', None], dtype=object))
+    assert list(result.index) == ['a', 'b']
+    assert result.loc['a', 'count'] == 2
+    assert result.loc['a'].drop('count').isna().all()
+    assert result.loc['b', 'median'] == 3.5
+
+def test_calculate_grouped_stats_invalid():
+    """Test input validation of grouped statistics."""
+    with pytest.raises(ValueError):
+        calculate_grouped_stats([1, 2], [1])
+    with pytest.raises(ValueError):
+        calculate_grouped_stats([], [])
+    with pytest.raises(ValueError):
+        calculate_grouped_stats([1, 2], [1, 1], percentiles=[101])
+
+@pytest.fixture
+def features():
+    """Create correlated features with scattered missing values."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(3000, 5)), columns=list('abcde'))
+    df['b'] += df['a']
+    df['c'] = df['a'] ** 3
+    df.loc[rng.choice(3000, 300, replace=False), 'a'] = np.nan
+    df.loc[rng.choice(3000, 500, replace=False), 'd'] = np.nan
+    df['label'] = 'x'
+    return df
+
+@pytest.mark.parametrize("method", ['pearson', 'spearman'])
+def test_calculate_correlation_matrix_matches_pandas(features, monkeypatch, method):
+    """Test pairwise-complete correlations in one and in many row blocks."""
+    numeric = features.drop(columns='label')
+    complete = numeric.dropna()
+    for block_size in (stats.BLOCK_SIZE, 50):
+        monkeypatch.setattr(stats, 'BLOCK_SIZE', block_size)
+        result = calculate_correlation_matrix(complete, method)
+        pd.testing.assert_frame_equal(result, complete.corr(method), atol=1e-12)
+        if method == 'pearson':
+            result = calculate_correlation_matrix(features)
+            pd.testing.assert_frame_equal(result, numeric.corr(), atol=1e-12)
+
+def test_calculate_correlation_matrix_array(features):
+    """Test 2-D arrays and NaN propagation without pairwise deletion."""
+    values = features.drop(columns='label').to_numpy()
+    result = calculate_correlation_matrix(values, pairwise=False)
+    assert list(result.columns) == [0, 1, 2, 3, 4]
+    assert result[0].isna().all() and result[3].isna().all()
+    assert result.loc[1, 2] == pytest.approx(
+        calculate_correlation(values[:, 1], values[:, 2])
+    )
+    complete = values[~np.isnan(values).any(axis=1)]
+    pd.testing.assert_frame_equal(
+        calculate_correlation_matrix(complete, 'spearman'),
+        pd.DataFrame(complete).corr('spearman'), atol=1e-12
+    )
+    with pytest.raises(ValueError):
+        calculate_correlation_matrix(values[:, 0])
+    with pytest.raises(ValueError):
+        calculate_correlation_matrix(values, method='kendall')
\ No newline at end of file